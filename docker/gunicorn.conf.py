@@ -0,0 +1,10 @@
+# Gunicorn settings for the X728 dashboard (loaded automatically from the working directory, /app)
+#
+# presto_x728_sysmon no longer starts hardware/monitoring at import time; the worker does it
+# once here, after the app is loaded. Keep a single worker: each worker would claim the
+# I2C bus and GPIO lines and run its own monitor loop (and Socket.IO needs sticky sessions).
+
+def post_worker_init(worker):
+    """Bring up I2C/GPIO, MQTT and the monitor thread in the (single) worker"""
+    from presto_x728_sysmon import initialize_core_services
+    initialize_core_services()
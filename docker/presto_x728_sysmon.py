@@ -70,6 +70,13 @@ https://github.com/piklz/pi_ups_monitors
 # IMPORTS
 # ============================================================================
 
+# Direct execution serves with gevent's WSGI server (non-blocking, like the Docker image's
+# gunicorn gevent worker) instead of Werkzeug's development server. Sockets and threads
+# must be patched before anything below imports them; Gunicorn patches its own workers.
+if __name__ == '__main__':
+    from gevent import monkey
+    monkey.patch_all()
+
 import socket
 import sys
 import os
@@ -79,11 +86,20 @@ import struct
 import json
 import threading
 import secrets
+import atexit
+import bisect
+import re
+import gzip
+import hashlib
 import paho.mqtt.client as mqtt
 from datetime import datetime, timedelta
-from functools import wraps
-from flask import Flask, render_template_string, jsonify, request, flash, redirect, url_for
-from flask_socketio import SocketIO
+from functools import wraps, lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask, render_template, jsonify, request, flash, redirect, url_for, make_response
+from flask_socketio import SocketIO, emit
+from markupsafe import Markup, escape
+from jinja2 import ChoiceLoader, DictLoader, FileSystemBytecodeCache
+from jinja2.utils import htmlsafe_json_dumps
 import smbus2 as smbus
 import gpiod
 import requests
@@ -149,6 +165,7 @@ VERSION_BUILD = get_execution_mode()
 # ----------------------------------------------------------------------
 MAX_LOG_LINES = 200
 _ui_log_buffer = deque(maxlen=MAX_LOG_LINES)
+_log_total = 0  # Lines ever appended; clients use it as a cursor to fetch only what's new
 _log_lock = threading.Lock()
 
 
@@ -158,7 +175,8 @@ GITHUB_REPO = "piklz/pi_ups_monitors"
 CURRENT_VERSION = VERSION_NUMBER 
 LATEST_VERSION_INFO = {
     "latest": CURRENT_VERSION,
-    "last_check": 0,
+    "last_check": 0,          # Wall-clock time of the last check (for display)
+    "last_check_mono": None,  # time.monotonic() of the last check (for interval gating)
     "update_available": False
 }
 
@@ -171,6 +189,10 @@ LATEST_VERSION_INFO = {
 # Check every 12 hours (43200 seconds) to stay well under the 60/hour limit
 # Check every 24 hours (86400 seconds) for maximum safety
 VERSION_CHECK_INTERVAL = 86400
+
+# Background GitHub check (single worker so overlapping calls never double-fetch)
+_VERSION_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ver")
+_pending_version_check = None
 # -------------------------------------
 
 
@@ -216,15 +238,250 @@ app.secret_key = os.environ.get(
 )
 app.config['SESSION_TYPE'] = 'null'
 app.config['SESSION_PERMANENT'] = False
+# Templates are compiled once and never change at runtime - skip Jinja's per-render staleness checks
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
 
 socketio = SocketIO(
     app, 
     cors_allowed_origins="*", 
     manage_session=False, 
     transports=['websocket', 'polling'],
-    async_mode='threading'
+    # Under Gunicorn the gevent worker runs the app in 'threading' mode; direct execution uses
+    # gevent's own server. Both serve WebSockets through simple-websocket, which negotiates
+    # permessage-deflate, so log/status frames are compressed on the wire (gevent-websocket,
+    # which engineio would prefer if installed, does not support compression)
+    async_mode='gevent' if __name__ == '__main__' else 'threading',
+    # Telemetry is mostly floats - MessagePack frames are smaller and cheaper to decode than JSON text.
+    # The dashboard loads the matching socket.io.msgpack client build.
+    serializer='msgpack'
 )
 
+# --- Static assets: content-hashed URLs, so browsers may cache them for a year ---
+STATIC_MAX_AGE = 365 * 24 * 3600
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = STATIC_MAX_AGE
+
+@lru_cache(maxsize=None)
+def static_url(filename):
+    """URL of a file in static/ with a content-hash query string (changes whenever the file does)"""
+    try:
+        with open(os.path.join(app.static_folder, filename), 'rb') as f:
+            digest = hashlib.blake2b(f.read(), digest_size=8).hexdigest()
+    except OSError:
+        return f"{app.static_url_path}/{filename}"
+    return f"{app.static_url_path}/{filename}?v={digest}"
+
+app.jinja_env.globals['static_url'] = static_url
+
+@app.after_request
+def immutable_static(response):
+    """Content-hashed static URLs never change, so browsers needn't revalidate them"""
+    if request.endpoint == 'static' and request.args.get('v') and response.status_code == 200:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    return response
+
+# --- Response compression (gzip only; brotli is not a dependency) ---
+GZIP_MIN_SIZE = 1024  # Bytes; smaller bodies aren't worth the CPU
+GZIP_LEVEL = 6        # Good ratio without burning Pi CPU on every page load
+_GZIP_MIMETYPES = ('text/html', 'text/css', 'text/javascript', 'application/javascript', 'application/json', 'image/svg+xml')
+
+@lru_cache(maxsize=32)
+def _gzip_static_file(path, mtime):
+    """Gzip a static file once at maximum compression (cached per file version)"""
+    with open(path, 'rb') as f:
+        return gzip.compress(f.read(), compresslevel=9)
+
+@app.after_request
+def gzip_response(response):
+    """Gzip text responses for clients that accept it"""
+    if (response.status_code < 200 or response.status_code >= 300
+            or 'Content-Encoding' in response.headers
+            or response.mimetype not in _GZIP_MIMETYPES
+            or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+        return response
+    if response.direct_passthrough:
+        # Static files are streamed from disk; serve a compressed copy made once per file version
+        if request.endpoint != 'static' or response.status_code != 200:
+            return response
+        path = os.path.join(app.static_folder, request.view_args['filename'])
+        try:
+            body = _gzip_static_file(path, os.stat(path).st_mtime)
+        except OSError:
+            return response
+        response.response.close()
+        response.direct_passthrough = False
+        response.set_data(body)
+    else:
+        body = response.get_data()
+        if len(body) < GZIP_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)  # Same content, different bytes than the identity encoding
+    return response
+
+# Registered after gzip_response so it runs first (Flask runs after_request hooks in reverse):
+# the ETag covers the uncompressed body and a 304 skips compression entirely
+@app.after_request
+def conditional_response(response):
+    """Tag GET responses with a content ETag and answer matching revalidations with 304"""
+    if (request.method != 'GET' or response.status_code != 200
+            or response.direct_passthrough or response.is_streamed):
+        return response
+    response.add_etag()
+    return response.make_conditional(request)
+
+# --- Connected dashboard clients (status emits are skipped when nobody is listening) ---
+_socket_clients = 0
+_socket_clients_lock = threading.Lock()
+
+@socketio.on('connect')
+def _on_socket_connect():
+    global _socket_clients, _status_resync
+    with _socket_clients_lock:
+        _socket_clients += 1
+    _status_resync = True  # Keep the broadcast baseline in step with what the new client holds
+    # A page served from cache (304) carries old readings - don't make it wait for the next tick
+    try:
+        emit('status_update', current_status(), to=request.sid)
+    except Exception as e:
+        log_message(f"Initial status emit failed: {e}", "DEBUG")
+
+@socketio.on('disconnect')
+def _on_socket_disconnect():
+    global _socket_clients
+    with _socket_clients_lock:
+        _socket_clients = max(0, _socket_clients - 1)
+
+def has_socket_clients():
+    """True if at least one browser is connected over Socket.IO"""
+    return _socket_clients > 0
+
+# --- Socket.IO emit batching: a burst of events goes out as one 'ui_batch' frame ---
+EMIT_BATCH_WINDOW = 0.05           # seconds of quiet that ends a burst
+EMIT_BATCH_MAX_DELAY = 0.1         # seconds the first queued event may be held back at most
+EMIT_BATCH_MAX_BYTES = 64 * 1024   # queued log text that forces an immediate flush
+# Cap on queued log/delta events should the flusher stall (e.g. a blocked emit): the oldest of
+# those are dropped - dashboards refetch logs when the line count jumps and a dropped delta forces
+# the next status out in full. Control events (status_update, flash_message, cancel_update, ...)
+# are never dropped.
+EMIT_QUEUE_MAX = 1000
+EMIT_DROPPABLE_EVENTS = frozenset(('log_append', 'status_delta'))
+_emit_queue = deque()  # [event, data, size] in emit order
+_emit_queue_bytes = 0
+_emit_droppable = 0    # log_append/status_delta entries currently queued
+_emit_queue_lock = threading.Lock()
+_emit_wake = threading.Event()
+_emit_flusher = None
+_emit_flusher_lock = threading.Lock()
+
+def _drop_oldest_droppable():
+    """Evict the oldest log_append/status_delta entry; caller holds _emit_queue_lock"""
+    global _emit_queue_bytes, _emit_droppable, _status_resync
+    for entry in _emit_queue:
+        if entry[0] in EMIT_DROPPABLE_EVENTS:
+            _emit_queue.remove(entry)
+            _emit_queue_bytes -= entry[2]
+            _emit_droppable -= 1
+            if entry[0] == 'status_delta':
+                _status_resync = True  # Clients missed a change - send the next status in full
+            return
+
+def queue_emit(event, data, size=0):
+    """Queue a broadcast Socket.IO event; the client fans 'ui_batch' back out to the normal handlers"""
+    global _emit_flusher, _emit_queue_bytes, _emit_droppable
+    with _emit_queue_lock:
+        if event in EMIT_DROPPABLE_EVENTS:
+            if _emit_droppable >= EMIT_QUEUE_MAX:
+                _drop_oldest_droppable()
+            _emit_droppable += 1
+        _emit_queue.append([event, data, size])
+        _emit_queue_bytes += size
+    if _emit_flusher is None:
+        with _emit_flusher_lock:
+            if _emit_flusher is None:
+                _emit_flusher = threading.Thread(target=_emit_flusher_func, daemon=True)
+                _emit_flusher.start()
+    _emit_wake.set()
+
+def _emit_flusher_func():
+    """Sleep until something is queued, let the burst pile up, then send everything in one frame"""
+    global _emit_queue_bytes, _emit_droppable
+    while True:
+        _emit_wake.wait()
+        first = time.monotonic()
+        # Debounce: flush once the burst goes quiet, but never hold the first event past
+        # EMIT_BATCH_MAX_DELAY or let more than EMIT_BATCH_MAX_BYTES of log text queue up
+        while _emit_queue_bytes < EMIT_BATCH_MAX_BYTES:
+            _emit_wake.clear()
+            remaining = EMIT_BATCH_MAX_DELAY - (time.monotonic() - first)
+            if remaining <= 0 or not _emit_wake.wait(min(EMIT_BATCH_WINDOW, remaining)):
+                break
+        _emit_wake.clear()
+        with _emit_queue_lock:
+            pending = list(_emit_queue)
+            _emit_queue.clear()
+            _emit_queue_bytes = 0
+            _emit_droppable = 0
+        batch = []
+        for event, data, _size in pending:
+            if event == 'log_append' and batch and batch[-1][0] == 'log_append':
+                # Consecutive log lines travel as one entry
+                batch[-1][1]['lines'].extend(data['lines'])
+                batch[-1][1]['total'] = data['total']
+            else:
+                batch.append([event, data])
+        if batch:
+            try:
+                socketio.emit('ui_batch', batch)
+            except Exception as e:
+                # Not log_message(): that would queue a log_append and fail again on the next flush
+                logger.warning(f"Socket.IO batch emit failed: {e}")
+
+# --- Status deltas: after one full 'status_update', only changed fields go out as 'status_delta' ---
+_last_status_sent = None
+_status_resync = True
+STATUS_KEYFRAME_INTERVAL = 30  # Seconds between full 'status_update' resyncs, even when deltas would do
+_last_status_keyframe = 0.0
+
+def json_merge_diff(prev, curr):
+    """Return a JSON Merge Patch (RFC 7386) turning prev into curr (removed keys map to None)"""
+    patch = {}
+    for key, value in curr.items():
+        old = prev.get(key)
+        if isinstance(value, dict) and isinstance(old, dict):
+            sub = json_merge_diff(old, value)
+            if sub:
+                patch[key] = sub
+        elif key not in prev or old != value:
+            patch[key] = value
+    for key in prev:
+        if key not in curr:
+            patch[key] = None
+    return patch
+
+def emit_status(status):
+    """Send the status to dashboards: in full after a (re)connect and every STATUS_KEYFRAME_INTERVAL,
+    otherwise only what changed"""
+    global _last_status_sent, _status_resync, _last_status_keyframe
+    # Copy the shared version-info dict so later mutations don't leak into the baseline
+    snapshot = dict(status, latest_version_info=dict(status.get('latest_version_info') or {}))
+    now = time.monotonic()
+    if _status_resync or _last_status_sent is None or now - _last_status_keyframe >= STATUS_KEYFRAME_INTERVAL:
+        _status_resync = False
+        _last_status_keyframe = now
+        queue_emit('status_update', snapshot)
+    else:
+        delta = json_merge_diff(_last_status_sent, snapshot)
+        if not delta:
+            return
+        queue_emit('status_delta', delta)
+    _last_status_sent = snapshot
+
 
 
 
@@ -244,6 +501,7 @@ LAST_TIME_SOURCE = "UNKNOWN"   # Tracks the source used in the previous check
 LAST_NETWORK_DROP_TIME = None  # Stores the time.time() timestamp of the last confirmed network drop
 #for config changes live updates rechecks load_config()
 LAST_CONFIG_MTIME = 0
+CONFIG_CHECK_INTERVAL = 30     # Seconds between config file mtime checks in the monitor loop
 
 # X728 GPIO Pins (BCM numbering) - Initial Definition
 GPIO_PLD_PIN = 6          # Power Loss Detection - Constant
@@ -273,6 +531,7 @@ current_i2c_addr = None
 hardware_error = None
 monitor_thread_running = False
 monitor_thread_stop_event = threading.Event()
+config_reload_event = threading.Event()  # Set on config save to wake the monitor thread early
 lock = threading.Lock()
 previous_power_state = None 
 
@@ -283,9 +542,18 @@ shutdown_line = None
 gpio_error = None
 
 
-# Battery history (last 100 readings)
-battery_history = []
+# Battery history (last 100 readings) - fixed-size ring buffer, oldest entries drop off
 MAX_HISTORY = 100
+battery_history = deque(maxlen=MAX_HISTORY)
+HISTORY_SAVE_EVERY = 10          # Entries added before a save is considered
+HISTORY_SAVE_MIN_INTERVAL = 60   # Minimum seconds between history writes (SD card wear)
+_history_dirty = 0
+_history_last_save = 0.0
+
+# Exponentially weighted moving averages of history readings (used for time estimates)
+EWMA_ALPHA = 0.25
+ewma_battery = None
+ewma_voltage = None
 
 # Alert debouncing
 last_alerts = {
@@ -296,6 +564,9 @@ last_alerts = {
 }
 ALERT_COOLDOWN = 300  # 5 minutes
 
+# ntfy endpoint, rebuilt whenever the config is (re)loaded or saved
+_NTFY_URL = None
+
 
 # --- Dynamic Path Definition for Docker and Local Execution ---
 
@@ -317,6 +588,9 @@ HISTORY_PATH = os.path.join(CONFIG_DIR, 'x728_history.json')
 #  Define the final file paths using the determined base directory.
 CONFIG_PATH  = os.path.join(CONFIG_DIR, 'x728_config.json')
 HISTORY_PATH = os.path.join(CONFIG_DIR, 'x728_history.json')
+OVERLAY_CACHE_PATH = os.path.join(CONFIG_DIR, 'x728_overlay_cache.json')  # Last validated config.txt mtime
+HW_CACHE_PATH = os.path.join(CONFIG_DIR, 'x728_hw_cache.json')            # Last detected X728 I2C address
+JINJA_CACHE_DIR = os.path.join(CONFIG_DIR, 'jinja_cache')                  # Compiled dashboard template bytecode
 
 # Disk path - for direct run, use '/'; for Docker, '/host' if mounted
 DISK_PATH = '/' if not os.path.exists('/.dockerenv') else '/host'
@@ -736,6 +1010,8 @@ def get_current_time_str(include_source=False):
 
 # Global MQTT Client instance
 mqtt_client = None
+MQTT_STATE_HEARTBEAT = 60  # Republish an unchanged full state at least this often (seconds)
+_last_mqtt_state = None    # (snapshot, monotonic ts) of the last published full state
 
 def init_mqtt():
     """Initializes the MQTT client with a unique ID and attempts to connect to the broker."""
@@ -807,6 +1083,27 @@ def publish_mqtt_data(topic_suffix, payload, retain=False):
             log_message(f"Published to {full_topic}: {payload}", "DEBUG")
         except Exception as e:
             log_message(f"Error publishing MQTT data: {e}", "WARNING")
+
+def mqtt_connected():
+    """True if the MQTT client exists and is currently connected to the broker"""
+    return mqtt_client is not None and mqtt_client.is_connected()
+
+def publish_mqtt_state(status):
+    """Publish the full JSON state, skipping serialization when nothing changed since the last publish"""
+    global _last_mqtt_state
+    # Snapshot nested dicts that are shared/mutated elsewhere so the comparison is meaningful;
+    # uptime ticks every second, so it is left out (the heartbeat keeps it reasonably fresh)
+    system_info = dict(status.get('system_info') or {})
+    system_info.pop('uptime', None)
+    snapshot = dict(status, system_info=system_info,
+                    latest_version_info=dict(status.get('latest_version_info') or {}))
+    now = time.monotonic()
+    if _last_mqtt_state is not None:
+        last_snapshot, last_ts = _last_mqtt_state
+        if snapshot == last_snapshot and now - last_ts < MQTT_STATE_HEARTBEAT:
+            return
+    publish_mqtt_data("state", json.dumps(status))
+    _last_mqtt_state = (snapshot, now)
             
 
 def get_network_info():
@@ -877,6 +1174,25 @@ def get_network_info():
 
 
 
+# Network info is probed by the monitor thread only; readers use the cached tuple
+NETWORK_REFRESH_INTERVAL = 30  # seconds
+_network_cache = ("Unknown", "disconnected")
+_network_cache_ts = None
+
+def refresh_network_info(force=False):
+    """Re-probe network info if the cached value is older than NETWORK_REFRESH_INTERVAL"""
+    global _network_cache, _network_cache_ts
+    now = time.monotonic()
+    if not force and _network_cache_ts is not None and now - _network_cache_ts < NETWORK_REFRESH_INTERVAL:
+        return
+    try:
+        _network_cache = get_network_info()
+    except Exception as e:
+        log_message(f"Network info error: {e}", "WARNING")
+        _network_cache = ("Unknown", "disconnected")
+    _network_cache_ts = now
+
+
 # Define the constants for the user/group defined in the Dockerfile       
 
 APPUSER_UID = 1000  # appuser UID
@@ -990,8 +1306,15 @@ def log_message(message, level="INFO", bypass_rtc_check=False, show_time_source=
     getattr(logger, lvl.lower(), logger.info)(line)
 
     # 2. UI buffer (thread-safe)
+    global _log_total
     with _log_lock:
-        _ui_log_buffer.append(line)             
+        _ui_log_buffer.append(line)
+        _log_total += 1
+        total = _log_total
+
+    # 3. Live log panel: push the new line instead of having dashboards poll for it
+    if has_socket_clients():
+        queue_emit('log_append', {'lines': [line], 'total': total}, len(line))
 
 def load_config():
     """Load configuration from JSON file"""
@@ -1030,6 +1353,8 @@ def load_config():
             else:
                  LOG_LEVEL = env_log_level
                  
+        refresh_ntfy_target()
+                 
         # Only update the timestamp if the file was successfully read
         if os.path.exists(CONFIG_PATH):
             LAST_CONFIG_MTIME = os.path.getmtime(CONFIG_PATH)         
@@ -1038,6 +1363,13 @@ def load_config():
     except Exception as e:
         log_message(f"Failed to load config: {e}. Using defaults.", "ERROR")
 
+def refresh_ntfy_target():
+    """Precompute the ntfy URL from the current config (None if not configured)"""
+    global _NTFY_URL
+    server = config.get('ntfy_server')
+    topic = config.get('ntfy_topic')
+    _NTFY_URL = f"{server}/{topic}" if server and topic else None
+
 def save_config():
     """Save configuration to JSON file"""
     global config
@@ -1046,6 +1378,7 @@ def save_config():
         with open(CONFIG_PATH, 'w') as f:
             json.dump(config, f, indent=4)
         log_message("Configuration saved successfully")
+        config_reload_event.set()  # Wake the monitor so the new settings apply immediately
     except Exception as e:
         log_message(f"Failed to save config: {e}", "ERROR")
         raise
@@ -1069,65 +1402,145 @@ log_message(f"Mode emoji set to: {CURRENT_EMOJI}", "DEBUG")
 
 
 
+def update_ewma(battery_level, voltage):
+    """Fold one reading into the battery/voltage EWMAs: S_t = a*Y_t + (1-a)*S_(t-1)"""
+    global ewma_battery, ewma_voltage
+    if ewma_battery is None:
+        ewma_battery, ewma_voltage = battery_level, voltage
+    else:
+        ewma_battery = EWMA_ALPHA * battery_level + (1 - EWMA_ALPHA) * ewma_battery
+        ewma_voltage = EWMA_ALPHA * voltage + (1 - EWMA_ALPHA) * ewma_voltage
+
 def load_battery_history():
     """Load battery history from file"""
     global battery_history
     try:
-        if os.path.exists(HISTORY_PATH):
-            with open(HISTORY_PATH, 'r') as f:
-                battery_history = json.load(f)
-                if len(battery_history) > MAX_HISTORY:
-                    battery_history = battery_history[-MAX_HISTORY:]
+        if not os.path.exists(HISTORY_PATH):
+            return
+        with open(HISTORY_PATH, 'r') as f:
+            saved = json.load(f)
+        if not isinstance(saved, list):
+            raise ValueError("expected a JSON list of readings")
     except Exception as e:
         log_message(f"Failed to load battery history: {e}", "WARNING")
-        battery_history = []
+        battery_history = deque(maxlen=MAX_HISTORY)
+        return
+    # Seed the moving averages from the saved readings, and backfill the chart label
+    # for entries saved before 'time_hm' existed; a malformed entry is dropped on its own
+    battery_history = deque(maxlen=MAX_HISTORY)
+    skipped = 0
+    for entry in saved[-MAX_HISTORY:]:
+        try:
+            update_ewma(float(entry['battery']), float(entry['voltage']))
+        except Exception:
+            skipped += 1
+            continue
+        if 'time_hm' not in entry:
+            try:
+                entry['time_hm'] = datetime.fromisoformat(entry['timestamp']).strftime('%H:%M')
+            except Exception:
+                entry['time_hm'] = ""
+        battery_history.append(entry)
+    if skipped:
+        log_message(f"Skipped {skipped} malformed battery history entries", "WARNING")
 
 def save_battery_history():
     """Save battery history to file"""
-    global battery_history
+    global battery_history, _history_dirty, _history_last_save
     try:
         os.makedirs(os.path.dirname(HISTORY_PATH) if HISTORY_PATH != '/config/battery_history.json' else '.', exist_ok=True)
         with open(HISTORY_PATH, 'w') as f:
-            json.dump(battery_history[-MAX_HISTORY:], f)
+            json.dump(list(battery_history), f)
+        _history_dirty = 0
+        _history_last_save = time.monotonic()
     except Exception as e:
         log_message(f"Failed to save battery history: {e}", "WARNING")
 
+
+def _flush_battery_history():
+    """Write any unsaved history entries on interpreter exit"""
+    if _history_dirty:
+        save_battery_history()
+
+atexit.register(_flush_battery_history)
+
 def add_to_history(battery_level, voltage, power_state):
     """Add reading to battery history"""
-    global battery_history
+    global _history_dirty
+    now = datetime.now()
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now.isoformat(),
+        "time_hm": now.strftime('%H:%M'),  # Precomputed chart label
         "battery": battery_level,
         "voltage": voltage,
         "state": power_state
     }
-    battery_history.append(entry)
-    if len(battery_history) > MAX_HISTORY:
-        battery_history = battery_history[-MAX_HISTORY:]
+    battery_history.append(entry)  # deque(maxlen) evicts the oldest entry, no re-slicing
+    update_ewma(battery_level, voltage)
     
-    # Save periodically (every 10 entries)
-    if len(battery_history) % 10 == 0:
+    # Save periodically (every 10 entries AND at most once per minute) to spare the SD card
+    _history_dirty += 1
+    now = time.monotonic()
+    if _history_dirty >= HISTORY_SAVE_EVERY and now - _history_last_save >= HISTORY_SAVE_MIN_INTERVAL:
         save_battery_history()
 
+# Chart seed for the dashboard, encoded once per new history entry rather than once per page load
+CHART_HISTORY_POINTS = 50
+_history_chart_key = None
+_history_chart_json = None
+
+def history_chart_json():
+    """Last CHART_HISTORY_POINTS history entries as compact, HTML-safe JSON (memoized per newest entry)"""
+    global _history_chart_key, _history_chart_json
+    entries = list(battery_history)[-CHART_HISTORY_POINTS:]  # list() snapshots the deque atomically
+    key = (len(entries), entries[-1]['timestamp'] if entries else None)
+    if key != _history_chart_key:
+        # Labels are precomputed in add_to_history
+        history_chart = [{'time': e['time_hm'], 'battery': e['battery'], 'voltage': e['voltage']} for e in entries]
+        _history_chart_json = htmlsafe_json_dumps(history_chart, separators=(',', ':'))
+        _history_chart_key = key
+    return _history_chart_json
+
+_history_frame_key = None
+_history_frame = None
+
+def history_chart_frame():
+    """Chart history for a binary Socket.IO frame: labels plus packed little-endian float32 samples
+    (all battery % values, then all voltages), memoized per newest entry"""
+    global _history_frame_key, _history_frame
+    entries = list(battery_history)[-CHART_HISTORY_POINTS:]
+    key = (len(entries), entries[-1]['timestamp'] if entries else None)
+    if key != _history_frame_key:
+        values = [e['battery'] for e in entries] + [e['voltage'] for e in entries]
+        _history_frame = {
+            'labels': [e['time_hm'] for e in entries],
+            'samples': struct.pack(f'<{len(values)}f', *values),
+        }
+        _history_frame_key = key
+    return _history_frame
+
+@socketio.on('chart_sync')
+def _on_chart_sync():
+    """Reconnected dashboards re-seed their chart from history (returned as the event's ack)"""
+    return history_chart_frame()
+
 def send_ntfy(message, priority="default", title="X728 UPS Alert"):
     """Send notification via ntfy with retry and longer timeout"""
     global config
     if not config.get('enable_ntfy', 0):
         return
     
-    server = config.get('ntfy_server')
-    topic = config.get('ntfy_topic')
-    
-    if not server or not topic:
+    url = _NTFY_URL
+    if not url:
         log_message("ntfy not configured", "WARNING")
         return
     #log_message(f"Attempting to send ntfy: {message[:100]}...", "DEBUG") #for debuging
+    payload = message.encode('utf-8')  # Encode once, not per retry
+    headers = {"Title": title, "Priority": priority, "Content-Length": str(len(payload))}
     max_retries = 3
     for attempt in range(max_retries):
         try:
-            url = f"{server}/{topic}"
-            headers = {"Title": title, "Priority": priority}
-            response = requests.post(url, data=message.encode('utf-8'), headers=headers, timeout=10)  # Increased to 10s
+            response = requests.post(url, data=payload, headers=headers, timeout=10)  # Increased to 10s
             response.raise_for_status()
             #log_message(f"ntfy sent [{priority}]: {message[:50]}...") #use :50  to truncate for debuging
             log_message(f"ntfy sent [{priority}]: {message}")
@@ -1139,6 +1552,17 @@ def send_ntfy(message, priority="default", title="X728 UPS Alert"):
             else:
                 log_message(f"ntfy failed after {max_retries} attempts: {e}", "ERROR")
 
+# Single worker keeps notifications in order while callers never wait on HTTP retries
+_NTFY_EXEC = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ntfy")
+
+def send_ntfy_async(message, priority="default", title="X728 UPS Alert"):
+    """Queue a ntfy notification on the background worker and return immediately"""
+    try:
+        _NTFY_EXEC.submit(send_ntfy, message, priority, title)
+    except RuntimeError:
+        # Executor already shut down (interpreter exiting) - send inline instead
+        send_ntfy(message, priority, title)
+
 
 
 # ============================================================================
@@ -1167,22 +1591,43 @@ def _parse_version(version_tag): #GITHUB REPO UPDATE CHECKING
 def check_latest_version(manual=False):
     """
     Checks the GitHub API for the latest release version.
-    Updates the global LATEST_VERSION_INFO, flashes messages, and sends an ntfy notification.
+    Every check runs on _VERSION_EXEC, so at most one is in flight: background checks return
+    at once, manual checks wait for the result and flash() it from the request thread.
     """
-    global LATEST_VERSION_INFO, CURRENT_VERSION, GITHUB_REPO, VERSION_CHECK_INTERVAL
+    global VERSION_CHECK_INTERVAL, _pending_version_check
 
-    now = time.time()
+    # Monotonic clock so NTP/RTC time jumps can't wedge or re-open the gates
+    last_mono = LATEST_VERSION_INFO["last_check_mono"]
+    elapsed = time.monotonic() - last_mono if last_mono is not None else None
     
     if not manual:
-        if now - LATEST_VERSION_INFO["last_check"] < VERSION_CHECK_INTERVAL:
+        if elapsed is not None and elapsed < VERSION_CHECK_INTERVAL:
             return  # Skip the check entirely if the time hasn't passed
     
     #  Rate Limit Check 
-    if manual and (now - LATEST_VERSION_INFO["last_check"] < 60):
+    if manual and elapsed is not None and elapsed < 60:
         log_message("Manual version check rate limit: skipping, last check less than 60s ago.", "WARNING")
-        showFlashMessage( "info", "Version check rate limited. Please wait 60 seconds between manual checks.")
+        flash("Version check rate limited. Please wait 60 seconds between manual checks.", "info")
+        return
+    
+    # Single-flight: never start a second fetch while one is still running - join it instead
+    if not _pending_version_check or _pending_version_check.done():
+        _pending_version_check = _VERSION_EXEC.submit(_do_version_check)
+    if not manual:
         return
     
+    _pending_version_check.result()
+    if LATEST_VERSION_INFO["last_check_mono"] == last_mono:
+        flash("Version check failed: Cannot reach GitHub API (see logs).", "error")
+    elif not LATEST_VERSION_INFO["update_available"]:
+        flash(f"You are running the latest version: {CURRENT_VERSION}", "success")
+
+
+def _do_version_check():
+    """Performs the GitHub API request and updates LATEST_VERSION_INFO."""
+    global LATEST_VERSION_INFO, CURRENT_VERSION, GITHUB_REPO
+
+    now = time.time()
     api_url = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
     log_message(f"Checking latest release from GitHub API: {api_url}", "INFO")
 
@@ -1200,6 +1645,7 @@ def check_latest_version(manual=False):
             # Update info
             LATEST_VERSION_INFO["latest"] = latest_tag
             LATEST_VERSION_INFO["last_check"] = now
+            LATEST_VERSION_INFO["last_check_mono"] = time.monotonic()
             
             if latest_ver_tuple > current_ver_tuple:
                 # --- NEW: Check if this is the first time detecting the update ---
@@ -1222,20 +1668,25 @@ def check_latest_version(manual=False):
                 log_message(f"New version available! Current: {CURRENT_VERSION}, Latest: {latest_tag}", "WARNING")
             else:
                 LATEST_VERSION_INFO["update_available"] = False
-                if manual:
-                    flash(f"You are running the latest version: {CURRENT_VERSION}", "success")
         else:
             raise ValueError("No 'tag_name' found in GitHub response.")
 
     except requests.exceptions.RequestException as e:
         log_message(f"GitHub API request failed: {e}", "ERROR")
-        if manual: flash(f"Version check failed: Cannot reach GitHub API ({e}).", "error")
     except Exception as e:
         log_message(f"Version check failed: {e}", "ERROR")
-        if manual: flash(f"Version check failed: An unexpected error occurred ({e}).", "error")
 
 
 
+def _save_overlay_cache(config_file):
+    """Remember the mtime of a validated config.txt so the next startup can skip re-reading it."""
+    try:
+        st = os.stat(config_file)
+        with open(OVERLAY_CACHE_PATH, 'w') as f:
+            json.dump({"mtime": st.st_mtime_ns, "path": config_file, "ok": True}, f)
+    except Exception as e:
+        log_message(f"Failed to save overlay cache: {e}", "DEBUG")
+
 def configure_kernel_overlay():
     """Checks and configures the gpio-poweroff overlay for safe shutdown (V1.3).
     
@@ -1269,6 +1720,17 @@ def configure_kernel_overlay():
         log_message("ERROR: Cannot find config.txt. Skipping overlay configuration.", "ERROR")
         return False
 
+    # Fast path: config.txt untouched since we last validated it -> a single stat() is enough
+    try:
+        st = os.stat(config_file)
+        with open(OVERLAY_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+        if cache.get("ok") and cache.get("path") == config_file and cache.get("mtime") == st.st_mtime_ns:
+            log_message(f"Kernel overlay previously validated and {config_file} unchanged, skipping check.", "DEBUG")
+            return True
+    except Exception:
+        pass  # No/invalid cache - fall through to the full check
+
     try:
         # 1. Read the entire file content
         with open(config_file, 'r') as f:
@@ -1326,8 +1788,10 @@ def configure_kernel_overlay():
             
             log_message("Successfully configured kernel overlay. PLEASE REBOOT NOW for safe shutdown to take effect.", "CRITICAL")
             send_ntfy("⚠️ Kernel shutdown overlay configured. REBOOT REQUIRED for safe shutdown to work!", "max", "Configuration Change")
+            _save_overlay_cache(config_file)
             return True
             
+        _save_overlay_cache(config_file)
         return True # Configuration is correct or was just fixed
 
     except Exception as e:
@@ -1339,6 +1803,27 @@ def configure_kernel_overlay():
 # HARDWARE INITIALIZATION
 # ============================================================================
 
+def _i2c_probe_order():
+    """Return I2C_ADDRS with the last detected address (if cached) probed first."""
+    try:
+        with open(HW_CACHE_PATH, 'r') as f:
+            cached = json.load(f).get("addr")
+        if cached in I2C_ADDRS:
+            return [cached] + [a for a in I2C_ADDRS if a != cached]
+    except Exception:
+        pass
+    return I2C_ADDRS
+
+def _save_i2c_addr(addr, probe_order):
+    """Persist the detected address, skipping the write when it was already the cached hit."""
+    if probe_order and probe_order[0] == addr and probe_order is not I2C_ADDRS:
+        return
+    try:
+        with open(HW_CACHE_PATH, 'w') as f:
+            json.dump({"addr": addr}, f)
+    except Exception as e:
+        log_message(f"Failed to save I2C address cache: {e}", "DEBUG")
+
 def init_i2c():
     """Initialize I2C bus and detect X728"""
     global bus, current_i2c_addr, hardware_error
@@ -1349,12 +1834,14 @@ def init_i2c():
         bus = smbus.SMBus(1)
         log_message("I2C bus 1 opened successfully")
         
-        # Detect X728 at known addresses
-        for addr in I2C_ADDRS:
+        # Detect X728 at known addresses (cached address first)
+        probe_order = _i2c_probe_order()
+        for addr in probe_order:
             try:
                 bus.read_i2c_block_data(addr, 0x04, 2)
                 current_i2c_addr = addr
                 log_message(f"X728 UPS detected at I2C address 0x{addr:02x}")
+                _save_i2c_addr(addr, probe_order)
                 hardware_error = None
                 return True
             except Exception:
@@ -1413,12 +1900,14 @@ def init_hardware():
         bus = smbus.SMBus(1)
         log_message("I2C bus 1 opened successfully")
         
-        # Detect X728 UPS
-        for addr in I2C_ADDRS:
+        # Detect X728 UPS (cached address first, full scan as fallback)
+        probe_order = _i2c_probe_order()
+        for addr in probe_order:
             try:
                 bus.read_byte(addr)
                 current_i2c_addr = addr
                 log_message(f"X728 UPS detected at I2C address 0x{addr:02x}")
+                _save_i2c_addr(addr, probe_order)
                 break
             except:
                 continue
@@ -1441,6 +1930,27 @@ def init_hardware():
 # HARDWARE READING FUNCTIONS
 # ============================================================================
 
+# Short-lived register cache so back-to-back reads within one tick share a bus transaction.
+# Entries are (value, monotonic_ts) tuples: a single dict lookup is atomic under the GIL,
+# so cache hits can be served without taking `lock`.
+I2C_CACHE_TTL = 0.5  # seconds
+_reg_cache = {}
+
+# Precompiled big-endian unpackers (single register / VCELL+SOC snapshot)
+_U16BE = struct.Struct('>H')
+_U16BE_2 = struct.Struct('>HH')
+
+def invalidate_i2c_cache():
+    """Drop cached register values so the next read hits the bus (once per monitor tick)"""
+    _reg_cache.clear()
+
+def _cached_register(reg):
+    """Return the cached raw value for reg if still fresh, else None (lock-free)"""
+    entry = _reg_cache.get(reg)
+    if entry is not None and time.monotonic() - entry[1] < I2C_CACHE_TTL:
+        return entry[0]
+    return None
+
 def read_i2c_register(reg, count=2):
     """Read from X728 I2C register"""
     global bus, current_i2c_addr, hardware_error
@@ -1448,17 +1958,52 @@ def read_i2c_register(reg, count=2):
     if not bus or current_i2c_addr is None:
         return 0
     
+    # Fast path: fresh cache hit, no lock
+    value = _cached_register(reg)
+    if value is not None:
+        return value
+    
     try:
         with lock:
+            # Re-check: another thread may have refreshed it while we waited
+            value = _cached_register(reg)
+            if value is not None:
+                return value
             data = bus.read_i2c_block_data(current_i2c_addr, reg, count)
-            hardware_error = None
-            return struct.unpack('>H', bytes(data))[0]
+        hardware_error = None
+        value = _U16BE.unpack(bytes(data))[0]
+        _reg_cache[reg] = (value, time.monotonic())
+        return value
     except Exception as e:
         if not hardware_error or "Read Error" not in hardware_error:
             hardware_error = f"I2C Read Error (Reg 0x{reg:02x}): {e}"
             log_message(hardware_error, "ERROR")
         return 0
 
+def read_ups_snapshot():
+    """Read VCELL (0x02) and SOC (0x04) in one 4-byte block transaction.
+
+    Both raw values are stored in the register cache, so the get_voltage() /
+    get_battery_level() calls that follow in the same tick don't touch the bus.
+    Returns (battery_level, voltage).
+    """
+    global hardware_error
+    
+    fresh = _cached_register(0x02) is not None and _cached_register(0x04) is not None
+    if bus and current_i2c_addr is not None and not fresh:
+        try:
+            with lock:
+                data = bus.read_i2c_block_data(current_i2c_addr, 0x02, 4)
+            hardware_error = None
+            v_raw, c_raw = _U16BE_2.unpack(bytes(data))
+            ts = time.monotonic()
+            _reg_cache[0x02] = (v_raw, ts)
+            _reg_cache[0x04] = (c_raw, ts)
+        except Exception as e:
+            log_message(f"I2C snapshot read failed, falling back to per-register reads: {e}", "DEBUG")
+    
+    return get_battery_level(), get_voltage()
+
 def get_battery_level():
     """Read battery percentage (0-100%)"""
     raw = read_i2c_register(0x04)
@@ -1475,8 +2020,6 @@ def get_power_state():
     """Determine power state using GPIO and voltage"""
     global pld_line, gpio_error # Only need pld_line, not gpio_chip
     
-    voltage = get_voltage()
-    
     # Try GPIO first
     # Check if pld_line (the gpiod Line object) exists from init_gpio()
     if pld_line and not gpio_error:
@@ -1494,7 +2037,8 @@ def get_power_state():
             gpio_error = f"GPIO read error: {e}"
             log_message(gpio_error, "WARNING")
     
-    # Fallback to voltage detection
+    # Fallback to voltage detection (the only bus read here, so a PLD check stays off I2C)
+    voltage = get_voltage()
     if voltage > 5.05:
         return "On AC Power"
     elif voltage > 3.3:
@@ -1503,32 +2047,42 @@ def get_power_state():
         return "Critical/Off"
 
 
-def estimate_time_remaining(battery_level, voltage, power_state="On Battery"):
+# Voltage -> SOC curve breakpoints (piecewise linear, clamped at both ends)
+_SOC_XP = (3.3, 3.7, 4.2)
+_SOC_FP = (0.0, 50.0, 100.0)
+_SOC_SLOPES = tuple((_SOC_FP[i + 1] - _SOC_FP[i]) / (_SOC_XP[i + 1] - _SOC_XP[i]) for i in range(len(_SOC_XP) - 1))
+
+def soc_from_voltage(voltage):
+    """Interpolate state of charge (0-100%) from cell voltage using the precomputed curve"""
+    i = bisect.bisect_right(_SOC_XP, voltage)
+    if i == 0:
+        return _SOC_FP[0]
+    if i == len(_SOC_XP):
+        return _SOC_FP[-1]
+    return _SOC_FP[i - 1] + (voltage - _SOC_XP[i - 1]) * _SOC_SLOPES[i - 1]
+
+
+def estimate_time_remaining(battery_level, voltage=None, power_state="On Battery"):
     estimate_time_remaining.first_call = getattr(estimate_time_remaining, 'first_call', True)  # Static flag for first call check
     
     if power_state != "On Battery":
         return "∞ (On AC/Charging)"
     
+    # Never feed a placeholder voltage into the SOC blend - fall back to the EWMA, then a fresh read
+    if voltage is None:
+        voltage = ewma_voltage if ewma_voltage is not None else get_voltage()
+    
     capacity_mah = 7000 
     load_ma = 1300  # Use configured load current
     if load_ma < 200:
         return "N/A (Low Load)"
     
-    # Use recent history for smoothing (last 3 readings)
-    recent_readings = battery_history[-3:] if len(battery_history) >= 3 else battery_history
-    avg_battery = sum(entry['battery'] for entry in recent_readings) / len(recent_readings) if recent_readings else battery_level
-    avg_voltage = sum(entry['voltage'] for entry in recent_readings) / len(recent_readings) if recent_readings else voltage
+    # Use the running EWMAs of recent history for smoothing
+    avg_battery = ewma_battery if ewma_battery is not None else battery_level
+    avg_voltage = ewma_voltage if ewma_voltage is not None else voltage
     
     # Voltage-based SOC
-    if avg_voltage > 4.2:
-        soc_voltage = 100
-    elif avg_voltage > 3.7:
-        soc_voltage = 50 + ((avg_voltage - 3.7) / (4.2 - 3.7)) * 50
-    elif avg_voltage > 3.3:
-        soc_voltage = ((avg_voltage - 3.3) / (3.7 - 3.3)) * 50
-    else:
-        soc_voltage = 0
-    soc_voltage = max(0, min(100, soc_voltage))
+    soc_voltage = soc_from_voltage(avg_voltage)
     
     # Blend current and historical data (weighted 70% current, 30% historical)
     blended_battery = 0.7 * battery_level + 0.3 * avg_battery
@@ -1549,14 +2103,29 @@ def estimate_time_remaining(battery_level, voltage, power_state="On Battery"):
         minutes = hours_blended * 60
         return f"{minutes:.0f} minutes"
 
+_disk_label = None  # Resolved once; the root disk doesn't change at runtime
+
 def get_disk_label():
-    """Get the label of the disk mounted at DISK_PATH, with fallback logic"""
+    """Get the label of the disk mounted at DISK_PATH (memoized after the first successful lookup)"""
+    global _disk_label
+    if _disk_label is not None:
+        return _disk_label
+    label = _lookup_disk_label()
+    if label != "Unknown":
+        _disk_label = label
+    return label
+
+def _lookup_disk_label():
+    """Look up the label of the disk mounted at DISK_PATH, with fallback logic"""
     partitions = psutil.disk_partitions()
     for part in partitions:
         if part.mountpoint == DISK_PATH:
             device = part.device
             try:
-                label = subprocess.check_output(['lsblk', '-no', 'LABEL', device]).decode().strip()
+                label = _label_from_sysfs(device)
+                if label is None:
+                    # No udev by-label directory (minimal containers): fall back to lsblk
+                    label = subprocess.check_output(['lsblk', '-no', 'LABEL', device]).decode().strip()
                 if not label:
                     if 'mmcblk' in device:
                         label = "Micro SD Card"
@@ -1569,15 +2138,62 @@ def get_disk_label():
     return "Unknown"
 
 
+DISK_BY_LABEL_DIR = "/dev/disk/by-label"
+
+def _label_from_sysfs(device):
+    """Find device's filesystem label via the udev by-label symlinks ('' if unlabeled, None if unavailable)"""
+    if not os.path.isdir(DISK_BY_LABEL_DIR):
+        return None
+    target = os.path.realpath(device)
+    for name in os.listdir(DISK_BY_LABEL_DIR):
+        if os.path.realpath(os.path.join(DISK_BY_LABEL_DIR, name)) == target:
+            # udev escapes unsafe characters as \xNN (e.g. spaces become \x20)
+            return re.sub(r'\\x([0-9a-fA-F]{2})', lambda m: chr(int(m.group(1), 16)), name)
+    return ""
+
+
+THERMAL_PATH = "/sys/class/thermal/thermal_zone0/temp"
+_thermal_fd = None  # Persistent fd, read with pread() instead of open/read/close per tick
+
+def read_cpu_temp():
+    """Read CPU temperature in C from sysfs via a persistent file descriptor (0.0 on failure)"""
+    global _thermal_fd
+    for _ in range(2):  # Second pass reopens a stale fd
+        try:
+            if _thermal_fd is None:
+                _thermal_fd = os.open(THERMAL_PATH, os.O_RDONLY)
+            # Millidegrees fit in a few bytes; float() ignores the trailing newline
+            return float(os.pread(_thermal_fd, 16, 0)) / 1000.0
+        except OSError:
+            if _thermal_fd is not None:
+                try:
+                    os.close(_thermal_fd)
+                except OSError:
+                    pass
+                _thermal_fd = None
+        except ValueError:
+            break
+    return 0.0
+
+SYSINFO_CACHE_TTL = 5.0  # seconds
+_sysinfo_cache = (0.0, None)
+
 def get_system_info():
-    """Get system metrics"""
+    """Get system metrics (cached for SYSINFO_CACHE_TTL seconds; returns a copy)"""
+    global _sysinfo_cache
+    ts, cached = _sysinfo_cache
+    if cached is not None and time.monotonic() - ts < SYSINFO_CACHE_TTL:
+        return dict(cached)
     
-    try:
-        temp_path = "/sys/class/thermal/thermal_zone0/temp"
-        with open(temp_path, 'r') as f:
-            temp = float(f.read().strip()) / 1000.0
-    except Exception:
-        temp = 0.0
+    info = _collect_system_info()
+    _sysinfo_cache = (time.monotonic(), info)
+    return dict(info)
+
+
+def _collect_system_info():
+    """Gather fresh system metrics (temperature, disk, memory, uptime, network)"""
+    
+    temp = read_cpu_temp()
     
     try:
         disk = psutil.disk_usage(DISK_PATH)
@@ -1596,17 +2212,13 @@ def get_system_info():
     memory_info = f"Free: {memory_free_gb:.1f} GB / Total: {memory_total_gb:.1f} GB"
 
     try:
-        uptime_seconds = time.time() - psutil.boot_time()
+        uptime_seconds = time.time() - get_boot_time()
         uptime_str = str(timedelta(seconds=int(uptime_seconds)))
     except Exception:
         uptime_str = "Unknown"
         
-    try:
-        network_text, network_status = get_network_info()
-    except Exception as e:
-        log_message(f"Network info error: {e}", "WARNING")
-        network_text = "Unknown"
-        network_status = "disconnected"
+    # Network state comes from the monitor thread's cache - no probing on the request path
+    network_text, network_status = _network_cache
         
     return {
         "cpu_temp": f"{temp:.1f}",
@@ -1616,13 +2228,29 @@ def get_system_info():
         "disk_free": f"{disk_free_gb:.1f}",
         "disk_label": disk_label,
         "memory_info": memory_info,  # New: "free / total" in GB
-        "uptime": uptime_str,
-        "network": get_network_info()
+        "uptime": uptime_str
     }
 
 
+_boot_time = None  # Fixed for the life of the process
+_pi_model = None   # Fixed for the life of the process
+
+def get_boot_time():
+    """Return the system boot time (epoch seconds), read once"""
+    global _boot_time
+    if _boot_time is None:
+        _boot_time = psutil.boot_time()
+    return _boot_time
+
 def get_pi_model():
-    """Detect Raspberry Pi model"""
+    """Detect Raspberry Pi model (read once from the device tree)"""
+    global _pi_model
+    if _pi_model is None:
+        _pi_model = _read_pi_model()
+    return _pi_model
+
+def _read_pi_model():
+    """Read the Raspberry Pi model string from the device tree"""
     try:
         with open('/proc/device-tree/model', 'r') as f:
             model = f.read().strip().replace('\x00', '')
@@ -1635,6 +2263,22 @@ def get_pi_model():
 
 
 
+SYNC_TIMEOUT = 5  # seconds
+
+def sync_disks(action):
+    """Run sync in the background, keeping the UI updated until it finishes (raises on failure/timeout)"""
+    proc = subprocess.Popen(["sync"])
+    deadline = time.monotonic() + SYNC_TIMEOUT
+    while proc.poll() is None:
+        if time.monotonic() >= deadline:
+            proc.kill()
+            proc.wait()
+            raise subprocess.TimeoutExpired(["sync"], SYNC_TIMEOUT)
+        queue_emit('cancel_update', {"status": "pending", "type": action, "remaining": 0})
+        time.sleep(0.5)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, ["sync"])
+
 def trigger_system_action(action="shutdown", reason="Critical condition"):
     """Initiate safe shutdown or reboot relying on the pre-configured kernel gpio-poweroff overlay."""
     global config
@@ -1661,21 +2305,24 @@ def trigger_system_action(action="shutdown", reason="Critical condition"):
     def countdown_and_execute():
         nonlocal delay
         log_message(f"{action.upper()} TRIGGERED: {reason}", "CRITICAL")
-        send_ntfy(
+        # Notifications go through the worker so HTTP retries can't stall the countdown
+        send_ntfy_async(
             f"{'🚨' if action == 'shutdown' else '🔄'} {action.upper()} INITIATED: {reason}. System will {action} in {delay} seconds unless canceled.",
             "max",
             f"CRITICAL {action.upper()} WARNING"
         )
-        while delay > 0:
+        while True:
             if cancel_event.is_set():
                 log_message(f"{action.capitalize()} canceled by user.", "INFO")
-                send_ntfy(f"❎ {action.capitalize()} canceled by user.", "default", "Action Canceled")
+                send_ntfy_async(f"❎ {action.capitalize()} canceled by user.", "default", "Action Canceled")
                 pending_action["type"] = None
-                socketio.emit('cancel_update', {"status": "canceled"})
+                queue_emit('cancel_update', {"status": "canceled"})
                 return
+            if delay <= 0:
+                break
             pending_action["remaining"] = delay
-            socketio.emit('cancel_update', {"status": "pending", "type": action, "remaining": delay})
-            time.sleep(1)
+            queue_emit('cancel_update', {"status": "pending", "type": action, "remaining": delay})
+            cancel_event.wait(1)  # Wakes immediately on cancel
             delay -= 1
 
         # Execute software action if enabled
@@ -1683,7 +2330,7 @@ def trigger_system_action(action="shutdown", reason="Critical condition"):
         if config.get(enable_key, config.get('enable_auto_shutdown', 1)):
             try:
                 log_message(f"Syncing disks before {action}", "INFO")
-                subprocess.run(["sync"], timeout=5, check=True)  # Sync disks
+                sync_disks(action)
 
                 is_docker = os.path.exists('/.dockerenv')
                 if is_docker:
@@ -1717,7 +2364,7 @@ def trigger_system_action(action="shutdown", reason="Critical condition"):
             log_message(f"Auto-{action} disabled. System will rely on manual {action} or external handlers.", "WARNING")
         # After action, clear pending
         pending_action["type"] = None
-        socketio.emit('cancel_update', {"status": "done"})
+        queue_emit('cancel_update', {"status": "done"})
 
     t = threading.Thread(target=countdown_and_execute, daemon=True)
     pending_action["thread"] = t
@@ -1732,16 +2379,17 @@ def can_send_alert(alert_type):
         return True
     return False
 
-def check_thresholds():
-    """Monitor and alert on threshold violations"""
+def check_thresholds(battery_level=None, voltage=None, power_state=None, system_info=None):
+    """Monitor and alert on threshold violations (pass in readings already taken this tick)"""
     global config, hardware_error, previous_power_state
     
     if hardware_error:
         return
     
-    battery_level = get_battery_level()
-    voltage = get_voltage()
-    power_state = get_power_state()
+    if battery_level is None or voltage is None:
+        battery_level, voltage = read_ups_snapshot()
+    if power_state is None:
+        power_state = get_power_state()
     
     # Power state change detection (AC disconnect/reconnect)
     if previous_power_state is None:
@@ -1804,7 +2452,8 @@ def check_thresholds():
             log_message(f"Low battery: {battery_level:.1f}%", "WARNING")
     
     # Existing CPU temp
-    system_info = get_system_info()
+    if system_info is None:
+        system_info = get_system_info()
     cpu_temp = float(system_info['cpu_temp'])
     if cpu_temp >= config['cpu_temp_threshold']:
         if can_send_alert('high_cpu'):
@@ -1817,6 +2466,53 @@ def check_thresholds():
         if can_send_alert('low_disk'):
             send_ntfy(f"💾 Low Disk Space on {disk_label}: {disk_free:.1f} GB remaining", "high", "Disk Space Alert")
 
+# Backoff on stable AC readings: after STABLE_TICKS_BEFORE_BACKOFF quiet ticks the interval
+# between full ticks (I2C, sysinfo, MQTT, socket push) grows by INTERVAL_BACKOFF_FACTOR up to
+# MAX_BACKOFF_INTERVAL; any change snaps back. The power state is still polled every base interval.
+STABLE_TICKS_BEFORE_BACKOFF = 5
+INTERVAL_BACKOFF_FACTOR = 1.5
+MAX_BACKOFF_INTERVAL = 30
+STABLE_BATTERY_DELTA = 0.5   # %
+STABLE_VOLTAGE_DELTA = 0.02  # V
+_stable_ticks = 0
+_last_reported = None
+
+def reset_interval_backoff():
+    """Forget stability tracking so the next AC tick starts from the base interval"""
+    global _stable_ticks, _last_reported
+    _stable_ticks = 0
+    _last_reported = None
+
+def next_monitor_interval(battery_level, voltage, interval):
+    """Return the next AC monitor interval, backing off while readings are stable"""
+    global _stable_ticks, _last_reported
+    base = config.get('monitor_interval', 10)
+    
+    if (_last_reported is not None
+            and abs(battery_level - _last_reported[0]) < STABLE_BATTERY_DELTA
+            and abs(voltage - _last_reported[1]) < STABLE_VOLTAGE_DELTA):
+        _stable_ticks += 1
+    else:
+        _stable_ticks = 0
+        _last_reported = (battery_level, voltage)  # New reference point
+        return base
+    
+    if _stable_ticks < STABLE_TICKS_BEFORE_BACKOFF:
+        return base
+    return min(max(interval, base) * INTERVAL_BACKOFF_FACTOR, max(base, MAX_BACKOFF_INTERVAL))
+
+def build_telemetry(battery_level, voltage, power_state):
+    """UPS/hardware part of the dashboard status (shared by the socket push and /api/dashboard)"""
+    return {
+        "battery_level": f"{battery_level:.1f}",
+        "voltage": f"{voltage:.2f}",
+        "power_state": power_state,
+        "time_remaining": estimate_time_remaining(battery_level, voltage, power_state),
+        "hardware_error": hardware_error,
+        "gpio_status": "OK" if not gpio_error else gpio_error,
+        "i2c_addr": f"0x{current_i2c_addr:02x}" if current_i2c_addr else "N/A"
+    }
+
 def monitor_thread_func():
     """Background monitoring thread"""
     global monitor_thread_running
@@ -1833,74 +2529,108 @@ def monitor_thread_func():
     
     # ADDED: Initialize interval outside try block
     interval = config.get('monitor_interval', 10) 
+    config_check_ts = time.monotonic()  # Config was just loaded at startup
+    # The backoff only spaces out full ticks; the PLD power state is checked every base
+    # interval in between, and a change (e.g. AC loss) runs a full tick at once
+    next_full_tick = 0.0
+    last_power_state = None
 
     while not monitor_thread_stop_event.is_set():
         try:
-        
-            # --- DYNAMIC CONFIG RELOAD CHECK ---
-            # 1. Check if the config file exists
-            if os.path.exists(CONFIG_PATH):
-                current_mtime = os.path.getmtime(CONFIG_PATH)
+            # --- DYNAMIC CONFIG RELOAD ---
+            # Saves made by this process wake us via config_reload_event; edits made
+            # outside it are still caught by the mtime check every CONFIG_CHECK_INTERVAL seconds
+            now = time.monotonic()
+            if config_reload_event.is_set():
+                config_reload_event.clear()
+                config_check_ts = now
+                log_message("Configuration saved. Reloading settings...", "DEBUG")
+                load_config()
+                interval = config.get('monitor_interval', 10)
+                reset_interval_backoff()
+                next_full_tick = 0.0
+            elif now - config_check_ts >= CONFIG_CHECK_INTERVAL:
+                config_check_ts = now
+                # 1. Check if the config file exists (single stat)
+                try:
+                    current_mtime = os.stat(CONFIG_PATH).st_mtime
+                except OSError:
+                    current_mtime = None
                 
                 # 2. Compare it to the last time we loaded it
-                if current_mtime > LAST_CONFIG_MTIME:
+                if current_mtime is not None and current_mtime > LAST_CONFIG_MTIME:
                     log_message("Configuration file modified on disk. Reloading settings dynamically...", "INFO")
                     # load_config() updates: config, LOG_LEVEL, and LAST_CONFIG_MTIME
                     load_config()  
             # ---------------------------------------------
         
-            check_thresholds()
+            # 0. POWER STATE (every tick: AC loss must not wait out a backed-off interval)
+            power_state = get_power_state()
+            if power_state == last_power_state and now < next_full_tick:
+                wait_for_monitor_wake(min(config.get('monitor_interval', 10), next_full_tick - now))
+                continue
+            last_power_state = power_state
+        
+            # One fresh I2C sample per full tick; repeated reads below hit the cache
+            invalidate_i2c_cache()
+            refresh_network_info()
+            
+            # 1. DATA COLLECTION (one snapshot per loop, shared by check_thresholds and the status)
+            battery_level, voltage = read_ups_snapshot()
+            system_info = get_system_info()
+            
+            check_thresholds(battery_level, voltage, power_state, system_info)
             
             # --- 3.0.11 git Version Check ---
             check_latest_version()
             
-            # 1. DATA COLLECTION (Runs every loop)
-            battery_level = get_battery_level()
-            voltage = get_voltage()
-            power_state = get_power_state()
-            status = {
-                "battery_level": f"{battery_level:.1f}",
-                "voltage": f"{voltage:.2f}",
-                "power_state": power_state,
-                "time_remaining": estimate_time_remaining(battery_level, voltage, power_state),
-                "system_info": get_system_info(),
-                "hardware_error": hardware_error,
-                "gpio_status": "OK" if not gpio_error else gpio_error,
-                "i2c_addr": f"0x{current_i2c_addr:02x}" if current_i2c_addr else "N/A",
-                "latest_version_info": LATEST_VERSION_INFO
-            }
+            status = build_telemetry(battery_level, voltage, power_state)
+            status["system_info"] = system_info
+            status["latest_version_info"] = LATEST_VERSION_INFO
             
-            # 2. UI EMIT (Runs every loop)
-            socketio.emit('status_update', status)
+            # 2. UI EMIT (Runs every loop while a dashboard is connected)
+            if has_socket_clients():
+                emit_status(status)
             
-            # 3. MQTT PUBLISH (Runs every loop, now matching UI refresh rate)
+            # 3. MQTT PUBLISH (Runs every loop while connected, now matching UI refresh rate)
             # ---  MQTT Data Publishing ---
-            publish_mqtt_data("battery_level", f"{battery_level:.1f}")
-            publish_mqtt_data("voltage", f"{voltage:.2f}")
-            publish_mqtt_data("power_state", power_state)
-            
-            full_payload = json.dumps(status)
-            publish_mqtt_data("state", full_payload)
+            if mqtt_connected():
+                publish_mqtt_data("battery_level", f"{battery_level:.1f}")
+                publish_mqtt_data("voltage", f"{voltage:.2f}")
+                publish_mqtt_data("power_state", power_state)
+                
+                publish_mqtt_state(status)  # Full JSON only when changed (or heartbeat)
             # -----------------------------------
             
             # 4. SET NEXT INTERVAL
             if power_state == "On Battery":
                 interval = 2 # Faster (2s) for real-time critical monitoring
+                reset_interval_backoff()
             else:
-                interval = config.get('monitor_interval', 10) # Normal configurable interval
+                # Normal configurable interval, stretched while readings stay stable on AC
+                interval = next_monitor_interval(battery_level, voltage, interval)
         
 
         except Exception as e:
             log_message(f"Monitor error: {e}", "ERROR")
             interval = config.get('monitor_interval', 10) # Fallback to normal on error
+            reset_interval_backoff()
             
-        # 5. THREAD SLEEP (Waits for the dynamically set 'interval')
-        monitor_thread_stop_event.wait(interval)
+        # 5. THREAD SLEEP (until the next power-state check at most, or a config save)
+        next_full_tick = time.monotonic() + interval
+        wait_for_monitor_wake(min(config.get('monitor_interval', 10), interval))
         
         
     monitor_thread_running = False
     log_message("Monitor thread stopped")
 
+def wait_for_monitor_wake(timeout):
+    """Sleep up to timeout seconds, waking early when the config is saved or the monitor is stopped"""
+    if monitor_thread_stop_event.is_set():
+        return True
+    config_reload_event.wait(timeout)
+    return monitor_thread_stop_event.is_set()
+
 def start_monitor():
     """Start background monitoring"""
     global monitor_thread_running, monitor_thread_stop_event
@@ -1912,6 +2642,15 @@ def start_monitor():
         thread = threading.Thread(target=monitor_thread_func, daemon=True)
         thread.start()
 
+def stop_monitor():
+    """Stop background monitoring without waiting out the current sleep"""
+    monitor_thread_stop_event.set()
+    # The loop sleeps on config_reload_event: set it too so a sleeping monitor wakes,
+    # sees the stop flag and exits (the loop re-checks the flag before reloading config)
+    config_reload_event.set()
+
+atexit.register(stop_monitor)
+
 def send_startup_ntfy():
     """Send startup summary via ntfy"""
     log_message(f"Sending startup ntfy in PID: {os.getpid()}", "DEBUG")
@@ -1919,8 +2658,7 @@ def send_startup_ntfy():
         send_ntfy(f"⚠️ Startup with hardware error: {hardware_error}", "high", "UPS Startup")
         return
     
-    battery_level = get_battery_level()
-    voltage = get_voltage()
+    battery_level, voltage = read_ups_snapshot()
     power_state = get_power_state()  # Ensure initial check
     system_info = get_system_info()
     cpu_temp = system_info['cpu_temp']
@@ -1982,59 +2720,76 @@ def system_pending():
             "remaining": pending_action["remaining"]
         })
     return jsonify({"type": None})
+# Hardware status badges only change with the error state, so each variant is built once
+@lru_cache(maxsize=8)
+def _i2c_status_html(ok, i2c_addr):
+    if ok:
+        return Markup('<span id="i2c-status" class="text-green-500">✅ {}</span>').format(i2c_addr)
+    return Markup('<span id="i2c-status" class="text-red-500">❌ Error</span>')
+
+@lru_cache(maxsize=2)
+def _gpio_status_html(ok):
+    if ok:
+        return Markup('<span id="gpio-status" class="text-green-500">✅ Active</span>')
+    return Markup('<span id="gpio-status" class="text-yellow-500">⚠️ Limited</span>')
+
+def dashboard_etag(dark_mode):
+    """Validator for the dashboard page: covers everything it shows except the live readings,
+    which a connected page gets over Socket.IO straight away"""
+    history_chart_json()  # Refreshes _history_chart_key for the newest entry
+    key = "|".join(map(str, (
+        VERSION_STRING, VERSION_BUILD, dark_mode,
+        json.dumps(config, sort_keys=True),
+        current_i2c_addr, hardware_error, gpio_error,
+        _history_chart_key,
+        LATEST_VERSION_INFO["latest"], LATEST_VERSION_INFO["update_available"]
+    )))
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
 @app.route('/')
 def dashboard():
     """Main dashboard"""
     global hardware_error, gpio_error, current_i2c_addr, config
     
-    battery_level = get_battery_level()
-    voltage = get_voltage()
+    # Theme comes from a cookie so the page is served already in the right mode (dark by default)
+    dark_mode = request.cookies.get('dark_mode', '1') != '0'
+    
+    # Revalidation of an unchanged page is answered before any sensor read or render
+    etag = dashboard_etag(dark_mode)
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+        response.set_etag(etag)
+        return response
+    
+    battery_level, voltage = read_ups_snapshot()
     power_state = get_power_state()
     system_info = get_system_info()
-    # Explicitly unpack network info to ensure system_info['network'] is a string
-    network_text, network_status = get_network_info()
-    system_info['network'] = network_text
-    system_info['network_status'] = network_status
     pi_model = get_pi_model()
     
-    # Format history for chart
-    history_chart = []
-    for entry in battery_history[-50:]:  # Last 50 points
-        try:
-            dt = datetime.fromisoformat(entry['timestamp'])
-            history_chart.append({
-                'time': dt.strftime('%H:%M'),
-                'battery': entry['battery'],
-                'voltage': entry['voltage']
-            })
-        except Exception:
-            pass
-    
-    return render_template_string(DASHBOARD_TEMPLATE,
-        VERSION_STRING=VERSION_STRING,
-        VERSION_BUILD=VERSION_BUILD,
-        CURRENT_VERSION=CURRENT_VERSION,
-        GITHUB_REPO=GITHUB_REPO,
+    # Pre-compiled template object; render_template still applies Flask's context processors
+    response = make_response(render_template(_DASHBOARD_TPL,
         battery_level=f"{battery_level:.1f}",
         voltage=f"{voltage:.2f}",
         power_state=power_state,
-        time_remaining=estimate_time_remaining(battery_level, 0),  # Dummy current=0 since removed
+        time_remaining=estimate_time_remaining(battery_level, voltage, power_state),
         system_info=system_info,
         pi_model=pi_model,
-        hardware_error=hardware_error,
-        gpio_error=gpio_error,
-        i2c_addr=f"0x{current_i2c_addr:02x}" if current_i2c_addr else "N/A",
+        i2c_status_html=_i2c_status_html(not hardware_error, f"0x{current_i2c_addr:02x}" if current_i2c_addr else "N/A"),
+        gpio_status_html=_gpio_status_html(not gpio_error),
         config=config,
-        history=json.dumps(history_chart),
-        timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-    )
+        history=history_chart_json(),
+        dark_mode=dark_mode
+    ))
+    response.set_etag(etag)  # Takes precedence over the body hash added by conditional_response
+    response.cache_control.max_age = 0
+    response.cache_control.must_revalidate = True
+    response.vary.add('Cookie')
+    return response
 
 @app.route('/api/status')
 def api_status():
     """API endpoint for status"""
-    battery_level = get_battery_level()
-    voltage = get_voltage()
+    battery_level, voltage = read_ups_snapshot()
     
     return jsonify({
         
@@ -2069,7 +2824,7 @@ def configure():
         config['ntfy_server'] = request.form.get('ntfy_server', '').strip()
         config['ntfy_topic'] = request.form.get('ntfy_topic', '').strip()
         config['debug'] = 1 if request.form.get('debug') else 0
-        
+        refresh_ntfy_target()
         
         save_config()
         log_message("Configuration updated via web UI")
@@ -2124,16 +2879,60 @@ def system_control():
 
 
 
+def log_lines_since(since=None):
+    """Lines logged after cursor `since` (a previous 'total'), or the whole buffer if that's unknown,
+    returned as (lines, total, reset); reset means the lines replace what the client has"""
+    with _log_lock:
+        total = _log_total
+        new = total - since if since is not None and 0 <= since <= total else None
+        if new is None or new > len(_ui_log_buffer):
+            return list(_ui_log_buffer), total, True
+        return list(_ui_log_buffer)[len(_ui_log_buffer) - new:], total, False
+
 @app.route('/logs')
 def get_logs():
-    """Return live logs from in-memory buffer."""
-    with _log_lock:
-        return jsonify({'logs': list(_ui_log_buffer)})
+    """Return live logs from in-memory buffer (only lines after ?since=<total> if given)."""
+    lines, total, reset = log_lines_since(request.args.get('since', type=int))
+    return jsonify({'logs': lines, 'total': total, 'reset': reset})
+
+
+def _collect(name, fn):
+    """Run one /api/dashboard subcollector; a failure yields None instead of failing the whole payload"""
+    try:
+        return fn()
+    except Exception as e:
+        log_message(f"Dashboard collector '{name}' failed: {e}", "DEBUG")
+        return None
+
+def current_status():
+    """Full status as the monitor loop broadcasts it (telemetry, system info, version info)"""
+    status = _collect_telemetry()
+    status["system_info"] = get_system_info()
+    status["latest_version_info"] = dict(LATEST_VERSION_INFO)
+    return status
+
+def _collect_telemetry():
+    battery_level, voltage = read_ups_snapshot()
+    return build_telemetry(battery_level, voltage, get_power_state())
+
+def _collect_logs_tail():
+    lines, total, reset = log_lines_since(request.args.get('since', type=int))
+    return {'lines': lines, 'total': total, 'reset': reset}
+
+@app.route('/api/dashboard')
+def api_dashboard():
+    """Everything the dashboard polls for (telemetry, system info, log tail, version) in one round-trip"""
+    return jsonify({
+        "telemetry": _collect('telemetry', _collect_telemetry),
+        "system_info": _collect('system_info', get_system_info),
+        "logs_tail": _collect('logs_tail', _collect_logs_tail),
+        "version_status": _collect('version_status', lambda: dict(LATEST_VERSION_INFO))
+    })
 
 
 def emit_flash(category, message):
     """Emit a flash message to all connected clients via Socket.IO"""
-    socketio.emit('flash_message', {'category': category, 'message': message})
+    queue_emit('flash_message', {'category': category, 'message': message})
 
 
 
@@ -2176,335 +2975,17 @@ def status():
 # Dashboard HTML template with professional UI
 DASHBOARD_TEMPLATE = '''
 <!DOCTYPE html>
-<html lang="en" class="dark">
+<html lang="en"{% if dark_mode %} class="dark"{% endif %}>
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>{{ VERSION_STRING }} - UPS Monitor</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.7.5/socket.io.min.js"></script>
-    <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.min.js"></script>
-    <style>
-        :root {
-            --primary: #3b82f6;
-            --success: #10b981;
-            --warning: #f59e0b;
-            --danger: #ef4444;
-            --dark-bg: #0f172a;
-            --dark-card: #1e293b;
-            --dark-border: #334155;
-        }
-        
-        * { transition: all 0.2s ease; }
-        
-        body { 
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-        }
-
-        html.dark body {
-            background: linear-gradient(135deg, #1e293b 0%, #0f172a 100%);
-        }
-
-        .glass-card {
-            background: rgba(255, 255, 255, 0.9);
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255, 255, 255, 0.2);
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        }
-
-        html.dark .glass-card {
-            background: rgba(30, 41, 59, 0.8);
-            border: 1px solid rgba(51, 65, 85, 0.3);
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-        }
-
-        .metric-card {
-            position: relative;
-            overflow: hidden;
-            background: #FFFFFF; /* Assumed white background for light mode */
-        }
-
-        html.dark .metric-card {
-            background: #1E293B; /* slate-800 for dark mode */
-        }
-
-        /* Robust Light and Dark Mode Text Overrides */
-        .glass-card h3,
-        .glass-card label,
-        .glass-card input,
-        .glass-card textarea,
-        .metric-card h2,
-        .metric-card h3,
-        .metric-card p,
-        .metric-card span {
-            color: #111827; /* gray-900 for headers, small texts, and inputs in light mode */
-        }
-
-        html.dark .glass-card h3,
-        html.dark .glass-card label,
-        html.dark .glass-card input,
-        html.dark .glass-card textarea,
-        html.dark .metric-card h2,
-        html.dark .metric-card h3, 
-        html.dark .metric-card p,
-        html.dark .metric-card span {
-            color: #9ca3af; /* #F3F4F6 gray-100 for headers, small texts, and inputs in dark mode */
-        }
-
-        /* Ensure input fields have consistent backgrounds */
-        .glass-card input,
-        .glass-card textarea {
-            background-color: #FFFFFF; /* White background for inputs in light mode */
-            border-color: #D1D5DB; /* gray-300 border */
-        }
-
-        html.dark .glass-card input,
-        html.dark .glass-card textarea {
-            background-color: #1E293B; /* slate-800 background for inputs in dark mode */
-            border-color: #475569; /* slate-600 border */
-        }
-
-        /* Override Tailwind dark mode classes to prevent conflicts */
-        html:not(.dark) .glass-card .dark\:bg-gray-700,
-        html:not(.dark) .glass-card .dark\:bg-gray-800,
-        html:not(.dark) .glass-card .dark\:bg-gray-900,
-        html:not(.dark) .metric-card .dark\:bg-gray-700,
-        html:not(.dark) .metric-card .dark\:bg-gray-800,
-        html:not(.dark) .metric-card .dark\:bg-gray-900 {
-            background-color: #FFFFFF !important; /* White background for inputs and metric cards in light mode */
-        }
-
-        html:not(.dark) .glass-card .dark\:text-gray-100,
-        html:not(.dark) .glass-card .dark\:text-gray-200,
-        html:not(.dark) .glass-card .dark\:text-white,
-        html:not(.dark) .metric-card .dark\:text-gray-100,
-        html:not(.dark) .metric-card .dark\:text-gray-200,
-        html:not(.dark) .metric-card .dark\:text-white {
-            color: #111827 !important; /* gray-900 for text in light mode */
-        }
-
-        .metric-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 4px;
-            background: linear-gradient(90deg, var(--primary), var(--success));
-        }
-        
-        .status-badge {
-            display: inline-flex;
-            align-items: center;
-            gap: 0.5rem;
-            padding: 0.5rem 1rem;
-            border-radius: 9999px;
-            font-weight: 600;
-            font-size: 0.875rem;
-        }
-        
-        .status-pulse {
-            width: 8px;
-            height: 8px;
-            border-radius: 50%;
-            animation: pulse 2s infinite;
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-        
-        .battery-bar {
-            height: 32px;
-            border-radius: 8px;
-            background: linear-gradient(90deg, #10b981 0%, #3b82f6 50%, #ef4444 100%);
-            position: relative;
-            overflow: hidden;
-        }
-        
-        .battery-bar::after {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent, rgba(255,255,255,0.3), transparent);
-            animation: shimmer 2s infinite;
-        }
-        
-        @keyframes shimmer {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-        
-        .collapsible-content {
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.5s ease;
-        }
-        
-        .collapsible-content.open {
-            max-height: 2000px;
-        }
-        
-        .toggle-switch {
-            position: relative;
-            width: 48px;
-            height: 24px;
-            background: #cbd5e1;
-            border-radius: 24px;
-            cursor: pointer;
-        }
-        
-        .toggle-switch::after {
-            content: '';
-            position: absolute;
-            top: 2px;
-            left: 2px;
-            width: 20px;
-            height: 20px;
-            background: white;
-            border-radius: 50%;
-            transition: transform 0.2s;
-        }
-        
-        .toggle-switch.active {
-            background: var(--primary);
-        }
-        
-        .toggle-switch.active::after {
-            transform: translateX(24px);
-        }
-        
-        .alert-banner {
-            padding: 1rem;
-            border-radius: 0.5rem;
-            margin-bottom: 1rem;
-            animation: slideIn 0.3s ease;
-        }
-        
-        @keyframes slideIn {
-            from { transform: translateY(-20px); opacity: 0; }
-            to { transform: translateY(0); opacity: 1; }
-        }
-        
-        .btn-primary {
-            background: linear-gradient(135deg, #3b82f6, #2563eb);
-            color: white;
-            padding: 0.75rem 1.5rem;
-            border-radius: 0.5rem;
-            font-weight: 600;
-            border: none;
-            cursor: pointer;
-            box-shadow: 0 4px 12px rgba(59, 130, 246, 0.4);
-        }
-        
-        .btn-primary:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 6px 16px rgba(59, 130, 246, 0.5);
-        }
-        
-        .chart-container {
-            position: relative;
-            height: 200px;
-            width: 100%;
-        }
-        
-        @keyframes flash-bulb {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.1; } /* Slightly less aggressive than 0 to make it pulse */
-        }
-
-        .flashing {
-            animation: flash-bulb 1s infinite;
-            
-        }   
-         /* NEW: Spinning Icon CSS for Manual Check Feedback */
-        @keyframes spin {
-            0% { transform: rotate(0deg); }
-            100% { transform: rotate(360deg); }
-        }
-
-        .spinning {
-            animation: spin 1s linear infinite;
-        }  
-        
-        /* Heartbeat Animation */
-        @keyframes heartbeat {
-            0% { transform: scale(1); opacity: 1; }
-            30% { transform: scale(1.15); opacity: 0.8; }
-            50% { transform: scale(1); opacity: 1; }
-            100% { transform: scale(1); opacity: 1; }
-        }
-
-        .heartbeat {
-            display: inline-block; /* Required for the transform scale to work */
-            animation: heartbeat 2s ease-in-out infinite; /* 2 seconds duration, smooth transition, loops forever */
-        }   
-        
-        /* Bright Swipe/Glare Animation for Text */
-        @keyframes swipe-glare {
-            0% { background-position: 200% 0; }
-            100% { background-position: -200% 0; }
-        }
-
-        .swipe-text {
-            /* Define the moving gradient and size */
-            background: linear-gradient(90deg, transparent, rgba(255, 255, 255, 0.8), transparent);
-            background-size: 200% 100%;
-
-            /* Clip the background to the shape of the text */
-            -webkit-background-clip: text; 
-            background-clip: text;
-
-            /* CRITICAL FIX: Make the text visually transparent, revealing the background, 
-               but preserve the text color (set by Tailwind) for context. */
-            -webkit-text-fill-color: transparent; 
-            
-            /* Ensure the element behaves correctly */
-            display: inline-block; 
-
-            /* Animation application */
-            animation: swipe-glare 12s linear infinite;
-        }   
-
-        #log-display {
-            background: #2d3748 !important;
-            color: #e2e8f0 !important;
-            padding: 12px;
-            border-radius: 8px;
-            max-height: 400px;
-            overflow-y: auto;
-            font-family: "Lucida Console", Monaco, monospace;
-            font-size: 12px;
-            line-height: 1.3;
-            white-space: pre;
-            border: 1px solid #4a5568;
-        }
-
-        .log-line { margin: 0; padding: 2px 0; white-space: pre; display: block; }
-
-        .log-line[data-level="INFO"] [data-level-tag] { color: #00ff00 !important; }
-        .log-line[data-level="WARNING"] [data-level-tag] { color: #ffcc00 !important; }
-        .log-line[data-level="ERROR"] [data-level-tag] { color: #ff4444 !important; }
-        .log-line[data-level="CRITICAL"] [data-level-tag] { color: #ff0000 !important; }
-        .log-line[data-level="DEBUG"] [data-level-tag] { color: #888888 !important; }
-
-        .log-line {
-            margin: 0;
-            padding: 2px 0;
-            white-space: pre;
-            display: block;
-            position: relative;
-        }
-  
-
-        
-    </style>
+    <!-- Warm up the connection for the deferred Socket.IO client (cdnjs), which the parser only reaches after the dashboard markup -->
+    <link rel="preconnect" href="https://cdnjs.cloudflare.com">
+    <!-- Dashboard styles first: dashboard.css declares the cascade-layer order -->
+    <link rel="stylesheet" href="{{ static_url('dashboard.css') }}">
+    <!-- Purged Tailwind build (see tailwind.input.css) - no runtime JIT in the browser -->
+    <link rel="stylesheet" href="{{ static_url('tailwind.min.css') }}">
 </head>
 <body class="text-gray-900">
     <div class="min-h-screen p-4 md:p-8">
@@ -2515,7 +2996,7 @@ DASHBOARD_TEMPLATE = '''
                 <div class="flex justify-between items-center">
                 
                     <div>
-                        <a href="https://github.com/piklz/pi_ups_monitors/tree/main/docker"><img width="60%" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAIUAAACHCAYAAAA4Epo3AAAAAXNSR0IArs4c6QAAAARnQU1BAACxjwv8YQUAAAAJcEhZcwAACxMAAAsTAQCanBgAAHMaSURBVHhe7L13mCRXdf7/ubeqOvf05Dw7sznnvFppV3mVEUgEkQTCAoQBEwy2wQjZYDBgDAaTTDLZCCFAEsphtavV5pxmZ3Z2co6du8K9vz+qV1oWTJL0+2Ls93n6md3p7pqqW2+de86557wX/g//h/Mgzv/F/+E3406Qm+98YyBFUE6ms2LCHnXf/YWHCud/7s8B/0eK34FZEPzLO7ZcWh42VxzqnLxmdDJThufJxTMqTzc3hr7z6P6hn3/t/n3Z87/3Pxn/R4r/BrdfuzLSEg8ubWgq/ccdx7vW/XJHT9gJIjOGQHuCuOuxZfGszGVr5305Ozz2ibd8/ZEJIdDnH+d/Iv6PFOdh06ZN5kzGll20svEDu452bNndPhXvymaZfXkLTRdVcWBckM8YFA4PY2/v4JKWMm9uTfneQMj4VDYRePTT39yROv+Y/9NgnP+L/8UQV6xrLN/SHH3H9Mb6//jnHzy9fFdPLsjCEq5712KmXxAjIyx6xsARAWRNnEh1GSdPjcv+nrGG+TNKX+ZlqFoyp/Tw3taR/9HE+D9L4UP8/ZsvvHpJdfTdD2w/tfmh1jErPqeMtTc1UzMvxGBGsq9LMJVxUVKgDA/pCYSWiIyLd3SQ7M5uLqir0C/f0LSvayz7jn/6yb7d5/+R/yn4X02Kd27ZElw8z5o1kcm9ynXtd/7syWOlY/EwVRc0sWFLJTWNitY+xRNHBFnhITyFEAIhBCDRSAxlo5TCGIXU/UeoTGa5dcuqzrrGin8tCYd/uX3XaM8XHvqfFaX8ryXFjZvWNF6yIPGRoZGx63cdH604nkqaDetruehVjdjRKAMTWdpGJQMphXSDaJlHKeEPmaeQWQ+iQYTUaGkjlAmTefSBYcSJQdbW1ziRiBzesGrR1trm4PHjnf0/+cjnn2w9/zz+FPG/jhTNzYRetXrTtSHhfHpnW3/z4YFJYc4tZ8klVaxcX0l/3uLZtikm8yYuAqE0EolA4xZ/4ni4u84QmdVIoTYGho2hJEIKpFboYxOk9/QiMy7lcYM6JfUrN8zsMksSdwx98f6H7wJ1/nn9KeF/FSk2VVXF3n/b3H/dedp55bceby1x6k2WvXwOweYwI45HPikZdyMUXBep/alCa42UEqUUCIEEbKEItyWZ2NNL+MqZeDUhQp4EIUApBAKddTFsheNmcXf1k+hO6Vsvmzlk2IW3/t2PjtwHf7rh6/+a6OOyGWWJV75q+RcO9GTf+LXHToWnXVbFmrctJVUZ48QZzVA2TNJTeNrBxEMICZz1H4oQAgF4QiOiJk7HFCIFRnmcgKFR8NznvaDCC4IzGcKcUUpWI7r2D8dWtzSsuXzZ7IceOXxm7PkD/2nhfwUpLl9SE735Fau/9NP7j7zupwe6jVVvWsSKmxp49kSWiVEXM+QSEgU8x0QiAYksEuDs6zkIgdTgSpNIzCJ7JImnLaKJOLZpgyHQeEhtorUk161RQhOZG2dyNEW6ZzJRHhXpbScHn/pTtRb/G0gh/uo1a//qye2tf7njTNqKbKgnsLSB/d15LphtsmJGjLlNIUxT0Z8ElE+BX7EQ50GhMRXYWmIMjiEGCmTcMJg2gaiFxgQtcIc1qlci2gewI5JQc4jRfUNyTUvJshsun7P94V3dXecfG+ATt2ws27yyueqi+dMDTx3tyt11/gdeYvzZk+Ivbly2WhWyX33g2aGYcfFMKi+qoKQMFtbDkmkSW8GxAcHergLCk8Vpw3+E/cdYFE2FBt/NRGiN8FwyPQahKots6yDSKkdLg0CFQEtNvjWH06WwlIPTN4ROxIjMLyEznGH45ERww9yqkhXNLb/cerzLPvd8b799pXXxvOofd/SmPurY3iseXNjQ17hwQ/vx48f/f7Mq/gj8meI9b13aUBaNfObHj5wpSzVVULo8zpIZcWZUmAxNGgxMRDjZ73G0Ow+uRGvx/Cun0IMu9rii4AiU0nhCo4VGaY2XMzAGwVUWkYYIRjqPYytsNF6PR6EXbMfDdNI4mQwUTJSniKxu4Ewuw/4TwxdPn55tPv+co+OWOTiZbvrKw63VP9jTsaS5xPzR+kDnK86fxV5K/DmTQpZ7pW9/9sCZjQNSUbaxksULwhzpTvL4MZdTA5odbTlODIHtmKCN5xJTQgiYSJN+9BSFJwZRR1zsLpBZAw8PAbgZjaM8nHEDZRo4k2MYGYU6qrG7QDiSSK0k3z0IhoXWJg4GTl0YObea3qFMfLBbX3/+zR6dmIzknXwkNLOC7IrZfP7h1rAVCXzmS2+7YO25n3sp8edKCvGJW9dsPn5y8La2oYIsm1/FrOUJWvtthrIhbM9CCUHnpGQqo0E7gC5aCd9K23URSi+ZRaDEwz7aAwdypA7ncbsE3qjCSggCTQauY2DFS5Gmh5eD7IBBYUJC0MZMp7BHJjAiMbAFjCu0UBh1cfb1Ja1IPPKO1fXx8rMnvWVWecnSmbP+Yv+RqQalFKI+yGRjCV9/+FSjDMlrz73AlxJ/lj7F+963JFofEJ95/Mjkysmwx8XvnkuoppTTnXlcbaHR/roFnP+g+n6D1hiGwikzoSlGwFBk23ow8iZeMoA9ZqKnPLykRmQMdNhBnRlAZfKYQmGUaxJSk9zTjraiWPXT0QQgJzGigkCjxdThUUQ+H3/ZpQspTCRPvOHqxTdeuKjpe12dgzf+aGdnMNeYwJpbhiUFun2K9XNKdz6wp/ex8072JcGfpaXIDFdv/OXBqQ3tIylWvKoZGQmxfX+GvDLP+ZTGDzD0c5GG1qC1/38tTAIeWAGBubSC+LpG3OFe6O7CSOVwR01IWQgtURho7SIsD6M2SMBJMbLnCG46iw4GUVYALTSFCRd3QOBKg+iaeva1jQuVz/7FTVcsfnRgwv7mP959cPYXDnRZ4auWEL2wBTVeQBwZ4uUXzZtK25Ed55z8S4o/O0uxrpHwNRfN/vF/3nOkJby2lmVbaunPQFILbNtFCIlEg3ARWvnxhDaQQvqBRpEgQms0AqEFSnqYpVFULohK5tHJFKZlIYMWnjYwDRe7fwgjYGIEBKKtj8uml2FaAcZyOYxQFAIShaSQVEjHI1AZJtOT5NHt3eHHj/RWHR1JSr2wmtLrFpCMGdCTxNvWy5a6mLuoKfK97vH8v+883uuef70vBf7cSCE++deXvnwwmX3Ts8dGrXlXTWfxaoOhjEN93CBmZClIyLgmptLFyz8nPfUrM4lGaz/aQHsIqSEcxMuXYegczsggRiyIYwQRwkENDdNgQkU+x5qmytQrL2o6Xl8TZWIoGZ8cHMMMWhgxA2UGsSckBgqj2sTtniRy6XzEyiaClTVkBnOozim8Xd2sKQuoVQtrv3X4VOoDX3lwX/rcs3sp8WdFin95z7pwmVf44Ke/fWyZWlIhNt0yi1NjFqf7HEqNMGYwQEVJHqmCpPNWMetwzgx6vntx9nfaBOlHHl5KoFUEw7VxerowhUBPpqhw8nz6bUt7r14976szZ9d++cEd2Q9mgu5DV6+ZVloh9IzezkGrMDqGCBoQDaLTBoYXwEtOYsyoxXWD2L0eXvcU8d4hNlRFcy+7eMmP+7r6/vbLjx0dPf+0Xkr8OZFCrKzhmjPDxt8+2zYemHFdKTXT4zzdCoWChw45eAUHpQTjgy4lUY/SRJBsXqHwp45zs85Cg5/o1iiBn7oOgMgJvEkDEYtgRE0KvT1E02ne97JaZCDwbye2Fz7yzm8/ePRQV5e771jf0MrGpofnzalsXzwr2FwR8GpHO8ZFbiqNGRU4ZgSjpBzPAjGVQhzuZJ7Mc+tF1em5c5o/drQ/fefnf753/NyL/P8Dv+nZ+J8E8bU7tzQsnFW6ND9VuFEoXvHRr+8pPZFTXPbX8ziWNEgqRUx5BM+Mkzo1TmxaOXMvr2Ug5zCWDjCeBqXPZjE9QIHWaOETQqPBEYikRAkP0xFMHlMo20CGXEJDfYjuAT5xSyPzm2ueTEb1V1LJ9L6fHp7Zeffdd3tnT/S9r1lZ2VAWenVXb/qdzx4Zm3Um68iM4f8NKSya4ybzK4Le2gUVz7pKfvzh9u2Pbd3K/y8+xPn4H0eKO+9E1nNtKOKm1iyaW3HH5FRq5bHW4frBwUywecZs8YGvPEX5TUsJzgnRNx4h4DrIgUEa8poZqypJVeQY8oKMTQbxlKSYlgDAkw7uJDAg8IRCCYXhKpRjYI+4SMdCaI3yJEIIpJSE5BTp1jbW1gpef0EzZmkgP6MhOOZEKvbv2N36pUi0ZOv7/nVn/mye/ONvvWS+Zac+7srIlb94stVyUSIkhF6/sLKvtqbmh64nv/DBbz428P9ysex/DCneuWVW8Jqrmi+Oxks3joxO3WgXvFnd3alAIByisloys6KMj3/7AE8PZAm/YjHCUDitowSGJlm8oZaqC6rpGoWO8Ry2MrG0P3OeTVaBxhUejHnkH+lH6SAqFMQIR3CRoCVSCQwlUMK3IFqACBWQw4OsjeT49w8s4plDBUYn0oylkqxZWG9XlSSelYHwPYcO9d4zWrlj8K67UOsaG8Pvum3j+phINrimskSkyhnNOYf+4kM/OvL/kgxn8SdPittvX2mtqQrU15UGP1JVnbj5ngfaouVBS65Y2oRpQbTCZeHsGDu2jvDOfzvExNxpiIRFrr2XugqLTW9eSq/hceS0wPYUfpmMRovni5+eJ4bAFor4gEvqmW7SvUmEMDFLwhg1tbjK8pfEpV9M4xoeIuBhDPSzMVHg5/+2HCUtRgYEfaOSA8cH6O5JsnBmubt6TUXPqY7+LwYc67u77O1jd931p1t99SfraG7atMn8yE21q69fX/u3BYdPDQxOXXiqOxm84IImseXyCkZGFVY4y+SkQVVY8o2fdrC1NUnpqgrqrDzrr2iidkMjR5Mebf0OBW0ghYcuxhwgkPLckNR/PgzAixnI5jKMeARtWag8eAOjyKlxpKHwgiZaSCQmQmh0KkVLxOPV11SBgHsfHCFR6nDVlQkWLaqgbzgnf/ZQZ5mFdXldVez6+TXzyxbVh4bWXfP2ia1bt/4/twzn4yUjxc0332wcP378/F//TmgQMz542bQrVvKhxurAZ3cfHrug9Uy2ZM2KFrFoXpTs5BRzZsUZHPPIpTSOYzMwqfjkD9qoXFFK47XTGa+IYlRZ5PIpRvImeUeCkEjhL38/X5H9fAbzfOiQIFwdJtgQh2gEXVGGciVqeAJvdISAJRFSgRFEp6doicKFS2uRpsVA/wRNtTEqKxLsfHaS7HiWyy6bh5IF8ey+kUqhxUXLFpdvCRS6Om6+emXvTx45/sc4lHLTpk1GV1fXi25xXjJSfPotM+64cl3TosxEtm/W9LLg9JrKwA1Xr44uWV3q7ts38Bsv5OabMaZuvOKKmkr3a8lxfeORjlx47ty4ePmVJQx1ZznVm8OzobY2SFl5mO4+m2za5QePdHFsLMWy25fSn3epiQVZNa1AaUkpUgoiQcV40kAJB8tSGIaHpwUav+7yLFHOTudaawwh0VKjQ5pAjYVVbuJmQlhGKTIYQI2N4I2NILAQmTQtMUmZCQ/tmaI8GiNiBaipMNl/eJiFqyqZGJ5kVn2cTReVsX9/QZ48MVVRUxq5pqmSWYvnNhx5aEfnxLljcfvtK61rrx1g61b0ypUrrYX14Xh9NFgyqyJQtnR2deOt1858y8tXxK9evjz27KPPDjnnfveF4tcfkRcJu76z5f6GxuAVg30ia+QLqiC07XiOmJwIHBxPp093d5Od0xKuSJQZdgHHGRu3+6PSKK+skLcdOTVVGjBDTK8PEi4NsXJpGUKkeXzrKDMry0h6WY6edDkzkCFgwdd/dhy1pJaZb1lOx+kJGiot5k2zqYuHGBuFSaWYzDtEcKlrKqG1TdM+lMcxJNIAbL8eU2vl+xvFYl0fAqkFJF3sXkmmx0Y4oD0HUkOIsUm8VIbLltbwV69qsQl7yTNdhbKOHtuYMy1OedxAWwXWr01w7BAsXSE4fNxgOJ1jZDBJwAnr2Qu8M+3dzn0lwQoVCtkhh1you1c3pW1rNBrALY/rltqEOaelvjJoO3lp57Pm9AXlwaH+sc6H9wyuft+/Hn9RcxkvGSke/+IVXx8aSb/5wZ0ZxzMEZtA8jZs3LCPSowwpy8N6yeLpofLkhC36kwU2Lo2p0WGHoTEtNywNUVlXwS+f6MbC4mU3VFFZqdmxM8WBwylCsQC1UYt43GL3gRH+9b7TWJfNILCyjqznEQ0LXrZEUmVZ9KY12azLsSTgmMxtEJzuThMPSz/djaBjxF/n8B3O4hQv8KuyBaA19nGbQr+EgsTDRSgTIwJmYhJv7xkurInwxiun7W5zYu9ZEMtcWduYuG18rFB//OSYqKoLc8lFVZzuyJJJKQZGslx1RQ3xuMGeQzme3T3KwgURHROG2HEoTVOTSSrpsbfbw9PS94u1IGQpETI9pDK4ZE1Yt5QGHz/ePvSyN/zL4cz54/9C8JJNH7dePr3Q2Z28pitpHdo4L1J/sjPTOpJm11TO2Z3LON0TSS8zPpUrWTEjmti8vJT9x0bF0IQUy+bFmT7XoqZWovKC0kSC4eEc9z06QOtJl4UzErmGGqN9e1tm28BIruXJvcPWaGMc44JmNIpF02BxDQxPwiOnFQcGoGNcMZWFbN5hImsxmnIpCRpM5QU94wYKAyEcpAAlBdIDN2PjDWsKpx0KwwVi0Rj2JHgu+LGogVYKEdMEQgajp4a4fFnLYPvQ+JemKq56YOvWnd+rTBht65aU1GVsXfHAI8NmMBCjpj5AU42guSGCMARjg5P0DStGBlwRiSk2rw7R25dl+0mPsaRNPq90JufopGMTUkpcsCBmT6S9hypiOhEMxz5540e27z9/7F8oXjJLsf1r11y4Z0/Hz3+wV+24dnlszuZNs5pDES8ZMmRGYUilCIyMp2PZ8Xz08LFBFsytZNECk0PHoSJhsGaNwLYlTz6c4eCxcS6/uEQ7tnuyZ0z8Q1uvvePYqezCNXNLv//Zn+wvC17SQuTCGRQKLhUlHuMpC53X5E4M4XWPo4rTgkCgtURokOKsdZBgKMLLapHTStGYCBv0hI03YpLqLDb6BDw8T6BV0aIIAXgYFoTLHLLPHOMVC8sLaxfX3/iurzzzYHEYxMffuayypiT06tmN5odHR43qZw9PcPH6CtYvibJt9xQn2lLU1se5ZE0pP3l4kHh5kMmRArNWzKS6wkPIIDgetg6jsqOFPbsHvvDUkdwjt1wc/NrsGbP+at2b/+vn5w39C8ZLZiluu6SlZfWGaW98YueQe2rI6F610Ju+etWyeElFaWl5OJtICGKlZW7g4YdGWLysnGsvjRGKxGg7OkE+mSUQLuEX948wlSlwxQWVQxOFwL898MTIO/7+Wwd2PnN4IH3b9Uv+rncgtfbAZEHELplFMCoJmCZjWYWXd/GeHSC4u5vFWrEsJpltSmZJmGV6zDQ9ZkjFXOkxQ2joSTNyagrLCKGtII5XQCNI9+fROct3SJVAq7M1GIAoEk0FcMtsxPgkERdj4bQZ0VlV6me728c9gCd2D2Z/sa13T0NF/KeL51THF82qmLP1mY7A8Lhk4YJyhHKYvzDC9GkB5swt4dTRJL39gks2RplRqamImTRMm0FdeZgAo2OPHip8pq7aMm65pO6VyZy67+s/P/mityK+ZKR442XNzWVVvO7xfeO2Uwh7G5dGaudtfJVp1VyFUd6CowzyU724tsmWSzQBojhujoULY4zmJd+/p481i8uYVRs9srN17NZvbTO++5PH9iZvXrAgsGpR/SW5yfzb79tzplw3xSjZUE16qIBdsHFTAt2TJbe9i9uWVfOWGxp42/sv4rrrFnHN1fO4/tqZXHvZdK67pJFrr2jg6gsTxNMee45NMtIzhZ0MkR+yKPRqSAcwlAStEVog8TvNDSFACyQGEggETQK4DLWNies2JCp7J9RX97YN588dj22HRibOpO2HSwm0blpavSHjyPhDj3ayYWUt82dqCqEGQlHJzCZJ77BmWr1J6YzlhGbcjFVzLTJUTqp3W2rfqew9ltThixbEb5iacu77j/vaXnRSvGSVV6YZRkpJSdQKe6YRMaSHnR5HyBpkaCUYAoM8AakIWAJtZRBGhF88keXpJwa56oKaNBif//qTQxe994v7t23dutW9eWXdtEsur/n3OZXyp4f6x2cOJDMEDAn7xsnuGCK9O4W7awT34CgqlWVeY4TmGTF+/K2dfOHjj/LFTzzEFz7+OP/8D09w18d28NnPHqT7VA4rJgkZCp3MIYcnsIbGMYeHMcb70BPdiPE+GO9Dj/Whx3tRY73I8T4Y60WP9eEMjKMCJo5SaCFD41n1XN3ludi6tSv/ri9u+/FPdmcur68KPLBxXZX93YfOsPOARKZHEI6kJCSIWw5CKJBlmLEVICW4SYQ2DF0gYiIjnqekFi/NQ/2SHBTg2g0zWzrODLy2Y0QGJnN4m5bLksZpVaZ2NcrpxRs9hJ1KMzycp2WmwHEtfvbwBMcODXLJ2uqJ9n7v3Y9va//8fz7cmga4feVK67XXVX/2cF/yTd9/pDOAlNSURggXXETnFKm2capzWRqdPGHXoaIkwL6OKbp6Bd95rJP2UUHriOZIV5a2UcHxwTxbj07y5JEp9rblsEJB4jGLiCowNdhPg2FTKW0SXo5y8pSrPEE7TXJwBCs3Rb3lUKkKJMiRHp3A0ILC1BTD4/nAyzbPi1RY9qOHuqZ+Y1Lq2SPdIzWl4QdN0xKb1pQvvfexwaBtS2bUOxgITrYVaGg0icdDGKaBLvTjTR4nNdyXf/pA5ilT2o3jw6mL89nyR+5++uTh84//QvGSkeI110xvHurOvW7atMrQmd6MtWh6IhQSoyLZf5zJgZ1MTYyTzgsmR1JU1QT4/j2TDAxm2Ly+qbd7KvPuHz4r/+vnWw891yhTtTRqLaivff1d3zg4LxIN8dl/WM+tr1mBaRh89B2LmUh5VJXF+O5XrqWuupSrNjZw7bUL+OYDJxmZKvDpf7ycO25fRTYJFy2r5pXXtPDTRztYubCOD7xjDcEQbFrexFWb6nls2wB/f8c6WloqueP1C7ny0pk0VYW5dG0LO/f3c+c7FnPdhrlEo2HefNMcyhJwaN8wTkAyMe6IeZXhGVWVwZ8+eXjwvy2O2X5kOH//jp4nt2xs6d24xNq0c99EeCipaGkJ0taaJ15VhlJppvqPMNV3gPGRDsaSU2rngWT//AbrslDInBYWmXv/a1vv0fOP/ULxgkmhtRZ33fXrjW1/+Zrl0063j7/2iotqgmc6BoNhKUVqqsDIYIrJ/gIjAzlGhjLE4rDzSJ7R3iQXX1TVcfx07ua3fmL7Y11dXc/VIgBsmhFJVJWU3P7I7r7GsVSelfODWLi89592s2xegnmz43z33lZefW0zX/9JG//18+O84/blnO4YZdfBIdYubaCs0uFvP/k0zx4boXPIpa9vhL971zoIKT72xcM8uvMMbR0ZBibTdPfm+Nm2dtbMC9E1kuefvrCXgcEUW65q5pot8/nrf36Wh3b00HZmgo++cynDwzYnR10cQ2FmbWtRU83kuoNdW7f+9lVPPeJ0Hi/xyts3rWq8dO/uiUhBhiiLmPT0ZBntSzPSl2FsKM/IoEtvZ9p0Hblkw4pYS9pVelpN8MffeKDzxPkHfaF4EXyKjwp9552/dpyQ9vSMJsHpnjRL50SYMy9BOqdorI1QVx+isT5MTXWIPccEp9tSLF5W0rv3cPqt7/iXp/f6lS6/itkNzQu2HRldkfXAw0O7Cs9RVIYtyiyP/sEsnqdQuTylAZhRF6OzPUVf9yRKuzieQ12J4N23rOMtV87m6R2d2Ar+62dHmN1s8aW71nD7q5cynsriKc3RM/04tgIFBjbpXIHdrcPMnBZhdDTDqa4xHNfjQPsoR9uHqa+zAIEZj7C7Z9yMJULXfn8W1vnXcT62bsXdPjL73mND9jsvviQxsW/XBGPpHDMbAkxrjNLUFKGuPsDgZI7SSkM2lYvY2AhGTNhERPQlSSn82s38YyDuuuvXbiImdPTBrsNTLF9Ux9btfaxYVcrSpUGWLg6zeEGM4SmX0dEBLr+kZvBMr3Pbe7+48/Fz6gkEID/9thur/+32K+bVV4T/aXgkGdC4IEDqAPNmh/nwB9fTP6n4wrePYxdsyOe49RVz+fxHVvCz+9rYdmACgcBz8oyPjvH01lam0nmE1Hha8OD2cW69YxvDQwXe9Mp6vvu5i5heE/fzUwrIOQjXQxVL80Qqi8hmMTQINAKFaysCArQwMarqQZgYTj6xuWFW1Xmj8htx9913ew8de+zHx0+pD1y6vjKzfU8aFRAsXqxZvMRi8ZIQqxYGOXAyz6plpew5OsrApCV0MPOCLf1vwgsnhbjrN5rHva3JbN9UrrBhYZCfPXiaBbOilMkcQloI02bvySxP7uzk6nW1zs5Dkx/++S+Gnq6pIVJSUlL+ubdde8uP/vb6D331r675ZHdn38M7j/U+/Ytnuy7Y3jqE0gqBgeMUaDs6xQf+YSvv+dRBukdSOELjFLL85/f28ej2Ht70inIWzoiBtFAFFzftcKAzyXcfamfD0hpmNpRx8+Z6BsbSvOdTu/irv9tNVdiluTZMsUIPN1dAZfLFXhDNQL9NdSRPXXkQDMHMyjDzWuppP5NFeRqlAtie4MDJ4ebLNyz9yrc/+roP/uKTb3zXx2+95sLy8vKSZgg1Q2gWBM8d/7vvxmvtdr6fLoh/23JhmXP/092MpgwMocF1McwgS5vDPLlrnM3Ly+nuL3inR4K5c4b8RcNLYn4AXr6+pXnL+uqnykrNlmOnbN58SxP9vSnmz4oymfX43Dc6WDW/mpMdw12n++zvz5/RssVxcw0BYVvHTqdLdrePSnBE0nFF0lOEyyJk8x7KlUzD4ZNvnEdpeYRbP3uQkckcSMHFs8v4lztmcs+T4/ziwAif//BiuluzfPKHZ3jHy2tYPj3O5+4dwRLwlhsb+fuvHueWK+sJCpO7Hxlkw4IEiekVfOobBxmaSNMQL+ETb6ihICz+7jtdDKU86ssk//y2WaAEP3tsnOuvnMGe1hG++YtO7ICBUVWB09tHSCsq4mGNFjoRhNdtme8alsh5SioNWuJ6vUPOg67KPhENBzKeNvsPnhg8SURFX3nJtO8YOXNz+/g4f3X7XE4cytPeN8LGxRX84OFRls+J0tOV6nn4sLfpvt2Hz5w/9i8ULzop7rzzTnl6x72VG2fqW67Y0PKJnz81FLrhknJyjqD7dBrXgI5Rm/5xxcREkvauCWwlGUzmGS14eGg8pYjOrcOYXQIigBmSuLUh3DNT2Lv6CI9kmFlTgqFc2kcdRlJJDGUwszZBWVhjK8HJwQwVsQj1VUF6R7M0JAyCAQPPNHxtCdvlRG8SPJjZFMUyDISnOTmYIpVxUWjKo2Fm1sZwtaZjKMNkxkYiKAkJ5jZFMA2DVNajtS9LwdNI00QZCqlB+QnPYpOR8sVQtN+cDBJLalqq4oQDCi2FXtBYPbm0uabDkdpxXdGyeXmk9vE97WzY0ERzTZjSckiEDLoHNN+8+zRbrqpKHWvzrn/7x7c+df49eKF40Ujxzi2zgjMXNtw41e9dKZ3CDW7IKTncNWkc77EJaEVGueApMnmXTMEfMVkXQ1SGAQhWJwjPr8YzDRASLcAx/TDfkwJD22htEeydYuqZEdy0W5xKNCqTR2fyKI0/8FpRalksrCulJOj7NwK/+8s0/eKY4XEbxxE4tsNYwWEgXUCLom5VUZgE/MUvhUYK/OF6bt1DIhAoqRDCRCbKMaprMCzL/4wUCA2u9FdbpbJQhov0XITycMeGIZXETib9sRDC91OEQAjNpgW1rJtfS0tDiGUzPcIVQRpqw0gNP394gqyHbmkM/7BzzLvtTXdt/ZXs6QvFi0aKj9+++dKck7777kd6yyY8FzdiECzT1G6cjmu5oAUjmSBKGH4FlAZdKlAhi+dafbVfHaWFX9PgCVDCwNI2lTELBbjKJjVqobRAe8Xc0Bjk+iYQSuBNSRjNYo4MMj1i0FweIhBQSEMgFIRMA9MS9I66DGdsRrM2OS1JSQvR0ICwAv4xta9DQdGBRIMsprv9k3VA+MI3AgPDsHAJIHWxsFd4oMHM56HgF3MrNGY6iQpphARsGwyJ1VSNJ/1eE4p0c7v7yfdPUBYNUBEKEwpp/vptK2mJe5SWKb7xgwmuvqQyOZSZuvGWv9/9hP/NFwcvGik+9/YLbvvBU91fP2nblF09g6Wryim4inHPJuqZONqkY8TFAQwESiv/6dMCjURqhRIav7ZFolB4UlMVhdkVEtsWKG2xYpagYzDH4X6DsTT+U4bG0gIFOJMuTIGcGscdTJE+nQTHv0E+/LDCUKClRCYSyJY44ZkJXMP0U8pn+z2UgLygMOigJk1M5QdZZ2s8BT55EAJPeuC4SNsG18Z0swgDUDYibuEFtP+9gIU1rQZlCcjaCNuv8TGUL4UAGhRYdh5hmahCBvvkCNqTkExTZcBtNy5iepVGuYr6xsQ99z3S+dovPNT+ogm4vmik+MwbV7/2nh39322riIvSLVVcvDLC6ZE0x7ujaOWXILgChNBYCJRSCHFuRFWMarVAC4E28yyoNVnbINnT7dA6YhE0Xd61Kc5ETvPdZ9JkvSDgFp34otkX/pMmlcJxNWJK+Tf4vFpMA7/hVwmJiCqIKaTrE0II/2kXwy650wUKGX/xyywJIwyFFi6e56HHIFRQ5IYHEV4WQ0hCNREIaGiuxotaSBTalCitMUazeD3j/kl6GntwHLKOvxSvNSD9c8VAG5rQtHJ0xPRnq7oyQsIkNzAObaNcOT3ORUsqWbsuPvzAY92X3vXjjhcts/mikeJTb1p3WftQ5hffefZMOLFqBokLS1k1K0ggbLK3y2Fgyp8e/Nn47GPrN9WcLYMD8IQgZrjMaQwgNJyZUFTENLWlFgFtEzCC7Ov1GJ7SGFr8GinOQgNKaqT2Dff5MDDRQvlVVFJgeIY/pRXPw1ImBdcBx8DwJEjwLBcGpzAKCp0qkOtMoSWEZlSgKwIICe6khyi4KKXQbSMUJtIIVbQ9toeXsos5D5DaD3N9nP3LGqn9EdICDK3QUmKUBDEiJub0Wqx4kPyRQeqV4qvvm+tZodKPPTZ83z+8WG0DL1ryY9m0aSMVZSyOaOa17+8X6YEcfbKEWJlk1fQwjeUOUykHVwVxpSjKARiI4mD4BTDar4c0NFN5l74xQaEgmErDwDj0jAq6J1wyeY3wPH/UtHjOOQRAeM9Pzn4TaFEx13+hfXkBoKhcIzGUgRZnnUvlJ6QAYbsYk2kKrf04J/pR3SPIPBCN+39zdjlWUwlO1zBOxzhe1zi5g73kjw9jnx7BGcvgZmxUzkXlXVTBRenndTH8jnbfSDxXCaj9FgTtf8S/JK1RBRcv4+AOTCLLSjETEcY7Brlkab0UhtWQGWn4zsO7ul4Uh/NFI8Xlr+5xG0LVqy5b07i+qiQsTh3qJXl6gv4eh95MGMsyaGiwmF7m0VwmyBZsPOniagPDr2EB6aGEi6Mlec8q3jyB0qCReBq/+kn79uY5nC3X9x91nyjFOV+c5Ybw6y2fe7voMiihEXiYeQ8chSxovBOjyJ4k8tQE+fEsoZpyAjNqMWoiGFVxxHia1MFuvI5RnPYx7PYJVH8aezSDyiv/RivfWT4Lrc9agl+VY9S/y1gLfPJIv45DJiIEyuN4I2kiuRzXX9TIeDJfUhM3jv/4qc4XZQp50UixuWVBzdpl0z50rNupv2p1gqs2z2GkY4KeQwNMnZxksHWKEWHRPaooj8KqWSXMqlIoz0HIAolAgZhl4LkGGj88kxQjgOJA+hblbP9n0dHz3/R/as6bSvzvKiGQgmKNAmgpkBICjsIcy2GN2SSfPoXbNoLqGAUNwZlVmLUlmFKgtYvqSzP55EnyB3rJd4zjjWbxJmy8KRvlKjQK77m/raEYQfnT4/Pk4DxSnD/tnQ8hAcNEWiZmfRklc1pQYylEdz9vu3E2L9tQzjPHxo2VM62qVYvn/PT+ZzpesMP528/oD8B//vWqTWWl4QeP9jrhpoCLoySrlldz37M97Nw5xr6BFMmARpZFMedVIaMmsemlNNeEMIRmTmOAmGUzPKbJYhCRaQYnJb0TFhoHITQKgVbqORshZFFYBIEUPlmU9hVvDV20Dvg9HLUVYSIB5T95WqO1IpXWtB1IgquQ8TCOXcDMCWTKIXm4C5TCHszjusXQ92zuu/jk87yF/1UUHerzyXD2+8LXOTjn98UpVAhfVQcNKKQ0kJEQVMWwyqKYQmL3jFKhXe54xWzefH0NsbDLd+9LM71JjGTc8FU3vv+Rfecc+Y/Ci0aKu/9p8wdzaeOT0ZjEVR6xsjhBleWhx4d42UXN3PNkD6c7x+iZcuiYyuIUCgTmV0PcAtPEmlmBSlhIYWKWGKyfFqWpTOPggqEIBQLEDI+KcAApXJ8QRY/ElP4qu9YaVxq0j1i4UuHYGs+T5AqSvV1J8g5oISm4CpnysCYdCm0jKOHgTuZwu5KopF3MgfhhsX/cs6v4v75U9NtIwTnk8f/z35CimJuQQqDNAAFpoEpCiEQEsyKOlcphj48TyRS4aH41Fyyv46pL4gTMMCOjadq6U+Rd5cypK3nvxnc+9u8vdC+zF4UUt69cab3mdTX7dp0cWXzrzRFs28ItCE62a3YcHKGuJsg//mSC6liEmpCLJQt0DiWZSNuMJfMgBVZJEGUZIAWhmaVggmH5pjhQYVC7tI6SsKYiaiGln8kUZ6MXAUL6VsRRcKjbI639TwRTLtljfb7vgoeSEsYdCp0TaFvhpgugPN/XOKtxBQh9VrLEf4fi+78LZzvNnr8rZ78lnhtuQTErakqMQBAtBYGSGNq0ECURkBppSfRoGjGVZH4iQkVUsmhuDReuiHC0bZwLNtYQUhptBUlNujy9Z5gbLy75fnui5o2vfOXzuhh/DH73Vf43uPPOmwNmT98bx6YK0wPaq1k2q/T1D+3vt973+ia/f8KQfPNHHdSX17H16Bme6jZxXf/GBJVien2IJbWSdL5AMi/YeXKQbMHFEH4M4J9YUQIgFsCsL0NIhVDiOU0JIZ4f/rO3Qhv+tw3fN0PnHbKdk0VP1texFFr6zqv22wbPTWk/f+N+Hb/P43duj6qUErMkDobhf1sWLY+AQGkcAgYyFsUxwBhJoj0HbzKLN5VCC0VFKMQVS+qY2xLjQK9Le0rwsiUBZpfnqJo+nYmBNFZMInF5bMcwG5eWDbYNm98ujQXu3dZbse9c0ZQ/BL/p2n8vfOOdG6v2tI0c+cWugRql/Qgha7vEIyG0v30KmXyekBUkl7fJeaoYNQgkHgiTRCSAJVxsJUhnHWyF35SjJJ4wMM628RUV9X02+Lfft9Fnn+Dnn+az7/nPp/9vf5Wi+Dl99gx8xRrOcuFX/iF83/U3sqD43nMOpD8ViGKU9Pyh/L9rJaJgFf158XwCTQkBmTzacQGNsh0/n6Lxp0UhsAyDikiQgoKMpzFQzK0I8Ve3LaKkXLBxseRER4x//NeDHOxLEjQ0gaCpb1ozs7c6Grzh/d99+sDz5/374wWRYseJoePff7K/0tU2hmEwtzRCKCSQnkJrAyl9r1xr/OylBi28YhJbYAqTE6MFUoUCnoAFlXHiQQ919ol9ziL4eQ2lNcowQWuODKSxAiYzSiyQAuVniIrrKMWnVWhfgF375/AckYpTA/jve4BWHhkb+iayuNpAS7+QB11AC42JJmQK5lTGCFsSQ/p/y6eFouApjg1lcFwDFxulTJTwJQuQ0hd5L56CT1qF9mykcJCYBKWmKRGhJRHEkP75KQ3akgilsZVkb/ckjvaIhE2uvKCet15Ty19/sY3xSY8l8ysJSYvdp4axXMUdb1z/iaHAzz/8xyS0/mhSPPrJyxIjw9k9//yT9tlH+9KUBRWfes0FXHTFGoiX4ngGQrgI46xz5v+U+IGwArJ7d/CWL23lWO8UrtT868uXsuW1r4RwBKk9VDF6ENJAahdPBUEbjO5/iOv/4SEW1oT53DsvJDxjFhqFIYrL01Kitem39uGisf0VF2FgGBqt/ESWVr4lEYRxcnke+cWD/M09JymoAEgDoWxMFEFDc82ieq5Z18Kq67YQrapACl/L289HKPK2puNUP0P7Hud7j5zkqTPjOFoCIbDCPjnwF9S0BOHmkF6GkCmpCQluu3YRmy9dT/PS1UjhT3NoUZxOBXaywL4Hf87T+3v55tZTFISkpTTCVM7l9ivmUtpSSmFkiM6JUu596hC33bTwkdyU97J//cnOP7gQ51wJ2j8I2//msVTolhUffcer5n71iz8+ETvRm+XzD+xn/ZWrqKorxyybQFpHMbXfJS9l0RPXoMylOMlpHN2bQwuBKzWaIBkNVkRQNi+AaW7DEAW0Fn45nayh4M0jO2zy+LEUWTTSMCidNYvqi6ZhkvQNy3OKuRohBUr7S9i+gs3ZKcdAi+e79z1MVGYxkYcfQQsDKRw/qjFsVk6r4EOvWcPMdUtpXNuE4R5BF7YBxe8Lw6e6SFA/o4H8onWsuWwJv3ysjS/8aDfdk1m066KtKEKZ/uqGk0aQpz4S4m0vW8jrXn0VJQvKMCPtqOyPMUXB1+3UvuKOJoBZt5Ar5l7H6vZhtjxzjLu+vI19vePEQwGUnScY0JTVxumeUAih0ELHaqfLP+r+/vHJq02bjOXzwmtWzZVXJWIx69mjo0xkbLY+cYD86XbKQwkqpzdgij0E3AxSTWDqJFJN4hjN9D95iLd/7GFOjjrYxbn5SPcYNSMdzJ3fSLz0JOgkpp5EeC6OXErXU5388FsP8YWfPUvaUbQkwtxw+UJilaeQ+X1I+xQ4bWC3IexTSMf/KZxTSKcV4ZxCFM4g7Pbi79oR9mkM5xTKns3xp/bywLFhFApTaDZML+cTf/Ny1r56OeXV3RjOUxhuP5YqIEUBAxuDHIZI+dfm9RBIDFJS7zJ3+YW0hGzUeJJTIykMz0BL0181VTazSwN87G2redV7Xkt5cycBnsKye7BIImUGIbIY5DEVGCIF3iBSH8MszdC4bA0Ly6oYaB+gbTxHMGxBBs6cyjCYdxkYH+faNbVjEV34wf3PDvzB+7D/UaR48/Vz4xtnB/5yUUv0zmOnsokDJwpcs6GBfadH6Uq5bD01TnJ4nHUblhCJCwRjzztgmCgrSHa0nIefOknneBItNJaGcMTgpisXMv2KRQTFcaTwQNgUzEsYPlrgox/7Md95spWMq1ACppcEue6KRcQas0g9jpB+1ZMoxv3C9+2KL+HP61IjhZ/hkMX3tZR47nKOb93NA0dGUVozqyLCp99/BYtfvoqA/QyG7sDARoC/ZgJF30AUQ0z8dVevAExhBcaYNm09pa7D0bYxhnIZ36/xCjSXGbz1Zcu44b1vJhp6GsM5DNpB4KGwUKIKTTmKErQZR2in2L5YwBBJLIapnDuXuZXljHWO8tTxEUZTBfqSBU53TrBlfTU3XhSLxGsaRwMqcmTfqYE/SNTkDyWFuPM968o3zy//3PQa46+27k/FZ80P0TPqcMcrGti8bjrHTowymnbpGxllQ51F3ZxlGMYpv+uy6FkLncFMzKH/eA97T4/jaDC1YP2cWl75pouobcliOD0IDXmzjlx3Gf/1tcf55rZuUq5fgSVwmZUIcv0VC4nUu4BDgeloUYJHGR6lKBJ4lOKJUhSVOCKBY4XRRNA648cjQqOMOtITFZx+Zg/3HUtTEhJ85LrFbHzNK0iY92AygvRnJrSMUhDNFNRKnMIFOMZ8sKrR7pjvo0iBRGF5LiIySdP0tYwea2dPxySeVhjC4YpFFbz7jsuoqGvDVCeL05uHJ4J4xlWkhpYwdKaM8d4SPHs+gbIFuHoQQxeQ2gTSmPYksdqlxCeneHhvN70ph9pSycVrqpndHOb4MRGsrQpfsnJxdO6GRU3b7tt+5vfWsPiDSPGJt69dednqhm/a2fwNOw7mzaYGk43Ly2g/leKC9SXMnhlhaUuCR58ZYCRTYKRrklULmqioDSCZfG510HAddDjKrMr5HNp7iu6JAlEp+Or7NjLvkjUEnUdBaxzTQufX8ewv2/n7r+1grOATAjOE0DYzSoNce/lirOYGDOYwciTGeKtgqjvKVHeUZFeEqa4oU11xJroNMh0BsoX5JBqaEIVWP52sBZ4xl+FjNt//xT4O9mdJBOEDb1pP7ZIQUh9+LhOpKcUxN9O32+Bn//k0u+59mDM7O0gEGzBqVmFYU1hqsphUU2iRh0gLU70erZ0jjKTyVEWCvO7Khax7+VUE9C4MlS+GxpJCaBOTxxX3fONRPvftB3n4wQOk2k9TH68g3rIE6MfQOYQ2EDKFiMYor1jBqf1HODOS4oOvXkhDBaxaU05ICHYenjBDiAXLVoZXXzi//vTizbf2/j7Ca78XKW6+GePWqy+9csOC+PfHBycWH29Liw0X1nOybZJsVnDZ5mlUlCp0OEIikCebCfHMsWG6x1w2t5jUbbiaoGpFaoXUEmXkkF4Oq3w5iZExth8b5J1X1LDmyhWU1R3BUOMoFEo2k+mr5ZOfe5jd/aNoTyCMMNoMILwc0xMBrrtiJWbLhez80eP814+e5K7/eJIfPniA7z94kO8/eIgfPHyEHzx4gJ89dIiKEsXq6xZhiBMY3pgfCekwtrOCY0/t5EsPdjOeLpCwJLdes4zyWQ5SDRYtnMQOXUvns9186O9/wtefOsNj7UmePDHAnl0dzGpooGXJerR9BkPn0HgILfCEplLXcOJwN0f7x6mPR3nXVbOpu6AGlT+KoQsIJXApwcmt5ntfvJ+P/WQ3rYMZTk/m2N6VhIlBljTPJtoUxnD68d1mBSKBl6nhiUd3cmQgzeUXNXHtRTWcOGZzsHWKlYtLSCbzYnSY5pn1oasKI23HQw1rOn7XfmS/nsz/DVhRumbL5vnxr7f1jjX1D2fFsoXlDPamuOXNq4iXhti1d9CfDbMTROKCxgpBJBQAbP7zwTam9p3GNef5eQftYrgBDC+LFT7Bygun0xIPsmBRNRWLKjDsAbTSKBWiYM+n/YknOdY1gnYVSgbQMohQflaygKTQO8T+r32Xf/nKk/zbYydpT+U5nSpwJlmgcyrPmcks/RmbeCLGsg0rCAW6sXKni4trgryswm4b5ks/Pkb3WAaBwFdHNhGqgFYeaAWEEU4z9927g8fOjJG1CziOQ6rgsbtrkKcf+iX5vkEUFlo7oKW/dYTKYArDt0jgRz2GQCqJobIoZaG1QFlljJ8e5YFnTjGZU3hYKGnhFArcu7eHviMHkYEatIeflvcEWrhIGcBAgw6gbcnOA5OMa4db37sZFYwSjhoU8lmxr3Wqbsni4H9et7jv9TfffPNvNQa/lRSff+eW4H/8zapXXbWp4Xt7jrQ12GmLlXOamEq7XHbLZuqX3MKFN7+K2pYa7r2/n6Sn0dJCSMFNG2cRDIfYdSbJ0/fuJJ9txBVnN28DNJhON43rN/P5v1nDxptfR8Q8XczYKJRsIXOsnw9+6SBt4xmUlEgjXEyt+NnCVMHg2f1Hues/HmBr5yhKS7QIgIgiZAxhhEEalIUM3rcpwaJLNmA4J5HYGFqjtcSlkuFhm0nbX/wWxaSZwkEh0URwZQhXBFGeIj2RI+8pkBGEEQMRxNMSXfC3u5ZaIc6ppdDC9qUVi9lKxNlsaTGJ5gmkJzF0EEM4OErhocEII4w4WgRwPIkWLoaOI87WNhbTZqIoB21om3u3D5C2C9z4hhuZsey9XHPLLVQ3NVBWUUplVPDk7pHKNbMqvvCWDZMf+OKdm2Ln3++z+K2kiFcHV16+uuoLg8MTpWMTpVyyMcGD+7rZ/IoNlNdejzTXYJVfyerLVhIvjfPQAxMoQxMAFjYHKSuxGM+7PHOsn47dA9hGM56y0MWnQ+pxlH6KliteRri8B5HuRssCECGfa+bQgQ46MxkcT4EMoCTFZJPAFYrDw0ne/oMT7OnP4nkapSXCjIMRQZtBMEowEJiGQc2lG1CqFenl0NpEKAWyBGuykp8/uI89beP+EysNBIKcHSTvrCHv3ESh8Cps52Xkk+C4gJIgAigRQkkPQypAokyBJodWFuCB9pCqGKlo7ddxCL9oWakQHgG0sPGEh/YcZDjIvPpyTBO0ziHcDOBSFY0gSmN4tgfa8FPkyo+fHGGQVxpXQllJkGtftYbShs24VhnBsktZveUienrHaKi2qAiU8tSu8djCFvn+i2cGFp5/v8/it5IiOxA4fORE+l+rGwITOjrJI1uHWLe4nIe/v53xwUdwnUOIqcc4ffQ4wz1JLrygCqlMJAaRuCBcWgMC/uvwMD//ydPAwuI2Cq7/8iTk2ghX9GN6RxF4SDdCQSwk3Z7my/ceYyTrAWGkjvn7buCAyiOERGuDgg7iEkCJIFoE/dpuof0KcZVBC8kr17SweM0FhAuH/JkAAdrClaVMThocOD2Co5RPOC0oaMHBh5/m3g//C/f9/Rd58O+/wIMf+iyPfPJjDA5niiuoGoGLVDCnvozLr16FKCtKKSoPoQy0AqUSgMLUAgPNRN7jROcEmfE8mijaMUBppNND6fRq3vr2y7h8eh2llqbEgsZEjL+8ZS0LL7sO29mFJx2kp0BIPGcOh5+4jwcPTaKkRRST7Y/tJzv4Cwy7jWzqcY5uf5jKcpPhtKZvaIIli1S2dcK7d+vp2H/bWfZb55Zf7jlu93vTd04PcPDiRQ0rU5lMZceww/xpcfY9fYzpLcO07n+WPVs7uO6aFhoqCig8jp9I40jFoXaHkaSD6xUwMjYXTq+gZEY9hjeM1n4m0AR0vhPL9YtgXWmRc1ey7ef7+dYjJ8gWtB9tyAAaF7wcUucwtETIMFhRtBkAGQQj6IeZgKkVmhTza+K88eUrmLaqgpB7GOFLEALgGMs5uT/Ll3/0DGN5F4wwhhZkvQJPdEzwyIlx7j85yX2t49zfOsn9J8c5MZTGLX5fUSAiJZvmVvLqN11GSeQoAXsMgYPUEVyp0NFL6d4/xP272mgfyZKxbSoisHpuHZGKIMIbRWqQysVUpylvXMCamTO4eGYZN66bzutvu5a1167DCu8ikj6FKz3fKllVpDIz2Xv/AX55eAgtXF53xTTIuQz0TVBX3cWeX+6iq30UMxhnoDfFNReXJscysTsPtumP/dUnHpj8lZt9Dn4rKQC6urrUPdvOtJeHwk9sWlt/YdbOV5/pzIq6yhiP//IkyVGHTRvKqCszmMoVMA043p7FceFAR4F+W6KyKVIFxfLmMNMXr8Uwh5Aq5wuYahDC8xNVOoCKbqT94RO87TOPMZDMo4SFlmHQCqGyTCsN8Pm/3oKF4ETvIIZWeCJQTEUphMDfJ8zNY6DY0BDl9jdtIlrZhWUPPpfE8qRFMj+fu7/xM355oA8PA0EYLTVKK1xPYCuBowWOEjgKHM/Aw192N7TCMBSLG0r41F2XUTUrRCh/CCH8Ki1XKrSsoeAs4OFv/5KvbevEVQqpBSf6M8yNQdOqq/xGJW/MX75XWYTdR+n0GC1rG5mxpoq6JhMj9xiBQqfvC7kST1aTE1ex/96tvO+rO5hyNOsWVPGRO2YxrTbOsdZxTuwbJJOcRJgR8qOjbL6o9lTvhHjnlnc99O1Hn+34lV2Tz8dvnT7Oxcf+68CJbXszNzfMjm1buMBk654ByqtK2LQmws9+OcjQuMOhQzZ5LYnGTIS2MA2FaQUxgzGStuILPz7C8P6j2IEZfhKrWFpnaNDaxLUqSQ808vSTRxjLaDwhQIaRCrROMqsiwOuumM3Vr76BN75qJZcuqCJgAl4WA7eY9QOUi9IuiZDgpstriM9vxsp24onnlwI8YxZD7Rl2n0nhP3uANH0CGgn02ZeZwDMTeFYZnpVAmVEQEiVgbkWEj7z7UqatqCGa24dQLsL1nUfDiaEDSzj10Db2nh6hoD20COPJMAXt8s/3tvPjf/oGEwOl2NHlCBukY2DoDEb2IOb4doyxrRjjj2K5UwgPPMcipRuxAysY+uWTfO2e/YzkJFWlAf7xncuJmJKfPTbKxrUxIhGXfceyhIVi3UUNx4aS0VfuHHv4Z77H+9vxOy3FuXhwz5mx2Q2zH5hRa0VnTo8sOnp8yooETHa1ZVixuIyh4QIByySbd0hNmRzqzDCUlxiGhVdIM5FXVHk5Fi5rRtjjiLyLm9d4eY3KO3i6mYn2U3z5nnZah9IoAkgZRJNmcUOc979uMa9521Ii8giNM2u5dF0DaiTFib4xcnm/XlUKE6FtpC4wry7Kq65fSUVTED11GpUt/p2CxGUmrU/u5XM/byfvKDBCaMMv9UcUG5J8s4NRTNILITG8LBKH2qjBe185jy03LsFKHkTnp1C2wrUlrm2igo2M9cW56xMP8dPjw7ieABFDG76TO5VLc7J7Cqu/l7lzKghVVUN+ouiYKpSWvuMsFIbWCAUq2oLj1XP8Z4f5p2/v46ETY1imxas21/OaK6tRUvHYrhEiRoTTPXnWrqh2mxqDvzjaK2+78b33nti69ezE+dvxe1uKs/jQFx4aeezZ1vf1ZuUdF28unzraPkW+YBMUkmwux6mTGaQwcESOkjAIDJBhDDNMwXEYH7RJtx3GOpJHPeuhdyv0bg9vVwD97BmsYI7lTWUETMvPD2gPQ0sWNSeYPjNOTE4iRluxU+0EwzZLF9VSGpII7YB2QSiEcgmbcN3iKloWhLCfegq1K0V+VwFvh0P6YJjMVIJDR4ZwXRctJFqGipHN2RWN519+6AfSc9A6T2kozGs3N3Pdy2ehDz2Lt3cAd28BvdvA3QepE4qMjvHI15/mmY5x8raHJuQvx2uFJxQRYRG3NI3LWwiW2GSP9pA7USB9okDuKBSOuxROKPKtkDupyJ7yyJ3KIEcGqWg0kUGJKTQ6aKO0hy1hZAIGRmDv4RE2r4/aiaj99QceH33jG/7uvvbz7+Nvwx9kKc5i66Ep13y040jDosaDc5eVrwpqo7KyNEQ6LSgvC2FKj55eB0/nODhkgJdHpSeZljD44KunUTkb5GgeWQCtFNrTeEojbBeqFNOnRdl+cISBZA4w0VLS1pei7/QEnhRMn1HOxFCM73x1P/9y90n6JhwwfGdTCBAqR1Pc4oNvmklVJI3VmwbPQim/FFfNmM1gew8f/c9DDGcLQABk+PnCq/OghUAqG6nSBE3BHVfW8pa3LqFkdBg9lkK6AuEG8DxBrkQh59Zw+MFOPvPTdtom837FmREt5ieSRFG85sJaPv6hjSydJQkc6cYcctBpiZc10J4A6XfOqTTIqQBm2kNOpGAyS7DE4KJL51BlhNl3bIiDp9PYStBUEyeTT3PtpdWDjjA/vGNn72c+/J3DqfOv53fhjyIFwHHQ92zrOn3VirK+oGW8qromTnWFpL4+RDQq2b8/ixES7O7wcMcGiEqXt146i02XBYllIsgB24/lPQO0QmrD98KnbHQddBxJc3rUpeB4KBHGlR49Q3kOHxjlgpl1fPobB/jWk31M5BwUIYSMoaXAUDYohzmlAW64uprSZBbSILSBVBJlZaGygTMn+7l7Zz/jeRdhRFDy+aHQWoMwkQqkBkQW4RYIW4qbL6jjbbfUUWqnMQamwPW1vLVWOAGP4Joa+lvz3PnlVp7tnUIpibJC/vG8PIZhc+vm2bznXfOpUlMEWkcw8hrpaVzLxQsX8KZHmRQCWwcQIcNvcXB8y2+6HmLSxSDDnGWlNASjPH5olIOnppheXUogqPMBGfzLrUMXfOvDn7vnj+oB+YOnj/OgSys443iet/dQP7PnRSmvVdTVS2prDKrLQdpTCNemOmpy/eYE4aCH1zuGocDFwDZcXHzxc6U12oHSCYc73ryUhfVxP8eP/zS7wmIgU+CfvtXG9uPjFFztE8LwRcgQGqVtgobB9RtqKK8N4mYkKHwr4Qm0CJO3J/jG/R0Mpz2EkIhzCAHF4lutQCg0DoaTJyThVQvKefct06gKuJi9KVRB4Loa5UiyeLgtFl3PDPP1L59kX3cSV/mpeSEDCO2icZhdGud115dR5g4gOydRypcosIWH1xAjW1nJ7q0Fvvzvfdz52S4e250mVRqiUG2iHIlna5RyiAxnMTNTbL4iwaXzE2Rtm6NnJrEM8iVV4Y67fpMO2e+JF0oKxif0WElZ6cjIlMvkeIGD+3IMD9gERJCl0+oxMmOEDJN3XjGT8pkeotPGcASO1hACvSxeTNn6T5vWCm8Saisc3v3KGVREDYS2EUqCDGJ7AR4/2cfQlIPGAiMM0hc5QSmUdpldEWb1vDhhz8DLFvzFNa1w8SiELUbzNqdHsziejSDwa8MghEBIgRAe6DxIg4vnl3LbK6spqzLJn87iFjSOJ9CuxDGAGSYjgwE++s0hvnpghDEHkCG0GQVlgOeg8GiqkkyrCKC7JMKxQCkcpbAbgzixIPf8uJu//VobX94+wt2Hhvjrb7by8x9MUQiHcCo0nqfxPEVeS8RQnroai9uvmk0Igz1HR1g5L1KwdCz5Kxf0B+IFk2Lb4exEXXXkSC6lKOQVUxMuuaxNVbPFXf95goJjMKfCYtnSGGpogvyUhZc3yXke2UqFF7AplARwPe1bC89DFDTu4ChzmhwunlmNiUJ4Bb+31AiiRQJllBTnab9JWAkwPJeAhivn1lA3M4h9KoXyW0TxtMITkkBDkGceG6Z1OOu7kdL0Q9+iQ8nZ6UN5KC+LpRRrmyq4bUsVM5dUwJFhZBZcR/h7izkKe7bGTob40Q97efTUKI4HAgstI5ieQrgZhCpgKM3GRbUIncVOOtiOwnFAOyaqRHDygWG+t32S1qkCBaVwNIxkPb7y1Bl2PtSDaCgjXXDIZQT5rMJNwuSpQSIlAqVdPK0QxAaHe4f/28TU74MXTIpjw8fzVtjsGU7mOd6dpbVX4wmL5FSeY6dHiEnN326pYlqLwBkIYmdd8rYiEwEvUULv1jxebZSM9rBdie0JbMdDjArKasJctLKEkGmCsNHC9SukpeWryxTL5UEU6xccTMOksdYiVh7GTXp4roGr/H06cqaCgMVQ5wQFT/jHkL8udSkAU2cw8VhUG+ODV5Sy5uIQqSPDkDFw3ABOwcTWguxsAzD5/k+SfHP/ADnXRokgyDBC2WgvSUXYJhE0kUIRNnPokA2igBYenvZLiz3PZSLv0pcu4GoPbYbwAnGkNujO2HT3SDxP4ahA0VpolAvacYoCWwpPwaFh9dTeDz8xcP41/SF4waTYuhWv59jg6ctX16hQOM2sJkV3m80PHhog7RRYOS3BvPXVFAaSeOMh8gWJ6wmC9RZdWyf59kMTjPROkY8HSbsejuMTQzkCYyTDhrURtsxLEMBDqSwKjRau38BbVCLQQiC0C9plTW2C6S0G7lCBfD5PIafIZxTZrMaOSDp2jPLQyQnfKEgDfqW21SeZVnmE51BhCG6/tJ6Zm6pJH3RIDwVJZiWTOY9cwSVbmwFp8IPvjvK1nZ2M513QFkKYGCqNxKEmpnn7gkY2z2gsrsFaKMegkDPJ5l0KeYGd97DProFokMLy9/kQAV9tR7kI28JTBdDa339ECT+8VaDwUEqA9igRRvqu3yNB9dvwgkkB6INnBrbVVofsZ3barF8Uo2fY5tkjA4SNMJtnhoiVa3K9OXAKCEdRqBLgmBw6nOfhE5N0HEoTmg7prGAqrZhMayZTMNVpEwubvGHjNCJBA8Oz/dCw2BL4vMH3cxMGmqpSi6UXRpjqSpFJQzoL6Qwksy6eBX2DijPjNp4GifUrTcOgi/WQeeqjEd559XzWXGAjB8bIdkgKeYWbl6iCJFcriMxq4Ef3JPnajgn607bfZY6HobIEpcPmaWE+9fpmrt6SIBzwt6tEaVxHkUkJMinBVFoylbWxHRDKnwaVkL7+lwYttV90rxUoXznQ1QpPKTzt4XkSV/nrPZ7SUFC/V4Lqt+HFIAXDk5njhqkGXUex+wR8/r4z5AqKS5vLuGRdgtTxAjpTSkFrXCURCcGpVs0PT6XpzeT59tMpxgcMvGp/rvZ82SjsjCTbPUXLIsVNa2dgGhLpZYstgM9fu0QjlEvcEly2JAEEyEx6eBp/6lAGKgIiZrK1I0dOF1dECT7XgggghELqAuVhkysXlHD19SaWjJNtlbgSTKVwDYXR6FIxN87u742y90SaiohkRX2C9XWVrG0oZ21DgivnVPKB19Rz4VXTCNVKfyFLFCvvhOEv02vhR0augZN0iYagImRiUEB7KXBTSM+lNG5RWhogOeaSy0A2D9kcZHICR/nxmZC+ndOO+m+yLb8/XhxSWBdMdrYnnyyPab714BAdvWPUxSxesS5A/ZwSMsM5PGH7e4SXSPJWgK/c38me7hEKLjxxZpSnfzlCuF6C4Wtve0KglYE3bFAat7h0jkfMBI0DOAhM/ynXvgSB0AUsIZm/rIK+HX1YykIrX2vKQ5NYGGHwdJ5HDo9ScP29wjzDD0WlLr7cAqgCS6rivOGqBKVWkNSBKVwcNAVcDcLyaL4gRiGXYd5qk4/eUc5//G0dX/lgDZ//63q++P5G/u29Ddz1tmqmzYwx8nQvThYMlUcr6DidI5/VeCVF0uKBMsi1e8zfXMtrV1cwqyJESUCTMD3KgyGumF/KBVeGyPdkcHKCQgHytibnQvmcasZO2QhtEDAEOhKM/q7Kqt+FF4UUd999tzrTl9sfD8f0Q9uP4SiPy5bUsuaKufQdGgbXQrngobEaA5zck6I7BZ5QaGFi43GwTzI47mGWewhP4imB9iyUE2TwVJKVF87g+hWNmEIglIPQ5yz0qTxSSm5YOY1YWEM2hHHWBGiNEgrPFORSJlr5ZlkUZRARv9qDKwDlOgQszfgpB+GFQRt+cQsanbdofyhD/pBCDXvQB5wBo1Ni9Clkr4vo99BnFFO704i8hRJ+JztCsLsrRdfRJCXzwkgspFdcKc7BSNcIb3hrE597xyw++7rpfO71M/jXN9bygbc3YTs58sMWWjo4wgNlEp0VZPBIivsPDWJrRW1ZAM+LTN59993/b32Kd75zS/CDr9r0xvsPjv3V3/7HcZHLC2Ylwlw4W1JID8KEgXYlwhHIKhsdTrPtQIGj/ROgLaQMoZTkh4d76D8FJfMEbrFcTWkHpRzcCY1nZ1m9MMqsqhJM7SB0DqldBAp0gZKQwSWzAkCeQMrCU6KoeisIxyWRMjjaU2Ao6zuryEDRr3y+PfmsaABagmcg1VnC+NVeUpt+ueCEoDAJzoTEnTBwJgTOFBQmBflJQWFCUJgyUI5fuKuU8vdH19CWsnlgp42jBLK6WEmlQLsW6oxk6LEx5tQLLrogzIUXRFi7uhyns0D2oEQ6fjukqUzMMgezTvDEs1Ps6vHlHFYtrpno7Bx94Ffm1j8CL5gU1fn8rV0Dg188fGx0Zjpjc0FdiA9c1sziNWVMdiTRHijt4gqBkpLCmARLUBIwENpDqxygCViKI/uyaDNATvrlaa728LRNIC/IH0xx5cXlvGtznOVNJUTIg5tGqhxCuyyqKKWmCaQoUJCOn7DCnzpcw2P0RI7+7ixZ20XLYkmb0P7yVzGKUWe72xHFgl3Q2kNr7av5otDCQ6MxPDC9ouCqMtBu8TvKQ2qNVp7faI3EdA0Mz+9Sz+Rt7j85wpMPJSlZbKEb0riGQCgP4WlUNsDgThh5WjG4zWZoR5psp4tGoJSDci2sMk18SYKD2zI8vH+cjqkMLVUx3Vhe+ojT5Bw8/x79oXhBc88CCCxbU/at7z/Y2WBaBn+xpo63vbaOuavipLrTmAWBNA1EQCNDGmFLgjNhbmOCiX44MpxB4xE2Aty+ciarL9TESjz0sEQGNCIIImBCUJK3XJRnM/fSUpZX1HKqK89gKoXrOUgJ88rDvPpNzdjjGcxACLPEQMZMjLhBsNpiLGXw5P4pTo5l0dpCG0Vl3V+Bh6FsmuNhrlwZwYyHUCFNIC4xE4JA3CAQF5hxA5GQyISAUln8t8QsMTFKTIwSA+Ps7yr9DrTtRwocHZ5Eo0m5itODLtZ4gJnzK4g0Kghp3KwL6jl75a/Mal+YRQQNZMIjvNDAiUbY9otR/vPpFNv7RqiMm7z64nmjiVLzbz7wyac7zruoPxgviBTv/Yurtxw6NPAXh7qnrKqwwW0XltG8KITUWYKlEKo1CTaYBOsNwnUGoVoTU2oKE5r9R3McHU6ilCYk4dr5MS6+oZygoYnWCML10v9ODYQbJNEGk0BcYKgCiUqT6IRg/0CeTMEhIOGauXVUBPxVV0coHMPGsWxcw0brAqc6Nd/YOkDWdcEIgQgWPQj/JYREYCOVS3M8yvL6OKLM7yBzDIVjgG1qnIDEMTWuqXBMhWdqdABc00MFPUQICCqIaGREIC3FVJfN/k6XY8MppAyjtGAin2VP5wRnjuWomHKJNZg0XhTCMR1ExMMo85AlLmbCwywvUL64FMqDHHssyb2PTfC9w8McHU8Sj4Z4/dUtztiE/pgxM/xfW7d2vSB/gueyNX8E/uU9N4Wnhge/940HDtw4nLRFbUmEtXVxTKmQGL5elPDL+dWvqHloDCQdkzYHhiZQWhOQkoun15AIun65nK+ODkr783wxAvXLcQ0oxvKPnJlgMpdFSsWcRIJ42CiGq/grr77eLUJqHCTHB1MUFGCV+NnM8yC9PKgpqsIh5iRieEL5/Rs8L6AmimGl0r7oiUA8p9wn0ZRFgsQsXx8U/CIdpeFoMs+JgSTCiLqeNPpRuXqhCmbQgOZElDmxEGsWhlnQnCAWNfx2H+2LvykNZzpzPH1slNbRHGeyNrkCzK5OsGFVYqwsnviPvjH3377/8P4XlMk8iz+aFH//xuWX9ndN/vz7O4ajyimgpfDXH5ThaysU52u0P5eefSb9lgVf7RblFTUBFVpqTOUf4+y8ztmhLQ6+f2N8lXslNCgTTxSjEO3fgGJBvZ/TK4qTKF8EHAPtF7tYsedUb38FXgH0ZDGhpYuiJP5PKF7Oc0HNWTPvJ9L8fxb3Lz3b1Qy+LoWvKlDUpoi2ulboclM71yqv8AGh89M0rjSkwMCizHr+GnzlXY2SiqwNea3RChJlQW7ctICWUqMz7ei3PdMdeHzr1q2/cWfDPwZ/tKNZWRbffKIvHZUqjzD87RQM343G1Bqpijez+KSJousnlMTAQ+BhSTCsIKYMILSv/KIw8TDxMPDwnT9XSFwErha4CBxtoLRZJIzlh4z43r3fbCR83Qgp/TQxwm9XxART4kmFeu6li1s6SLQw0DoEQvr7cyAAiScEHgKljeKMa/gJqKJSjb+qKkEafge7NPCEfx0KiSckSkqUNFCSNvLWiFsY+YplhC4VgZL3SBkbEjoCrmA47zCStxnNeQwWCozaNhO2wZzmMm7YOIOXX7mQG5bXcet1pYVsyv1Ha8azj76YhOCFWIovfuD6m/IjuTuUJ6QSUphBR6M9IQzwpCk8p1BrBgKzLDMvTra7vO6WWkIhD0SAybTLv335FBcsbOBQd493716ecb3sdz3Pwy/8L67xFPdlk7JoVQD1nBvkQVHO1P+dAZ4WCOMqhLxBa0dq7etJ+dNY0Vqdo2t1FmfXUihKNBuAW1w+EPr5J+esLqdv8rTfxmgEAPGMEOI+Q7ljxbMvmknQwi0RQqVRKIXq97KhJ6H3XHUZAc1BK6IXIp2V4WD4bbdenFiaz3uyqzfNLTfMYsEcg5aaOArNp79wmI0rG+gcSmbb+7jpiz/be3Zf9RcNfzQpALHyrBLOSsjlzj3WAv7yqvilEwOZn6xeXxd5dkcnazdO45L1cVzPoKttgN7hOD9/cpibNpV6/3xv338Ob4u/bR/7/iAdhd8EGa1+r+k5n46aWl65eTWWBnCwEHhaIXXRliP9FgNAG9qXUSru6YHWCENgGiZCFbf50b4gG4bC0RKtYM+RMxwfmkKZobeo9NA3zj+XPxRlZTMSV20I33/bxooLfvzEsPjLt86mq30CJeHidaVs25/k9GmPxlqDk2dS7vrVLe/e/NZ7v+wz/8XDC4o+BkANgBoYQI2M4D3/GvE+ctvS+qHhwuv6hg3rZVdX8fhjA0ybHaX1eJZ8toQFC3zF3CPHk/L11zckovVjTz2+d3Tw/L9xDsRX/uGWxfWzAxP79g38Nx72rKAhMndUhfSSmy9fS2lFCGVYBEIhgiUmZiyAFQ9hxoKY8RAyFsCIBrCiIQLhEGYkhBENYsTCWKEQIhxAhQOISAhiYYiGUAocKUiUhFgwq4GJ8RST41nTU6U/g/RvJPW1166MvP8tVyy879FDQ+e/dw7kHTfUXLZxaeXt2w+lItdfUUFdZQgrEKWQy1GQUbZvH2P9yjidXUlsT1JZqXfP/GXntt+x9+kfjBdEit+G266aM/1Uz+Rrly4st7p6s8yaUc6ObSPMbY7TNNMiEYOWGQF6z9gcP1kovWRd+cXKCt134MTo1PnHAnjtljUlm1eEPzfep7qfPtDZe/77AJSXR41C5r1XLKypT1QEGbk0wvYdh4kvM5jzmnriq+LEV4RJrIqRWBOjdHWMxKooJatilKyOklgdpXxNCYnVMSrWRKhaVUn1ygqq1oapXZugZkUlBw6fZk9bBwvfXk9/3xTra+rYe6y9Sknjl0plf5P3L66YU3PZhWsq7xJm4pcHj3f/RrmhO29bu/jadVXffubASP26ZTVs3hChJG5SWg4mIbZum2T+HBhP2VRVBOjpcXWwShx7uqThyePHe19Un+IlI8WtNy1o6e4Yee2i+ZXW3Y8PEA+HmUya5F1FbipPd6dLxxmbuoYyhidSom8oU3n1JbPnz6wpffKJfb2/UoH86fe9rnr14uiH160pe8O0MrFh/uJ5px/aevL0uZ8BMALx9cIr/PWyhogUhotxRQOn93SxbNlcbr3yrTRUNLCx6RKW113Akpp1LKtbz/K69ayo28CKhg0sq72A5XUbWVG3kYV1G6gvr8FKZIhVxCktSxAvjdK6t4eRsUmufceldO0eZUE+z8NH+4O2GajTVuVWnKn0uef0oTdt2XjJRSWfWbqkbm3cLcxcsmD9nsd3HfqVyqh3vXz+7A1zI1/bczy9pLQiKmrjijPdHn09Ln09HgODNkOjkCgNZHbuTz+4cGaw6USnNmbMCN7vRbdv/X37OX5f/NHRx++ClkIb2mTnCU9N5kNO9bSgfutb6rn62jpWbmpk5YXVLLqglPREijfc3IhJgH3PDF6+dkXipx+4be38c/2dkjmRif5J+wcnWu0Thzqy33Uxdp83j0ojUnOt4RW+LrQ2tZYoZTCZSeMqj5zOMFA4xbjdyVCum4H8aQbzrfRnT9CfPU5f7ig96cP0Zg/TnT1IZ3o//ZkDjNjd9DsnGXWOM+QcY1Adw1YTeMqmP9dJTqURrktIIAJe9jrDy/2MWPO8c84L13KPHGzL/qxj2Os+3jn2X8Myc+4UIj7+tvWLXn/J7Ls7BvUF2jTEa66OMTTqMW95HSs2N7D8kmouvrqWN98+jSVrEsNWZcknB8Z4PBDWOiKs/F13vbiE4KW0FLdctaQ6m8/d8tDOUaW1KqxZmrDmLr9MioBBILEEJ5NHOynG+mzmzAswd2El+/aOi5GRdMOFS+rXLV1S3543m3u6urrU/ffvUw9vax3csG5B/uTp4W/f+bmHn5tiIlXNtcKI/kVAFP5944rZNbUVJdRZCmkJ8qtK6Ns7SMv0UiqWZJiUwww7XQx5xxh02xjwTjHgtdLvnWJEddCvTtDnnmRInaRfHWdCn0EJ21+hR6OES9v2Mfr70zRdUcHwgSRzcmFCdfVYwYCISN2QyqY2B2MVZ5x88gygn9nXUagLlJ+qbZqe/eFT93znRz86bgPcfvtK61Vr5ly8anb869uP9i8KxhFvekUtiajFibYC05uDxKtnEyxbibKHwGpCeCMjHWfUt/IFe3T1QutqyzAf/vb9Hbt/ZeBfBLxkluIbdx/qa2pOjJaWBgo510wLrT2zZhmR5jcRqL+KYEkdeN5zmc9oOM9rX1+HGSvh8We7Vyyfbv7kFWvtO153+ZJo8ZCqPz/wnU9/c8evTC1ecuQD5cHCp2sqI9FPffQ2/vZ9r8IyBQK32NwjMJTGUx5SuSjDRkkXIXTxBYbWdB4ao/XJcV8eQSs/QoViHaifjNLawPN/6adFlIdrSGoq4zQ3VfG2N15DVdRc5GbHf2SGy1efPcfvb9s/eHyk7Atbt+ICbNrUHFpVHrvtgqXVP3x2X9/CeElIvPYV9cTL/L3DDAOEp5HhMoLVVxGe9y5CtZtRrtKep8VkwRtevKikUHDt/8bhfmF4yUhxyZIZsbJoISJEAVcbrnYd5doDKLPR7+B2/e0XXQwc5XDwQJKpEY/6MGxYVSXuf2qgbEZt/BOv21Lz5VtvXTsbEHfd9etJmtp4/PrvfuRWeesV65Db7kVuexThKhzt75chhL98rQGUxB6Ajp2550RbBZKB0zme+GoX279zBp2MgyoKLmq/LE5oP5GlOavCozFUcd9R7WFks4TsPAkvx5c+cisNJbGEFNZF55ymvuuuu1yA269dOe09l0/7VEtZ8DN3P3iscubCcl57UwX5pMP4qOf3oGiJUh7Ky6O0DcYMBODhCkd7lp2ThlYBYrHYS2LpX5KDAvz96+bNqCgr3PbEvrxMZaW7fn4oNr02ZLiZXnT2NN54G46bZP/OPGbQIj9lc6wti43H1Zc1ECmN8OQTw1YiYC1eN7/kyjWzA0crSuTI4Y7Mr4R98UDon15WVgic7hwgOJqkZzjNsbE0U+kC7SURRg8NE2oIYTdJjj02xYMfP8Te+7robZ9i7sZqzuwt8J0PbOf4th4GOyY5sb+PloWVqIDHTz/Vyo4fdbL/wV66TkyRqpW075xgqD1NtqGS4Z3jlJ7Jk0kmmRydIpBOUe4M8tjhIXIifNgpJB85e553bFoQu/n61ZesWWl8Tef1dQ/uyQZfeeM0LlplEQsrhBGhu22SY502+455LF8QIBKMoNUoKtmKSreSSXann96X/0XOKYTWLjBfPjZuP/2t+87sOXc8Xgy8ZKR4y/Vzmls7xt/wyDFkZTgfXDC3NDzYPyJ6zpykq6ON3oEJegYUI6M5Wk8NIwPlbFgfYf26CpLJJMdb8yQCJhN5LQ50jlYuayq7adG0ioXxSFXXvraBwbOOprDCf0fOCxwbStIYshgsaLrH8xSUx8loGfnOKWLNQYwZYcaHc5z8+RmS/VmiCxMwK8ZAIc/UqEOqPYWwFDOuaCI3PciAbTMxqjn643ZG2rPkogbW8jgjByaZ6CiQqqvGPp2kaiKDcDST2Tw55XGiP8WxoTRGIPBsPpd65OabMS6ev3zllRsqPzOtTn7gyMHM9KR25fxmTXrMRkuT6gaPyWQ5T+wYprsng4cNVpihkUmvr6vT6+44rnq7zqisLQKDvelTJzqcwek11rUZO3jghw+17zh/7F8oXjJS3HLJ3OZTfdlbukZt+cZLq2IPH02Jp57Jsetoij1H0+w9luVke5baCoONq0tob51kIiloqIfJcVBmKbUVgisutZDaZNehyYBlBBdctq7m+rlzq7yWhsr0QCZQnsvYb9OmZU3mXRoDAY6M5ci7vizVQEMJbt8UFTNCJObHEFWKYD6ECEqaXt1IJlrAsQQ1i8uoLEtQs7yK6msqcEKQM3IEpluIcYvSFZXMev1MtOWS3pdkqstBzq/G7E0zMwc9KZusJwlZBieG80zkFEasdPz6jbXtl89bfNNFS0s/a3use3Zvb2jJskpuur6ZgUFFMFLOeH+O8nKDn/x0CEOarFlWysHjebYfKtg7j6UHdx+Z6tl1ODe046Dd335qorBievyy8XRmvKkiPMvWbseCxzqf+h+TvLply9xLvXz6BkuKwJnJrDE5osm7GZqrTCqiHhVRj7ULQ1SWmhw94HLBhhgjkzkef3KCxvo44yNjuLbDjFmS2U0xZs4o5WTXpDh1Jhsrj8tLF9WHbmkuC76he8AraRtKialCnozncnA0S2XQr+4arKrEHRz3STGvBM/0KJ9VSsnKEozqszLMHkgHXSWxGoIYEQMJ/p4jUlM6t5zQDBMj6qKUJHUgzURPDjGvAqMvTUvOo28ySdqDgaxD52SaeHmU69eWznzdxXW35Aqpa/YdnSxTliNuumYaqxaF0JZHRYVHOJhkfFLx4CMpamugYXqAp3ekWTQjyqw6U+SzObsyps2qiIhXlHlWNKycQk6XVcRYVVdhlYajhuyZHr5n656R36pM84fihax9/FYcu/vaH1aXmq/KZMWUpVV+Iiv0kdMZVV1ZdTKdyR5TuGGdLVw8OpysSJnSHB9xAhtWxJO5nFt+si1nbL6wihnNBtW1oG1Jd59ieMglXhnmZw92kU8ZLFsQxVY59p3I89Cucc4MpGkMB2iOm7hBOLR8FtkDbcy9pJLml9fjmoXiupmLcXY/L3xFPF/4tdhcpEFrAyV8OSKhpa9Ep116vt1L1/YpQjcuILhniEtHs+wYGCejTRJVMdbOKuGq1RXkvQKn+z0qrCirl4cIhzzmzAkRi2g8I8DYaJ4nnpni+CmH1SsCrmkbQ2OjyvIQlml4XiQiT8crw3ukFcTOUV1TzqppNUZcKSE9w04kwsIcHHL7tu4fWH7bJw6OnD/+LwQvGSl++bnrvjY8lSk90+9+e860yg5ZYinLC+u2QXt0/+kfJOFmLlkw3FSiZEX/BIne0eSGfIYnr9oUuy4Y9P6y4zhRJeAVN1UTDKZ57DGXukqTaEUJ5eEknjA51a7Zf2gcU7vES+Mc7Mrw3YdPclFVGW5Qs2/ZDPIH2mlcU0rp5bVIJVDFPUGK8YivZyH86gnfCmtf3FX7MakvqWyhlIerNFP3dTF2bJLQDYsJ7BnmuskC93aOcfGyOtataAR7lMEJgyXzYqxYUorreRhWHulIbEczb0GQQ4cKbN01RTyiWTy7ZKw/lf/MMzvtn8+ZX2aZgUysPhZKTqQZPn3XhtG7uEtv2TIr8PKVy+qb6nRkKqXM4dHUZY013k0LG4N1ra25VdfftXX0/PF/IXjJSPGmmzZWjZzJZe7ft+835vrPg9i0aZOxdetW9+abbzYur+u8atWCkg8d78mtbGtPW0uWlrJ+WQVKODz0xCjXXN5AojzPiZMpTp80qZsR49CRfnr6Xb70807W1UVwLYu9S6dRONhOaWMF1uom8DRKuT4J/PIL/IqJYvXU2QVU8HMVxTxHkR94uNg7z2D3pwm+bAnhfaNcP5bjp/1DXLVuOjMaAsyocwlFq1i8wGFGSymtnXmmkjCrKciZUzkGMw57d4+xcU1tviLmPH20dfKfH+zev/Xuu/mD9vt69SWLajavaZmxf3xg79e+9sJXl8/FS0aKFwIN4mt3bqqoCBtvrY+H/u7pI2ORqfEMV11ST2NjgKY6SKUkT27LUj0tik6OsXxdDZMjad7/idOM9+SwDcnRJY3kDncgx9N4JRGE8nMMgmLVnihWaKH9fU3PWgooVnIVT0j5WQoNqEweMxEhft0SQvtHuCbp8tjEOP9x1zKWzjYZHcvR1Reld2iAV9zQjGkW6BwqYceOXvbtH2Le7DgbFlVnj5wc+ei4Hf6P93x+6wvqEH8p8CdJinMg33/9ohuuvzzx/owbXtl6ajyYySguXFvJzBkR9h8ZY3gKLl4Rp745iC7k+fhXeti2bYqaWJBHJ5Po+mq06wuQ+HLIvinQSvnbVlK86We3c0I/V1N6dhO450bJM0CCtARqIM1MWzMvESfSAp95/wzC8QCTacHWrYPEIrByVQsnWqfYf3II6bnMndWQsaKF47t25P79QKbpe3/sboAvNf7UScHNr79gmjE5VVgxLbzhgmXlHwoHvAVP70iGxpM50VRRzoYr6mmq9AiaedAeJ0/DX378IMvMCG4wxOHeYZTUPik4axmEvx0TZ7eflH59pwC/VFagioU1PjHOvid8q6IVLSUllIQj7B0e4R2vmcZrbqhEmiaOl6O9J8Hp7im2bhuhqU7ra9Y1Z8+M5355tHX0S1350sGCUJH/+Pa2/edf658K/tRJIRbcvMA6fre/iPTaNbNKVq4tX7dwbuVrg0Jf3dM7XDEwaIvK6jCVFSGWza8iHLI50aH58OcPYucleGdL+8ASqjgJFKu88VPVHhpD+/WgqihroPF1tOHs0odf+ykNX/fTEwajhTR3XN3IG25qIq8cTp72GBp2ONkzRmOVpetr4kPVZeEfn+6bvOfbu0Z2PfRQe+H221daI/1i2cCoeXTnzj9807f/P/AnS4o770QODKw0fpMTtWXWrOCcVaG5iYrAP2+cVbm+IS4CTx4aCaTzGGOjLpvWV+GkDY63jdPaO45jK5IF2NuTxStugS21iVb+nhyuAcrz9w2zhEEwoEnbvgOqhS9xaHomIalZNj2OVhpTKxKJKFsuKGd0zGYi7RKPeKxeVesYts73j6intu7pvKss3XjorvMKa9etW1BeWlcVeejerX3PzWd/QviTJcWP79wUK6uvNi5/692/sRLrsstWJoJB7135pMt1K+pO1te4yxIB88ZMNtMSCsvw3qMFAlGTvkmXhmiQslITpQrEQ4LyiqC/4GUoegYcHtydZG6txfKFMe7bNsaCxgTLlob8gmENU+Mu4xOQdU2GRjIkCxAPaEpLg8ysg6hpFYyAMTiWyoq+Ke+bbWfc9OC4euyBZw4eOv+8N23aZK5fNG3GL3bvS4aXh8f2/QbS/7/GS5bRfCHQILpfPj+0vCqoPlOcOs5Hy/zqyokxPT0YN07tPlm4b6Cw44nJvrLvpnLG1lQqaU2rLXUMQaG2KhS3HU+2dU8yNCYYHvUoCQfw8jaTSYNTPTZr5yd4xaW1CE9w5WWVHDqaITWlsQiQyTv0Dtkc7yzg5m3qq4LMbSkFVcjW11mjuUwue6Lbu+tor/PuZ/tscaTPvs9RgdNmIri6tbXn4PmW4NaNNfWXXdj8j2c6Oo8MHHGnRkZe3Gzki4E/WUtxJ8iPaq2FKHbVnIeVm5deoD21zLYL247uOnXk3MF/wy0XXhQypCpMFmKrZhvfGh7K1c5sjvgZSsNCe4pwyGLXcZuF8wKsWxXn4B6XSKKcqOhh5pwqfvjjAcpKTaqrXNK5YiW4YdPdLQiHAqpj1PlJR1/2azPnVtx0omPos08/faJt7aYFG8PRQIWb9J4uSPGmjO1++/jO4+PF0xL3funtKyojw389c/mMS9t3HW17dn/qnz74le2/POv+/qngJauneKG4C9R/R4jm5uZQJpmebytH2C795z2NcjiZVcfPjB9btdCsu3C1jKycV8H4hEdDdQX7j6YJx4Ns359n9TyTTYvL2bV7jAWXz+aK119KoqaWjv+vvbONbaKO4/i3vba3rmu7rrtua/fEVjbYA2MQModANBFFifEhWdTwhnfyhsQXaHyhvtDEGPEFGGNMlEQTUXSSASoC28Dx/DS2gZSu6x7atb0+rHdtt96t1/bOFw7cljEUQdu4z9v/3T//3H1/39/v/7+7/w3H8fL2IsQ5Gbw0AQEK+AISdKQR8mQSm1o08hdaVassRsnrpdl+DVlgBYCkKA77g9PEWSYdT5JKt1xF1s4al3S8s398YMDnCo4xyUBQHHX6xVuz2jOGjBXFYlBWypySCG08lrA7eh23IxEAsHbtWmJ5GaksYdLx+kpDjYJQap0eFhua9Qh4J/DcRj3OX2PxyJo8tLYU4ZczNJpaG1HX8BLIvCfR+MRWyPWFcAxEsO15I+JTBGqMQH01CSXPo6FOh7NX/FhZbyotNOUoEiJ5QqFTqwHIr52xB0ldLltHUarIBHdFqUA12v5M0Z91XAheH1LtdjiJA/uODb/2+aHzw5nmEsjUmuIeyKDNrZRSUoFSJr/EBJk5hajZbCZINSl8/2tvxFqjG6T0ZJ0/NE1xCRWvNYg5aSFP5gmwsBQTsNlTKKsuxoYtL4LIa4Aky4eCMKC0NIXDHVcRpHkkkIZSknDDzqKiRj15ooseemajmT9yztfZNcB2nD5908tNCmOxWCwJQMovL4c9xEb0MY5LEESz0kcNcrPqhl6Hiwsmeru7zzBz3vrOJLJOFFarlUwQimpR4CfcuWODoOdGWsWjFeTxvuAUGCZ16oJvcnWlqTO/gDp45JT9B70m76mTfYzusRYjrvZFUFWqxbAtCKMxDH0Rj5SYC4nvQH/PFdC2MEQ5wMY4eAMiQCqhgvqDoES+rjMYvv7u7PRlKNW6cZfPH4vF7kw5wy5vFKFQOhqNiiXlVUU8w0zHo1F29hhdrsxzh9lknSjyLBbddJzXypKSP26PzkkdAFBUVaSiycIUXH/s03Dskjd+uGfIf8sd9WxtXaZRQNg0NCLJN683geM5rF5dgmsXPdDqWBSoGVztuYzrF2nUrswHMzEFnUaFy6MCGktzJvQGxVtv7O0ZPNhpZ1esMBFEXrJpdDBgnz+GGaQpURQqKssaA+OeofmNmUzWiUJhMRTwXDIacbv9C+Vj2kGnbwtiPpuaStwt9cb1aRks1wdZWeMKHRyDQVQt0+PcGQY0PYGRmwGsWq6HbyyKcosBJ3+L4pVNeoHnEu+NXiAO98z0nZ9vFukYp2Pp8F0XoCqLi6enCKE0ZjCNIxTKyOccC5FVomhrayNikbjKf+tWeOaz87ux4E3q7vVGasuruhvqFM1hP18R5WWy5lojwqFpFJXlwmnj0FCbC9odg7VWh47uMDY06RMRDnv2HXDt3n/jxp3agKbppL7SJCtfaRYCI4EFF6AYhkmDMLEWSU2wLH1fv1n4L8iq2Uf7yIh80gfufgRxm7e/6Bwdd4u7Nj9uGYtO8hj1RrC8WovJUBzPbjYg6EliVYsFR3torGlWiypSub+/L/7+Rc+c7QMAAHIo+UQ8seg1jHlsMUHgiUxeE5pPVjmFVaNRut03/3HE/XR+hF6xrLxvfaNp/U3PVKEMwJani5FfKIIy6dF+cAhlFn3aaFAdOOcS3tzz7fnw/D4AQAOlyBFaxAMLO8UMIllKERxFIVtSyKIqzzScTqdwLyf4i0hTezvPOr38znUri2nHoB8X+xNIC0kc+XkItdVGyVpZfKz3enTXR5/23HV7BE9rq2BMpRYTBACAAoQKisqaa51VTvEg6QGknBKnqyTHMrKqpnBjiJnUanM1ICEToUXnj6ecOz78ZsA7/7w52GwIURRxLwcIhUJiVKORIxRasADONLJGvQ+D9nakR4iuQ0N+2avrmjQhSj8tmc3ac26HsOPjdpt7/vELILXV1y8qiBkk2GzJB+RyS/xLyI9+snXb1a+2dr27ffXybCoKHwb/a6eYheiLFx3powt2vvNlv3MpopdYYokllljib/M7ZqPg9U6DCBMAAAAASUVORK5CYII="alt="PRESTO x718 Embedded Image"/> </a>
+                        <a href="https://github.com/piklz/pi_ups_monitors/tree/main/docker"><img width="60%" src="{{ static_url('logo.png') }}" alt="PRESTO x718 Embedded Image"/> </a>
                         <p class="text-sm mt-1">
                              
                             <span class="swipe-text text-sm font-semibold text-gray-800 dark:text-gray-300">{{ pi_model }}</span>
@@ -2523,8 +3004,7 @@ DASHBOARD_TEMPLATE = '''
                     </div>
                     <div class="flex flex-col items-end">
                         <button onclick="toggleDarkMode()" class="p-3 rounded-full hover:bg-gray-200 dark:hover:bg-gray-700 mb-2">
-                            <svg id="darkModeIcon" class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24">
-                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M20.354 15.354A9 9 0 018.646 3.646 9.003 9.003 0 0012 21a9.003 9.003 0 008.354-5.646z"></path>
+                            <svg id="darkModeIcon" class="w-6 h-6" fill="none" stroke="currentColor" viewBox="0 0 24 24"><use href="{{ static_url('icons.svg') }}#{{ 'icon-sun' if dark_mode else 'icon-moon' }}"></use></svg>
                         </button>
                         <div class="text-right">
                             <p class="text-xs text-gray-900 dark:text-gray-400">Version {{ CURRENT_VERSION}}</p>
@@ -2556,9 +3036,7 @@ DASHBOARD_TEMPLATE = '''
                             <p id="battery-level" class="text-4xl font-bold text-blue-600 dark:text-blue-400">{{ battery_level }}%</p>
                         </div>
                         <div class="p-3 bg-blue-100 dark:bg-blue-900 rounded-xl">
-                            <svg class="w-8 h-8 text-blue-600 dark:text-blue-400" fill="currentColor" viewBox="0 0 20 20">
-                                <path d="M5 2a2 2 0 00-2 2v14a2 2 0 002 2h10a2 2 0 002-2V4a2 2 0 00-2-2H5zm0 3a1 1 0 011-1h8a1 1 0 011 1v10a1 1 0 01-1 1H6a1 1 0 01-1-1V5z"></path>
-                            </svg>
+                            <svg class="w-8 h-8 text-blue-600 dark:text-blue-400" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-battery"></use></svg>
                         </div>
                     </div>
                     <div class="battery-bar rounded-lg overflow-hidden">
@@ -2574,9 +3052,7 @@ DASHBOARD_TEMPLATE = '''
                             <p id="voltage" class="text-4xl font-bold text-purple-600 dark:text-purple-400">{{ voltage }}V</p>
                         </div>
                         <div class="p-3 bg-purple-100 dark:bg-purple-900 rounded-xl">
-                            <svg class="w-8 h-8 text-purple-600 dark:text-purple-400" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M11.3 1.046A1 1 0 0112 2v5h4a1 1 0 01.82 1.573l-7 10A1 1 0 018 18v-5H4a1 1 0 01-.82-1.573L7.586 10 5.293 7.707a1 1 0 010-1.414l2-2.5a1 1 0 011.12-.38z" clip-rule="evenodd"></path>
-                            </svg>
+                            <svg class="w-8 h-8 text-purple-600 dark:text-purple-400" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-bolt"></use></svg>
                         </div>
                     </div>
                 </div>
@@ -2592,9 +3068,7 @@ DASHBOARD_TEMPLATE = '''
                             </div>
                         </div>
                         <div class="p-3 bg-green-100 dark:bg-green-900 rounded-xl">
-                            <svg class="w-8 h-8 text-green-600 dark:text-green-400" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M6 2a1 1 0 00-1 1v1H4a2 2 0 00-2 2v10a2 2 0 002 2h12a2 2 0 002-2V6a2 2 0 00-2-2h-1V3a1 1 0 10-2 0v1H7V3a1 1 0 00-1-1zm0 5a1 1 0 000 2h8a1 1 0 100-2H6z" clip-rule="evenodd"></path>
-                            </svg>
+                            <svg class="w-8 h-8 text-green-600 dark:text-green-400" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-calendar"></use></svg>
                         </div>
                     </div>
                     <p id="time-remaining" class="text-sm text-gray-600 dark:text-gray-400">⏱️ {{ time_remaining }}</p>
@@ -2611,9 +3085,7 @@ DASHBOARD_TEMPLATE = '''
                             </div>
                         </div>
                         <div class="p-3 bg-orange-100 dark:bg-orange-900 rounded-xl">
-                            <svg class="w-8 h-8 text-orange-600 dark:text-orange-400" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M2 5a2 2 0 012-2h12a2 2 0 012 2v10a2 2 0 01-2 2H4a2 2 0 01-2-2V5zm3.293 1.293a1 1 0 011.414 0l3 3a1 1 0 010 1.414l-3 3a1 1 0 01-1.414-1.414L7.586 10 5.293 7.707a1 1 0 010-1.414l2-2.5a1 1 0 011.12-.38z" clip-rule="evenodd"></path>
-                        </svg>
+                            <svg class="w-8 h-8 text-orange-600 dark:text-orange-400" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-terminal"></use></svg>
                         </div>
                     </div>
                     <div class="text-sm space-y-1">
@@ -2631,44 +3103,37 @@ DASHBOARD_TEMPLATE = '''
                 <!-- Battery History Chart -->
                 <div class="glass-card rounded-2xl p-6">
                     <h3 class="text-xl font-bold mb-4 flex items-center gap-2 text-gray-100 dark:text-gray-400">
-                        <svg class="w-6 h-6 text-blue-500" fill="currentColor" viewBox="0 0 20 20">
-                            <path d="M2 11a1 1 0 011-1h2a1 1 0 011 1v5a1 1 0 01-1 1H3a1 1 0 01-1-1v-5zM8 7a1 1 0 011-1h2a1 1 0 011 1v9a1 1 0 01-1 1H9a1 1 0 01-1-1V7zM14 4a1 1 0 011-1h2a1 1 0 011 1v12a1 1 0 01-1 1h-2a1 1 0 01-1-1V4z"></path>
-                        </svg>
+                        <svg class="w-6 h-6 text-blue-500" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-chart"></use></svg>
                         Battery History
                     </h3>
                     <div class="chart-container">
                         <canvas id="batteryChart"></canvas>
+                        <div id="chart-tooltip" class="chart-tooltip"></div>
                     </div>
                 </div>
                 
                 <!-- Hardware Status -->
                 <div class="glass-card rounded-2xl p-6">
                     <h3 class="text-xl font-bold mb-4 flex items-center gap-2 text-gray-900 dark:text-gray-400">
-                        <svg class="w-6 h-6 text-purple-500" fill="currentColor" viewBox="0 0 20 20">
-                            <path fill-rule="evenodd" d="M3 3a1 1 0 000 2v8a2 2 0 002 2h2.586l-1.293 1.293a1 1 0 101.414 1.414L10 15.414l2.293 2.293a1 1 0 001.414-1.414L12.414 15H15a2 2 0 002-2V5a1 1 0 100-2H3zm11.707 4.707a1 1 0 00-1.414-1.414L10 9.586 8.707 8.293a1 1 0 00-1.414 0l-2 2a1 1 0 101.414 1.414L8 10.414l1.293 1.293a1 1 0 001.414 0l4-4z" clip-rule="evenodd"></path>
-                        </svg>
+                        <svg class="w-6 h-6 text-purple-500" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-hardware"></use></svg>
                         Hardware Status
                     </h3>
                     <div class="space-y-4">
-                        <div class="flex justify-between items-center p-3 bg-gray-50 dark:bg-gray-800 rounded-lg">
+                        <div class="status-row">
                             <span class="font-semibold text-gray-900 dark:text-gray-400">I2C Bus</span>
-                            <span id="i2c-status" class="{% if not hardware_error %}text-green-500{% else %}text-red-500{% endif %}">
-                                {% if not hardware_error %}✅ {{ i2c_addr }}{% else %}❌ Error{% endif %}
-                            |</span>
+                            {{ i2c_status_html }}
                         </div>
-                        <div class="flex justify-between items-center p-3 bg-gray-50 dark:bg-gray-800 rounded-lg">
+                        <div class="status-row">
                             <span class="font-semibold text-gray-900 dark:text-gray-400">GPIO Interface</span>
-                            <span id="gpio-status" class="{% if not gpio_error %}text-green-500{% else %}text-yellow-500{% endif %}">
-                                {% if not gpio_error %}✅ Active{% else %}⚠️ Limited{% endif %}
-                            </span>
+                            {{ gpio_status_html }}
                         </div>
-                        <div class="flex justify-between items-center p-3 bg-gray-50 dark:bg-gray-800 rounded-lg">
+                        <div class="status-row">
                             <span class="font-semibold text-gray-900 dark:text-gray-400 ">Uptime</span>
                             <span id="uptime" class="text-blue-500 font-mono">{{ system_info.uptime }}</span>
                         </div>
-                        <div class="flex justify-between items-center p-3 bg-gray-50 dark:bg-gray-800 rounded-lg">
+                        <div class="status-row">
                             <span class="font-semibold text-gray-900 dark:text-gray-400">Last Update</span>
-                            <span id="last-update" class="text-gray-500 text-sm">{{ timestamp }}</span>
+                            <span id="last-update" class="text-gray-500 text-sm"></span>
                         </div>
                     </div>
                 </div>
@@ -2680,14 +3145,10 @@ DASHBOARD_TEMPLATE = '''
                 <div class="glass-card rounded-2xl p-6">
                     <button onclick="toggleSection('config')" class="w-full flex justify-between items-center">
                         <h3 class="text-xl font-bold flex items-center gap-2 text-gray-900 dark:text-gray-400">
-                            <svg class="w-6 h-6 text-indigo-500" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M11.49 3.17c-.38-1.56-2.6-1.56-2.98 0a1.532 1.532 0 01-2.286.948c-1.372-.836-2.942.734-2.106 2.106.54.886.061 2.042-.947 2.287-1.561.379-1.561 2.6 0 2.978a1.532 1.532 0 01.947 2.287c-.836 1.372.734 2.942 2.106 2.106a1.532 1.532 0 012.287.947c.379 1.561 2.6 1.561 2.978 0a1.533 1.533 0 012.287-.947c1.372.836 2.942-.734 2.106-2.106a1.533 1.533 0 01.947-2.287c1.561-.379 1.561-2.6 0-2.978a1.532 1.532 0 01-.947-2.287c.836-1.372-.734-2.942-2.106-2.106a1.532 1.532 0 01-2.287-.947zM10 13a3 3 0 100-6 3 3 0 000 6z" clip-rule="evenodd"></path>
-                            </svg>
+                            <svg class="w-6 h-6 text-indigo-500" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-gear"></use></svg>
                             Configuration
                         </h3>
-                        <svg id="config-arrow" class="w-6 h-6 transform transition-transform text-gray-900 dark:text-gray-200" fill="currentColor" viewBox="0 0 20 20">
-                            <path fill-rule="evenodd" d="M5.293 7.293a1 1 0 011.414 0L10 10.586l3.293-3.293a1 1 0 111.414 1.414l-4 4a1 1 0 01-1.414 0l-4-4a1 1 0 010-1.414z" clip-rule="evenodd"></path>
-                        </svg>
+                        <svg id="config-arrow" class="w-6 h-6 transform transition-transform text-gray-900 dark:text-gray-200" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-chevron-down"></use></svg>
                     </button>
                     
                     <div id="config-content" class="collapsible-content mt-6">
@@ -2698,17 +3159,17 @@ DASHBOARD_TEMPLATE = '''
                                 <h4 class="font-semibold text-lg border-b pb-2 text-gray-900 dark:text-gray-200">Battery Thresholds</h4>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">Low Battery Warning (%)</label>
+                                    <label class="form-label">Low Battery Warning (%)</label>
                                     <input type="number" step="0.1" name="low_battery_threshold" 
                                         value="{{ config.low_battery_threshold }}" required
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">Critical Threshold (%)</label>
+                                    <label class="form-label">Critical Threshold (%)</label>
                                     <input type="number" step="0.1" name="critical_low_threshold" 
                                         value="{{ config.critical_low_threshold }}" required
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                             </div>
                             
@@ -2717,17 +3178,17 @@ DASHBOARD_TEMPLATE = '''
                                 <h4 class="font-semibold text-lg border-b pb-2 text-gray-900 dark:text-gray-200">System Thresholds</h4>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">CPU Temperature (°C)</label>
+                                    <label class="form-label">CPU Temperature (°C)</label>
                                     <input type="number" step="0.1" name="cpu_temp_threshold" 
                                         value="{{ config.cpu_temp_threshold }}" required
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">Disk Space Warning (GB)</label>
+                                    <label class="form-label">Disk Space Warning (GB)</label>
                                     <input type="number" step="0.1" name="disk_space_threshold" 
                                         value="{{ config.disk_space_threshold }}" required
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                             </div>
                             
@@ -2736,17 +3197,17 @@ DASHBOARD_TEMPLATE = '''
                                 <h4 class="font-semibold text-lg border-b pb-2 text-gray-900 dark:text-gray-200">Monitoring Settings</h4>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">Update Interval (seconds) on AC </label>
+                                    <label class="form-label">Update Interval (seconds) on AC </label>
                                     <input type="number" step="1" name="monitor_interval" 
                                         value="{{ config.monitor_interval }}" required
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">Shutdown Delay (seconds)</label>
+                                    <label class="form-label">Shutdown Delay (seconds)</label>
                                     <input type="number" step="1" name="shutdown_delay" 
                                         value="{{ config.shutdown_delay }}" required
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                                 
                                 <div class="flex items-center gap-3">
@@ -2754,8 +3215,8 @@ DASHBOARD_TEMPLATE = '''
                                         <input type="checkbox" name="enable_auto_shutdown" value="1" 
                                             {{ 'checked' if config.enable_auto_shutdown else '' }} 
                                             class="sr-only peer">
-                                        <div class="w-14 h-7 bg-gray-200 peer-checked:bg-gradient-to-r peer-checked:from-red-400 peer-checked:to-red-600 rounded-full peer-focus:outline-none peer-focus:ring-2 peer-focus:ring-red-300 dark:peer-focus:ring-red-800 transition-all duration-300"></div>
-                                        <span class="absolute w-5 h-5 bg-white rounded-full top-1 left-1 peer-checked:translate-x-7 transition-transform duration-300"></span>
+                                        <div class="toggle-track peer-checked:from-red-400 peer-checked:to-red-600 peer-focus:ring-red-300 dark:peer-focus:ring-red-800"></div>
+                                        <span class="toggle-knob"></span>
                                     </label>
                                     <label class="font-medium">Enable Auto-Shutdown</label>
                                 </div>
@@ -2764,8 +3225,8 @@ DASHBOARD_TEMPLATE = '''
                                         <input type="checkbox" name="debug" value="1" 
                                             {{ 'checked' if config.debug else '' }} 
                                             class="sr-only peer">
-                                        <div class="w-14 h-7 bg-gray-200 peer-checked:bg-gradient-to-r peer-checked:from-blue-400 peer-checked:to-blue-600 rounded-full peer-focus:outline-none peer-focus:ring-2 peer-focus:ring-blue-300 dark:peer-focus:ring-blue-800 transition-all duration-300"></div>
-                                        <span class="absolute w-5 h-5 bg-white rounded-full top-1 left-1 peer-checked:translate-x-7 transition-transform duration-300"></span>
+                                        <div class="toggle-track peer-checked:from-blue-400 peer-checked:to-blue-600 peer-focus:ring-blue-300 dark:peer-focus:ring-blue-800"></div>
+                                        <span class="toggle-knob"></span>
                                     </label>
                                     <label class="font-medium">Enable Debug Logging</label>
                                 </div>
@@ -2780,26 +3241,26 @@ DASHBOARD_TEMPLATE = '''
                                         <input type="checkbox" name="enable_ntfy" value="1" 
                                             {{ 'checked' if config.enable_ntfy else '' }} 
                                             class="sr-only peer">
-                                        <div class="w-14 h-7 bg-gray-200 peer-checked:bg-gradient-to-r peer-checked:from-green-400 peer-checked:to-green-600 rounded-full peer-focus:outline-none peer-focus:ring-2 peer-focus:ring-green-300 dark:peer-focus:ring-green-800 transition-all duration-300"></div>
-                                        <span class="absolute w-5 h-5 bg-white rounded-full top-1 left-1 peer-checked:translate-x-7 transition-transform duration-300"></span>
+                                        <div class="toggle-track peer-checked:from-green-400 peer-checked:to-green-600 peer-focus:ring-green-300 dark:peer-focus:ring-green-800"></div>
+                                        <span class="toggle-knob"></span>
                                     </label>
                                     <label class="font-medium">Enable ntfy Notifications</label>
                                 </div>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">ntfy Server</label>
+                                    <label class="form-label">ntfy Server</label>
                                     <input type="text" name="ntfy_server" 
                                         value="{{ config.ntfy_server }}"
                                         placeholder="https://ntfy.sh"
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                                 
                                 <div>
-                                    <label class="block text-sm font-medium mb-2">ntfy Topic</label>
+                                    <label class="form-label">ntfy Topic</label>
                                     <input type="text" name="ntfy_topic" 
                                         value="{{ config.ntfy_topic }}"
                                         placeholder="x728_UPS"
-                                        class="w-full p-3 border rounded-lg dark:bg-gray-700 dark:border-gray-600">
+                                        class="form-input">
                                 </div>
                             </div>
                             
@@ -2818,41 +3279,31 @@ DASHBOARD_TEMPLATE = '''
                 <div class="glass-card rounded-2xl p-6">
                     <button onclick="toggleSection('control')" class="w-full flex justify-between items-center">
                         <h3 class="text-xl font-bold flex items-center gap-2">
-                            <svg class="w-6 h-6 text-red-500" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zM9.555 7.168A1 1 0 008 8v4a1 1 0 001.555.832l3-2a1 1 0 000-1.664l-3-2z" clip-rule="evenodd"></path>
-                            </svg>
+                            <svg class="w-6 h-6 text-red-500" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-play"></use></svg>
                             System Control
                         </h3>
-                        <svg id="control-arrow" class="w-6 h-6 transform transition-transform" fill="currentColor" viewBox="0 0 20 20">
-                            <path fill-rule="evenodd" d="M5.293 7.293a1 1 0 011.414 0L10 10.586l3.293-3.293a1 1 0 111.414 1.414l-4 4a1 1 0 01-1.414 0l-4-4a1 1 0 010-1.414z" clip-rule="evenodd"></path>
-                        </svg>
+                        <svg id="control-arrow" class="w-6 h-6 transform transition-transform" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-chevron-down"></use></svg>
                     </button>
                     <div id="control-content" class="collapsible-content mt-6">
                         <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
                             <form id="reboot-form">
                                 <input type="hidden" name="action" value="reboot">
                                 <button type="submit" class="w-full p-4 bg-yellow-500 hover:bg-yellow-600 text-white font-bold rounded-lg transition duration-200 flex items-center justify-center gap-2">
-                                    <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 20 20">
-                                        <path fill-rule="evenodd" d="M4 2a1 1 0 011 1v2.101a7.002 7.002 0 0111.601 2.566 1 1 0 11-1.885.666A5.002 5.002 0 005.999 7H9a1 1 0 010 2H4a1 1 0 01-1-1V3a1 1 0 011-1zm.008 9.057a1 1 0 011.276.61A5.002 5.002 0 0014.001 13H11a1 1 0 110-2h5a1 1 0 011 1v5a1 1 0 11-2 0v-2.101a7.002 7.002 0 01-11.601-2.566 1 1 0 01.61-1.276z" clip-rule="evenodd"></path>
-                                </svg>
+                                    <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-reboot"></use></svg>
                                 Reboot System
                             </button>
                         </form>
                         <form id="shutdown-form">
                             <input type="hidden" name="action" value="shutdown">
                             <button type="submit" class="w-full p-4 bg-red-600 hover:bg-red-700 text-white font-bold rounded-lg transition duration-200 flex items-center justify-center gap-2">
-                                <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 20 20">
-                                    <path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zm-1-7V7a1 1 0 112 0v4a1 1 0 01-2 0zm1 4a1.5 1.5 0 100-3 1.5 1.5 0 000 3z" clip-rule="evenodd"></path>
-                                </svg>
+                                <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-shutdown"></use></svg>
                                 Shutdown System
                             </button>
                         </form>
                     </div>
                     <div id="cancel-action-panel" class="mt-4 hidden flex flex-col items-center">
                         <button id="cancel-action-btn" class="w-full p-4 bg-blue-600 hover:bg-blue-700 text-white font-bold rounded-lg transition duration-200 flex items-center justify-center gap-2">
-                            <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 20 20">
-                                <path fill-rule="evenodd" d="M10 18a8 8 0 100-16 8 8 0 000 16zM8 7a1 1 0 00-1 1v4a1 1 0 001 1h4a1 1 0 001-1V8a1 1 0 00-1-1H8z" clip-rule="evenodd"></path>
-                            </svg>
+                            <svg class="w-6 h-6" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-stop"></use></svg>
                             Cancel Pending Action (<span id="cancel-timer">--</span>s)
                         </button>
                         <div id="cancel-action-type" class="mt-2 text-blue-700 dark:text-blue-300 font-semibold"></div>
@@ -2878,9 +3329,7 @@ DASHBOARD_TEMPLATE = '''
                                             class="p-2 bg-purple-600 hover:bg-purple-700 text-white font-bold rounded-lg transition duration-200 flex items-center justify-center gap-2 text-sm">
                                         
                                         <span>
-                                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
-                                                <path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M4 4v5h.582m15.356 2A8.001 8.001 0 004.582 9m0 0H9m11 11v-5h-.581m0 0a8.003 8.003 0 01-15.357-2m15.357 2H15"></path>
-                                            </svg>
+                                            <svg class="w-4 h-4" fill="none" stroke="currentColor" viewBox="0 0 24 24"><use href="{{ static_url('icons.svg') }}#icon-refresh"></use></svg>
                                         </span>
                                         Check
                                     </button>
@@ -2896,15 +3345,10 @@ DASHBOARD_TEMPLATE = '''
             <div class="glass-card rounded-2xl p-6">
                 <button onclick="toggleSection('logs')" class="w-full flex justify-between items-center">
                     <h3 class="text-xl font-bold flex items-center gap-2">
-                        <svg class="w-6 h-6 text-gray-500" fill="currentColor" viewBox="0 0 20 20">
-                            <path d="M9 2a1 1 0 000 2h2a1 1 0 100-2H9z"></path>
-                            <path fill-rule="evenodd" d="M4 5a2 2 0 012-2 3 3 0 003 3h2a3 3 0 003-3 2 2 0 012 2v11a2 2 0 01-2 2H6a2 2 0 01-2-2V5zm3 4a1 1 0 000 2h.01a1 1 0 100-2H7zm3 0a1 1 0 000 2h3a1 1 0 100-2h-3zm-3 4a1 1 0 100 2h.01a1 1 0 100-2H7zm3 0a1 1 0 100 2h3a1 1 0 100-2h-3z" clip-rule="evenodd"></path>
-                        </svg>
+                        <svg class="w-6 h-6 text-gray-500" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-clipboard"></use></svg>
                         Application Logs
                     </h3>
-                    <svg id="logs-arrow" class="w-6 h-6 transform transition-transform" fill="currentColor" viewBox="0 0 20 20">
-                        <path fill-rule="evenodd" d="M5.293 7.293a1 1 0 011.414 0L10 10.586l3.293-3.293a1 1 0 111.414 1.414l-4 4a1 1 0 01-1.414 0l-4-4a1 1 0 010-1.414z" clip-rule="evenodd"></path>
-                    </svg>
+                    <svg id="logs-arrow" class="w-6 h-6 transform transition-transform" fill="currentColor" viewBox="0 0 20 20"><use href="{{ static_url('icons.svg') }}#icon-chevron-down"></use></svg>
                 </button>
                 
                 <div id="logs-content" class="collapsible-content mt-6">
@@ -2914,7 +3358,7 @@ DASHBOARD_TEMPLATE = '''
                     <div class="mt-4 flex items-center justify-between">
                         <label class="flex items-center gap-2">
                             <input type="checkbox" id="auto-refresh-toggle" checked class="w-5 h-5 text-blue-600 rounded">
-                            <span class="text-sm font-medium">Auto Refresh Logs (30s)</span>
+                            <span class="text-sm font-medium">Live Logs</span>
                         </label>
                         <button onclick="refreshLogs()" class="px-4 py-2 bg-gray-600 hover:bg-gray-700 text-white rounded-lg">
                             🔄 Refresh Now
@@ -2923,501 +3367,28 @@ DASHBOARD_TEMPLATE = '''
                 </div>
             </div>
         
-    <script>
-        // WebSocket Connection
-        const socket = io();
-        
-        // Chart.js Configuration
-        let batteryChart;
-        const historyData = {{ history|safe }};
-        
-        function initChart() {
-            const ctx = document.getElementById('batteryChart');
-            if (!ctx) return;
-            
-            batteryChart = new Chart(ctx, {
-                type: 'line',
-                data: {
-                    labels: historyData.map(d => d.time),
-                    datasets: [
-                        {
-                            label: 'Battery %',
-                            data: historyData.map(d => d.battery),
-                            borderColor: 'rgb(59, 130, 246)',
-                            backgroundColor: 'rgba(59, 130, 246, 0.1)',
-                            tension: 0.4,
-                            yAxisID: 'y'
-                        },
-                        {
-                            label: 'Voltage',
-                            data: historyData.map(d => d.voltage),
-                            borderColor: 'rgb(168, 85, 247)',
-                            backgroundColor: 'rgba(168, 85, 247, 0.1)',
-                            tension: 0.4,
-                            yAxisID: 'y1'
-                        }
-                    ]
-                },
-                options: {
-                    responsive: true,
-                    maintainAspectRatio: false,
-                    interaction: { mode: 'index', intersect: false },
-                    plugins: {
-                        legend: { display: true, position: 'top' }
-                    },
-                    scales: {
-                        y: {
-                            type: 'linear',
-                            display: true,
-                            position: 'left',
-                            title: { display: true, text: 'Battery %' }
-                        },
-                        y1: {
-                            type: 'linear',
-                            display: true,
-                            position: 'right',
-                            title: { display: true, text: 'Voltage (V)' },
-                            grid: { drawOnChartArea: false }
-                        }
-                    }
-                }
-            });
-        }
-        
-        // Update UI with WebSocket data
-        function updateUI(data) {
-            // Battery
-            const battery = parseFloat(data.battery_level);
-            document.getElementById('battery-level').textContent = battery.toFixed(1) + '%';
-            const batteryFill = document.getElementById('battery-fill');
-            batteryFill.style.width = battery + '%';
-            
-            // Color coding
-            if (battery <= 10) {
-                batteryFill.className = 'h-full bg-gradient-to-r from-red-600 to-red-500 transition-all duration-500';
-            } else if (battery <= 30) {
-                batteryFill.className = 'h-full bg-gradient-to-r from-yellow-500 to-orange-500 transition-all duration-500';
-            } else {
-                batteryFill.className = 'h-full bg-gradient-to-r from-green-500 to-blue-500 transition-all duration-500';
-            }
-            
-            // Voltage & Current
-            document.getElementById('voltage').textContent = parseFloat(data.voltage).toFixed(2) + 'V';
-                        
-            // Power State
-            const powerState = data.power_state;
-            const powerBadge = document.getElementById('power-state-badge');
-            document.getElementById('power-state').textContent = powerState;
-            
-            powerBadge.className = 'status-badge mt-2';
-            if (powerState === 'On AC Power') {
-                powerBadge.classList.add('bg-green-100', 'text-green-800', 'dark:bg-green-900', 'dark:text-green-200');
-                document.querySelector('#power-state-badge .status-pulse').classList.remove('bg-yellow-500', 'bg-red-500');
-                document.querySelector('#power-state-badge .status-pulse').classList.add('bg-green-500');
-            } else if (powerState === 'On Battery') {
-                powerBadge.classList.add('bg-yellow-100', 'text-yellow-800', 'dark:bg-yellow-900', 'dark:text-yellow-200');
-                document.querySelector('#power-state-badge .status-pulse').classList.remove('bg-green-500', 'bg-red-500');
-                document.querySelector('#power-state-badge .status-pulse').classList.add('bg-yellow-500');
-            } else {
-                powerBadge.classList.add('bg-red-100', 'text-red-800', 'dark:bg-red-900', 'dark:text-red-200');
-                document.querySelector('#power-state-badge .status-pulse').classList.remove('bg-green-500', 'bg-yellow-500');
-                document.querySelector('#power-state-badge .status-pulse').classList.add('bg-red-500');
-            }
-            
-            // Time remaining
-            document.getElementById('time-remaining').textContent = '⏱️ ' + data.time_remaining;
-            
-            // System info
-            document.getElementById('cpu-temp').textContent = data.system_info.cpu_temp + '°C';
-            document.getElementById('network').innerHTML = `${data.system_info.network} ${data.system_info.network_status === 'connected' ? '🟢' : '🔴'}`;
-            document.getElementById('disk-label').textContent = data.system_info.disk_label;
-            document.getElementById('disk-usage').textContent = data.system_info.disk_usage + '%';
-            document.getElementById('disk-free').textContent = data.system_info.disk_free;
-            document.getElementById('memory-info').textContent = data.system_info.memory_info;  // New
-            
-            // Last update
-            document.getElementById('last-update').textContent = new Date().toLocaleString();
-            
-            // Update chart
-            if (batteryChart) {
-                const now = new Date().toLocaleTimeString([], { hour: '2-digit', minute: '2-digit' });
-                batteryChart.data.labels.push(now);
-                batteryChart.data.datasets[0].data.push(parseFloat(data.battery_level));
-                batteryChart.data.datasets[1].data.push(parseFloat(data.voltage));
-                
-                if (batteryChart.data.labels.length > 50) {
-                    batteryChart.data.labels.shift();
-                    batteryChart.data.datasets[0].data.shift();
-                    batteryChart.data.datasets[1].data.shift();
-                }
-                
-                batteryChart.update();
-            }
-        }
-        
-        // Dark mode toggle
-        function toggleDarkMode() {
-            document.documentElement.classList.toggle('dark');
-            localStorage.setItem('darkMode', document.documentElement.classList.contains('dark'));
-            const icon = document.getElementById('darkModeIcon');
-            if (document.documentElement.classList.contains('dark')) {
-                icon.innerHTML = '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 3v1m0 16v1m9-9h-1M4 12H3m15.364 6.364l-.707-.707M6.343 6.343l-.707-.707m12.728 0l-.707.707M6.343 17.657l-.707.707M16 12a4 4 0 11-8 0 4 4 0 018 0z"></path>';
-            } else {
-                icon.innerHTML = '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M20.354 15.354A9 9 0 018.646 3.646 9.003 9.003 0 0012 21a9.003 9.003 0 008.354-5.646z"></path>';
-            }
-        }
-        
-        // Load dark mode preference
-        if (localStorage.getItem('darkMode') === 'true') {
-            document.documentElement.classList.add('dark');
-            document.getElementById('darkModeIcon').innerHTML = '<path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 3v1m0 16v1m9-9h-1M4 12H3m15.364 6.364l-.707-.707M6.343 6.343l-.707-.707m12.728 0l-.707.707M6.343 17.657l-.707.707M16 12a4 4 0 11-8 0 4 4 0 018 0z"></path>';
-        }
-        
-        // Section collapse toggle
-        function toggleSection(section) {
-            const content = document.getElementById(section + '-content');
-            const arrow = document.getElementById(section + '-arrow');
-            
-            content.classList.toggle('open');
-            arrow.classList.toggle('rotate-180');
-        }
-        
-        // Refresh logs
-        function refreshLogs() {
-            fetch('/logs').then(r=>r.json()).then(data=>{
-                const el=document.getElementById('log-display');
-                el.innerHTML=data.logs.map(line=>{
-                    const m=line.match(/\[(INFO|WARNING|ERROR|CRITICAL|DEBUG)\]/);
-                    const lvl=m?m[1]:'INFO';
-                    const colored=line.replace(/\[(INFO|WARNING|ERROR|CRITICAL|DEBUG)\]/,`[<span data-level-tag>$1</span>]`);
-                    return `<div class="log-line" data-level="${lvl}">${colored}</div>`;
-                }).join('');
-                el.scrollTop=el.scrollHeight;
-            }).catch(()=>{});  
-        }
-
-        // Auto refresh toggle
-        let autoRefreshInterval;
-        document.addEventListener('DOMContentLoaded', () => {
-            initChart();
-            refreshLogs();
-            
-            const toggle = document.getElementById('auto-refresh-toggle');
-            autoRefreshInterval = setInterval(refreshLogs, 30000);  // Start auto by default
-            
-            toggle.addEventListener('change', () => {
-                if (toggle.checked) {
-                    autoRefreshInterval = setInterval(refreshLogs, 30000);
-                } else {
-                    clearInterval(autoRefreshInterval);
-                }
-            });
-        });
-        
-        // WebSocket event handlers
-        socket.on('connect', () => {
-            console.log('Connected to server');
-            refreshLogs();
-        });
-        
-        socket.on('status_update', (data) => {
-        
-            updateUI(data);
-            
-            // --- Version Check Status Update with Flashing Emojis ---
-            var versionStatusElement = document.getElementById('version-status');
-            var versionInfo = data.latest_version_info;
-            
-            if (versionInfo && versionStatusElement) {
-                if (versionInfo.update_available) {
-                    // Apply flashing class to the lightbulb or star emoji
-                    versionStatusElement.innerHTML = `
-                        <span class="flashing">✨</span>
-                        <span style="color: #9ca3af;">New:</span>
-                        <a href="https://github.com/{{ GITHUB_REPO }}/releases/latest" 
-                           target="_blank" 
-                           style="color: yellow; text-decoration: none;">
-                            ${versionInfo.latest}
-                        </a>
-                    `;
-                    versionStatusElement.className = 'status-indicator text-warning';
-                } else {
-                    // Green dot or robot emoji for up-to-date
-                    versionStatusElement.innerHTML = `✔️`;
-                    // Ensure the flashing class is removed
-                    versionStatusElement.className = 'status-indicator text-success';
-                    
-                }
-            }            
-        });
-        
-        //This is for check-update button
-        document.addEventListener('DOMContentLoaded', function() {
-            const checkButton = document.getElementById('manual-version-check');
-            const checkIcon = checkButton ? checkButton.querySelector('span') : null;
-            const checkForm = document.getElementById('version-check-form');
-            
-            if (checkButton && checkForm && checkIcon) {
-                checkButton.addEventListener('click', function(event) {
-                    event.preventDefault(); 
-
-                    // 1. Client-side message starts immediately (default 5 seconds)
-                    showFlashMessage('info','Checking updates on Git hub now'); 
-                    
-                    // 2. Visual feedback: Spinning gear and disable button
-                    checkIcon.innerHTML = '⚙️'; 
-                    checkIcon.classList.add('spinning');
-                    checkButton.style.pointerEvents = 'none'; 
-                    
-                    // 3. FIX: Use Fetch/AJAX to perform the check without redirecting
-                    fetch('{{ url_for("check_version_manual") }}', {
-                        method: 'POST'
-                    })
-                    .then(response => {
-                        // Check success is handled by the server (Python route returns 200)
-                    })
-                    .catch(error => {
-                        // Handle network errors client-side
-                        showFlashMessage('error','Version check failed due to a network error.');
-                    })
-                    .finally(() => {
-                        // 4. FIX: After the check is complete, reload the page after 5 seconds.
-                        // This ensures the client-side flash message timer runs out (5s), 
-                        // and then the page reloads to show the server-side flash message 
-                        // stored by the Python route.
-                        
-                        setTimeout(() => {
-                            // Remove client-side flash message
-                            closeFlash();
-                            // Load the dashboard to display the server's final flash message
-                            window.location.href = '{{ url_for("dashboard") }}'; 
-                        }, 5000); // Wait for the flash timer (5 seconds)
-                    });
-                });
-            }
-        });      
-        
-        // Initialize on load
-        document.addEventListener('DOMContentLoaded', () => {
-            initChart();
-            refreshLogs();
-            
-            // Auto-refresh logs every 30 seconds
-            setInterval(refreshLogs, 30000);
-        });
-        
-        // Cancel action polling and button logic
-        function pollPendingAction() {
-            fetch('/system/pending')
-                .then(res => res.json())
-                .then(data => {
-                    const panel = document.getElementById('cancel-action-panel');
-                    const timer = document.getElementById('cancel-timer');
-                    const type = document.getElementById('cancel-action-type');
-                    if (data.type) {
-                        panel.classList.remove('hidden');
-                        timer.textContent = data.remaining;
-                        type.textContent = "Pending " + data.type.charAt(0).toUpperCase() + data.type.slice(1);
-                    } else {
-                        panel.classList.add('hidden');
-                    }
-                });
-        }
-        setInterval(pollPendingAction, 1000);
-        document.addEventListener('DOMContentLoaded', pollPendingAction);
-
-        document.getElementById('cancel-action-btn').onclick = function() {
-            fetch('/system/cancel', {method: 'POST'})
-                .then(() => setTimeout(pollPendingAction, 500));
-        };
-
-        if (typeof io !== "undefined") {
-            socket.on('cancel_update', pollPendingAction);
-        }
-        
-    // Intercept reboot form submit
-    document.getElementById('reboot-form').onsubmit = function(e) {
-        e.preventDefault();
-        if (!confirm('⚠️ Are you sure you want to REBOOT the system?')) return false;
-        fetch('/system/control', {
-            method: 'POST',
-            body: new FormData(this)
-        }).then(res => res.json())
-          .then(data => {
-              pollPendingAction();
-          });
-        return false;
-    };
-
-    // Intercept shutdown form submit
-    document.getElementById('shutdown-form').onsubmit = function(e) {
-        e.preventDefault();
-        if (!confirm('🚨 Are you sure you want to SHUTDOWN the system?')) return false;
-        fetch('/system/control', {
-            method: 'POST',
-            body: new FormData(this)
-        }).then(res => res.json())
-          .then(data => {
-              pollPendingAction();
-          });
-        return false;
-    };
-    // Intercept config form submit to handle asynchronously
-    document.getElementById('config-form').onsubmit = function(e) {
-        e.preventDefault();
-        fetch('/configure', {
-            method: 'POST',
-            body: new FormData(this)
-        })
-        .then(res => res.json())
-        .then(data => {
-            if (data.status === 'success') {
-                console.log('Configuration saved:', data.message);
-                // Do not collapse the section; keep it open
-                refreshLogs(); // Update logs to show debug messages if enabled
-            } else {
-                console.error('Configuration save failed:', data.message);
-                showFlashMessage('error', data.message);
-            }
-        })
-        .catch(err => {
-            console.error('Failed to save configuration:', err);
-            showFlashMessage('error', 'Failed to save configuration: ' + err);
-        });
-        return false;
-    };
-    // Cancel action polling and button logic (already present, but ensure it's here)
-    function pollPendingAction() {
-        fetch('/system/pending')
-            .then(res => res.json())
-            .then(data => {
-                const panel = document.getElementById('cancel-action-panel');
-                const timer = document.getElementById('cancel-timer');
-                const type = document.getElementById('cancel-action-type');
-                if (data.type) {
-                    panel.classList.remove('hidden');
-                    timer.textContent = data.remaining;
-                    type.textContent = "Pending " + data.type.charAt(0).toUpperCase() + data.type.slice(1);
-                } else {
-                    panel.classList.add('hidden');
-                }
-            });
-    }
-    setInterval(pollPendingAction, 1000);
-    document.addEventListener('DOMContentLoaded', pollPendingAction);
-    
-    
-  
-    
-    
-    
-
-    document.getElementById('cancel-action-btn').onclick = function() {
-        fetch('/system/cancel', {method: 'POST'})
-            .then(() => setTimeout(pollPendingAction, 500));
-    };
-
-    if (typeof io !== "undefined") {
-        socket.on('cancel_update', pollPendingAction);
-    }
-
-    // Listen for flash_message events from the server
-    socket.on('flash_message', function(data) {
-        showFlashMessage(data.category, data.message);
-    });
-
-    // Dynamically show flash message (with auto-close and ramp color)
-    function showFlashMessage(category, message) {
-        // Remove any existing flash
-        let old = document.getElementById('flash-message');
-        if (old) old.remove();
-
-        // Color classes
-        let colorClass = '';
-        if (category === 'error') colorClass = 'bg-red-100 text-red-800 border-l-4 border-red-500 dark:bg-red-900 dark:text-red-200';
-        else if (category === 'warning') colorClass = 'bg-yellow-100 text-yellow-800 border-l-4 border-yellow-500 dark:bg-yellow-900 dark:text-yellow-200';
-        else colorClass = 'bg-green-100 text-green-800 border-l-4 border-green-500 dark:bg-green-900 dark:text-green-200';
-
-        // Create flash message element
-        let div = document.createElement('div');
-        div.id = 'flash-message';
-        div.className = `alert-banner relative px-4 py-3 rounded-lg flex items-center gap-3 shadow-lg animate-fade-in ${colorClass}`;
-        div.innerHTML = `
-            <span class="font-semibold">${message}</span>
-            <span id="flash-timer" class="ml-3 text-xs font-bold px-2 py-1 rounded bg-white bg-opacity-40 text-gray-700 dark:text-gray-200"></span>
-            <button onclick="closeFlash()" class="absolute top-2 right-2 text-xl font-bold text-gray-400 hover:text-gray-700 dark:hover:text-white" aria-label="Close">&times;</button>
-        `;
-
-        // Insert below header
-        let container = document.querySelector('.max-w-7xl');
-        container.insertBefore(div, container.children[1]);
-
-        // Timer and ramp color
-        let flashSeconds = 5;
-        let timerSpan = div.querySelector('#flash-timer');
-        function rampFlash() {
-            timerSpan.textContent = flashSeconds + 's';
-            div.style.transition = 'background 0.5s';
-            if (flashSeconds === 5) div.style.background = '#f59e0b';
-            else if (flashSeconds === 4) div.style.background = '#fbbf24';
-            else if (flashSeconds === 3) div.style.background = '#fde68a';
-            else if (flashSeconds === 2) div.style.background = '#bbf7d0';
-            else if (flashSeconds === 1) div.style.background = '#a7f3d0';
-            flashSeconds--;
-            if (flashSeconds >= 0) setTimeout(rampFlash, 1000);
-            else closeFlash();
-        }
-        rampFlash();
-    }
-
-    function closeFlash() {
-        let flashMsg = document.getElementById('flash-message');
-        if (flashMsg) {
-            flashMsg.style.opacity = '0';
-            setTimeout(() => {
-                if (flashMsg) flashMsg.remove();
-            }, 300);
-        }
-    }
-    
-    function updateModeEmoji() {
-        fetch('/build').then(r=>r.json()).then(d=>{
-            const el = document.getElementById('mode-emoji');
-            if (el) el.textContent = d.mode_emoji;
-        });
-    }
-    updateModeEmoji();
-     
-    
-    document.addEventListener('DOMContentLoaded', function() {
-        const container = document.getElementById('mouse-glare-test'); 
-
-        if (container) {
-            const overlay = container.querySelector('.mouse-glare-overlay');
-
-            container.addEventListener('mousemove', (e) => {
-                const rect = container.getBoundingClientRect();
-                // Calculate mouse position relative to the container (0, 0 is top-left)
-                const x = e.clientX - rect.left; 
-                const y = e.clientY - rect.top;
-
-                // Dynamically update the radial gradient center point (the 'light source')
-                overlay.style.background = `radial-gradient(
-                    circle at ${x}px ${y}px,
-                    rgba(255, 255, 255, 0.15), /* Brighter light at the center */
-                    transparent 50%
-                )`;
-            });
-            
-            // When the mouse leaves the container, the CSS ':hover' transition handles the fade-out.
+    <!-- Flash banner, cloned by showFlashMessage() -->
+    <template id="flash-tmpl">
+        <div id="flash-message" class="alert-banner relative px-4 py-3 rounded-lg flex items-center gap-3 shadow-lg animate-fade-in">
+            <span class="flash-msg font-semibold"></span>
+            <span id="flash-timer" class="ml-3 text-xs font-bold px-2 py-1 rounded bg-white/40 text-gray-700 dark:text-gray-200"></span>
+            <button type="button" class="flash-close absolute top-2 right-2 text-xl font-bold text-gray-400 hover:text-gray-700 dark:hover:text-white" aria-label="Close">&times;</button>
+        </div>
+    </template>
+    
+    <!-- Loaded after the markup so they don't block first paint; deferred scripts run in order
+         once the document is parsed, so dashboard.js finds io() defined -->
+    <script id="boot-data" type="application/json">
+        {
+            "history": {{ history }},
+            "maxLogLines": {{ MAX_LOG_LINES }},
+            "githubRepo": {{ GITHUB_REPO_JSON }},
+            "checkVersionUrl": {{ url_for('check_version_manual')|tojson }},
+            "dashboardUrl": {{ url_for('dashboard')|tojson }}
         }
-    });    
-    
-    
-    
-  
-    
     </script>
+    <script src="https://cdnjs.cloudflare.com/ajax/libs/socket.io/4.7.5/socket.io.msgpack.min.js" defer></script>
+    <script src="{{ static_url('dashboard.js') }}" defer></script>
     
     <footer class="mt-12 mb-4">
         <div align="center" style="padding: 20px; font-size: 1.1em; color: #222944;">
@@ -3435,6 +3406,40 @@ DASHBOARD_TEMPLATE = '''
 </html>
 '''
 
+# Values fixed for the life of the process are baked into the template text before
+# compiling, so Jinja emits them as literal output instead of looking them up per request
+_TEMPLATE_CONSTANTS = {
+    "VERSION_STRING": VERSION_STRING,
+    "VERSION_BUILD": VERSION_BUILD,
+    "VERSION_NUMBER": VERSION_NUMBER,
+    "CURRENT_VERSION": CURRENT_VERSION,
+    "GITHUB_REPO_JSON": htmlsafe_json_dumps(GITHUB_REPO),  # Markup: baked in as-is, not HTML-escaped
+    "MAX_LOG_LINES": MAX_LOG_LINES,
+}
+
+def _bake_template_constants(template, constants):
+    """Replace {{ NAME }} placeholders for the given constants with their HTML-escaped values"""
+    pattern = r'\{\{\s*(' + '|'.join(map(re.escape, constants)) + r')\s*\}\}'
+    return re.sub(pattern, lambda m: str(escape(constants[m.group(1)])), template)
+
+def _compile_dashboard_template():
+    """Compile the dashboard once, reusing bytecode cached in CONFIG_DIR by earlier runs"""
+    source = _bake_template_constants(DASHBOARD_TEMPLATE, _TEMPLATE_CONSTANTS)
+    # A named, loader-backed template is what Jinja's bytecode cache keys on (source checksum
+    # included, so a new version or edit simply misses the cache)
+    app.jinja_env.loader = ChoiceLoader([DictLoader({'dashboard.html': source}), app.jinja_env.loader])
+    try:
+        os.makedirs(JINJA_CACHE_DIR, mode=0o700, exist_ok=True)  # Bytecode is loaded with marshal: keep it private
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(JINJA_CACHE_DIR)
+        return app.jinja_env.get_template('dashboard.html')
+    except Exception as e:
+        log_message(f"Template bytecode cache unavailable ({e}), compiling in memory", "DEBUG")
+        app.jinja_env.bytecode_cache = None
+        return app.jinja_env.from_string(source)
+
+# Parse/compile the dashboard once instead of on every request
+_DASHBOARD_TPL = _compile_dashboard_template()
+
 
 # Module-level initialization with lock for Gunicorn multi-worker safety
 
@@ -3460,6 +3465,7 @@ def initialize_core_services():
             time_status = get_current_time_str(include_source=True)
             log_message(f"Time source initialized. Current log time is derived from: {time_status}", "INFO")
             init_mqtt()
+            refresh_network_info(force=True)  # Populate the cache before the first status/ntfy
             # STAGE 3: Application Start
             start_monitor()
             send_startup_ntfy()
@@ -3473,18 +3479,15 @@ def initialize_core_services():
 
 
 
-# Module-level initialization for Gunicorn/import cases
-if __name__ != '__main__':
-    initialize_core_services()
-    
-    
-    
-# Main block for direct execution (args and server only)
-if __name__ == '__main__':
-    
-    # Argument parsing and overrides
-    
-    # --- Argument Parsing must run here  ---
+# Importing the module has no hardware side effects: Gunicorn starts the services from its
+# post_worker_init hook (gunicorn.conf.py), direct execution from the main block below
+
+
+
+# --- Command line interface (direct execution) ---
+@lru_cache(maxsize=1)
+def build_parser():
+    """Build the command line parser once (callers share the same instance)"""
     parser = argparse.ArgumentParser(
         description="X728 UPS Monitor - Docker & Host Compatible",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -3615,7 +3618,47 @@ if __name__ == '__main__':
                           action='store_true',
                           help='Disable debug file logging')
 
-    args = parser.parse_args()
+    return parser
+
+# Value options copied into config when given: (argparse dest, config key, log message)
+CLI_CONFIG_OVERRIDES = (
+    ('low_battery', 'low_battery_threshold', "Low battery threshold set to {}% via CLI"),
+    ('critical_battery', 'critical_low_threshold', "Critical battery threshold set to {}% via CLI"),
+    ('cpu_temp', 'cpu_temp_threshold', "CPU temp threshold set to {}°C via CLI"),
+    ('disk_space', 'disk_space_threshold', "Disk space threshold set to {}GB via CLI"),
+    ('monitor_interval', 'monitor_interval', "Monitor interval set to {}s via CLI"),
+    ('shutdown_delay', 'shutdown_delay', "Shutdown delay set to {}s via CLI"),
+    ('ntfy_server', 'ntfy_server', "ntfy server set to {} via CLI"),
+    ('ntfy_topic', 'ntfy_topic', "ntfy topic set to {} via CLI"),
+)
+
+# On/off flags: (argparse dest, config key, value when set, log message, log level); later entries win
+CLI_CONFIG_FLAGS = (
+    ('disable_auto_shutdown', 'enable_auto_shutdown', 0, "Auto-shutdown disabled via CLI", "WARNING"),
+    ('enable_ntfy', 'enable_ntfy', 1, "ntfy notifications enabled via CLI", "INFO"),
+    ('disable_ntfy', 'enable_ntfy', 0, "ntfy notifications disabled via CLI", "INFO"),
+)
+
+def apply_cli_config_overrides(args):
+    """Copy the table-driven command line options into config"""
+    for dest, key, message in CLI_CONFIG_OVERRIDES:
+        value = getattr(args, dest)
+        if value is None or value == '':
+            continue
+        config[key] = value
+        log_message(message.format(value), "INFO")
+    for dest, key, value, message, level in CLI_CONFIG_FLAGS:
+        if getattr(args, dest):
+            config[key] = value
+            log_message(message, level)
+
+
+
+# Main block for direct execution (args and server only)
+if __name__ == '__main__':
+    
+    # Argument parsing and overrides
+    args = build_parser().parse_args()
     
     
     
@@ -3663,36 +3706,8 @@ if __name__ == '__main__':
             X728_HW_VERSION = args.hw_version
             version_source = "Command-Line Argument (--hw-version)"
         
-        # Battery thresholds
-        if args.low_battery is not None:
-            config['low_battery_threshold'] = args.low_battery
-            log_message(f"Low battery threshold set to {args.low_battery}% via CLI", "INFO")
-        
-        if args.critical_battery is not None:
-            config['critical_low_threshold'] = args.critical_battery
-            log_message(f"Critical battery threshold set to {args.critical_battery}% via CLI", "INFO")
-        
-        # System thresholds
-        if args.cpu_temp is not None:
-            config['cpu_temp_threshold'] = args.cpu_temp
-            log_message(f"CPU temp threshold set to {args.cpu_temp}°C via CLI", "INFO")
-        
-        if args.disk_space is not None:
-            config['disk_space_threshold'] = args.disk_space
-            log_message(f"Disk space threshold set to {args.disk_space}GB via CLI", "INFO")
-        
-        # Monitoring settings
-        if args.monitor_interval is not None:
-            config['monitor_interval'] = args.monitor_interval
-            log_message(f"Monitor interval set to {args.monitor_interval}s via CLI", "INFO")
-        
-        if args.shutdown_delay is not None:
-            config['shutdown_delay'] = args.shutdown_delay
-            log_message(f"Shutdown delay set to {args.shutdown_delay}s via CLI", "INFO")
-        
-        if args.disable_auto_shutdown:
-            config['enable_auto_shutdown'] = 0
-            log_message("Auto-shutdown disabled via CLI", "WARNING")
+        # Thresholds, intervals, ntfy and auto-shutdown settings
+        apply_cli_config_overrides(args)
         
         # MQTT settings
         if args.mqtt_broker:
@@ -3719,23 +3734,6 @@ if __name__ == '__main__':
             MQTT_PUBLISH_INTERVAL_SEC = args.mqtt_publish_interval
             log_message(f"MQTT publish interval set to {args.mqtt_publish_interval}s via CLI", "INFO")
         
-        # Notification settings
-        if args.enable_ntfy:
-            config['enable_ntfy'] = 1
-            log_message("ntfy notifications enabled via CLI", "INFO")
-        
-        if args.disable_ntfy:
-            config['enable_ntfy'] = 0
-            log_message("ntfy notifications disabled via CLI", "INFO")
-        
-        if args.ntfy_server:
-            config['ntfy_server'] = args.ntfy_server
-            log_message(f"ntfy server set to {args.ntfy_server} via CLI", "INFO")
-        
-        if args.ntfy_topic:
-            config['ntfy_topic'] = args.ntfy_topic
-            log_message(f"ntfy topic set to {args.ntfy_topic} via CLI", "INFO")
-        
         # Logging settings
         if args.log_level:
             LOG_LEVEL = args.log_level.upper()
@@ -3780,8 +3778,8 @@ if __name__ == '__main__':
             host='0.0.0.0', 
             port=7728, 
             debug=False,
-            allow_unsafe_werkzeug=True,
-            use_reloader=False
+            use_reloader=False,
+            log_output=False  # No per-request access log lines on the console
         )
     except Exception as e:
         log_message(f"Flask/SocketIO server failed to start: {e}", "CRITICAL")
\ No newline at end of file
@@ -0,0 +1,786 @@
+// Dashboard page script (served from static/, cached by the browser).
+// Per-request values come from the page's <script id="boot-data" type="application/json">
+// block (inert data: parsed, never executed as script).
+const BOOT = JSON.parse(document.getElementById('boot-data').textContent);
+
+// WebSocket Connection
+const socket = io();
+
+// Battery history chart: a small Canvas 2D line chart (battery % on the left axis,
+// voltage on the right), redrawn only when samples change or the canvas is resized
+const historyData = BOOT.history;
+
+// Chart samples live in fixed-size ring buffers; new points overwrite the oldest slot
+// and the drawer reads them in place
+const CHART_POINTS = 50;
+const battBuf = new Float64Array(CHART_POINTS);
+const voltBuf = new Float64Array(CHART_POINTS);
+const labelBuf = new Array(CHART_POINTS);
+let chartHead = 0;   // Next slot to write
+let chartCount = 0;  // Filled slots
+const chartTimeFormat = new Intl.DateTimeFormat([], { hour: '2-digit', minute: '2-digit' });
+
+function writeChartSample(label, battery, voltage) {
+    labelBuf[chartHead] = label;
+    battBuf[chartHead] = battery;
+    voltBuf[chartHead] = voltage;
+    chartHead = (chartHead + 1) % CHART_POINTS;
+    chartCount = Math.min(chartCount + 1, CHART_POINTS);
+}
+
+// Ring slot of the i-th plotted sample (0 = oldest)
+function chartSlot(i) {
+    return (chartHead - chartCount + i + CHART_POINTS) % CHART_POINTS;
+}
+
+const CHART_SERIES = [
+    { label: 'Battery %', buf: battBuf, color: 'rgb(59, 130, 246)', hidden: false },
+    { label: 'Voltage', buf: voltBuf, color: 'rgb(168, 85, 247)', hidden: false }
+];
+const CHART_PAD = Object.freeze({ top: 32, right: 44, bottom: 22, left: 40 });
+const CHART_TICKS = 4;
+const CHART_TEXT = '#666';
+const CHART_GRID = 'rgba(0, 0, 0, 0.1)';
+let chartCanvas = null;
+let chartCtx = null;
+let chartW = 0;
+let chartH = 0;
+let legendBoxes = [];  // Legend hit areas from the last draw: { x, y, w, h, series }
+
+// Plot area in CSS pixels
+function chartArea() {
+    return { x0: CHART_PAD.left, x1: chartW - CHART_PAD.right, y0: CHART_PAD.top, y1: chartH - CHART_PAD.bottom };
+}
+
+function chartX(area, i) {
+    return chartCount > 1 ? area.x0 + (area.x1 - area.x0) * i / (chartCount - 1) : (area.x0 + area.x1) / 2;
+}
+
+// Axis range of a series with 10% headroom (or +/-1 unit for a flat line)
+function seriesRange(buf) {
+    let min = Infinity, max = -Infinity;
+    for (let i = 0; i < chartCount; i++) {
+        const v = buf[chartSlot(i)];
+        if (v < min) min = v;
+        if (v > max) max = v;
+    }
+    const pad = (max - min) * 0.1 || 1;
+    return { min: min - pad, max: max + pad };
+}
+
+// Match the canvas backing store to its laid-out size and the display's pixel ratio
+function resizeChart() {
+    const dpr = window.devicePixelRatio || 1;
+    chartW = chartCanvas.clientWidth;
+    chartH = chartCanvas.clientHeight;
+    chartCanvas.width = Math.round(chartW * dpr);
+    chartCanvas.height = Math.round(chartH * dpr);
+    chartCtx.setTransform(dpr, 0, 0, dpr, 0, 0);
+    drawChart();
+}
+
+function drawChart() {
+    const ctx = chartCtx;
+    const area = chartArea();
+    ctx.clearRect(0, 0, chartW, chartH);
+    ctx.font = '12px "Helvetica Neue", Helvetica, Arial, sans-serif';
+    ctx.lineWidth = 1;
+
+    // Legend, centred above the plot; click toggles a series
+    legendBoxes = [];
+    const widths = CHART_SERIES.map(s => 40 + ctx.measureText(s.label).width);
+    let lx = (chartW - widths.reduce((a, b) => a + b, 0)) / 2;
+    ctx.textBaseline = 'middle';
+    ctx.textAlign = 'left';
+    CHART_SERIES.forEach((series, k) => {
+        ctx.strokeStyle = series.color;
+        ctx.strokeRect(lx, 6, 30, 10);
+        ctx.fillStyle = CHART_TEXT;
+        ctx.fillText(series.label, lx + 34, 11);
+        if (series.hidden) ctx.fillRect(lx + 34, 11, widths[k] - 40, 1);
+        legendBoxes.push({ x: lx, y: 0, w: widths[k], h: 22, series });
+        lx += widths[k];
+    });
+
+    if (!chartCount) return;
+    const ranges = CHART_SERIES.map(s => seriesRange(s.buf));
+    // Enough decimals for neighbouring tick labels to differ
+    const decimals = ranges.map(r => Math.max(0, Math.min(3, Math.ceil(-Math.log10((r.max - r.min) / CHART_TICKS)))));
+
+    // Horizontal grid with battery ticks on the left and voltage ticks on the right
+    ctx.strokeStyle = CHART_GRID;
+    ctx.fillStyle = CHART_TEXT;
+    for (let t = 0; t <= CHART_TICKS; t++) {
+        const y = area.y1 - (area.y1 - area.y0) * t / CHART_TICKS;
+        ctx.beginPath();
+        ctx.moveTo(area.x0, y);
+        ctx.lineTo(area.x1, y);
+        ctx.stroke();
+        ranges.forEach((r, k) => {
+            ctx.textAlign = k === 0 ? 'right' : 'left';
+            ctx.fillText((r.min + (r.max - r.min) * t / CHART_TICKS).toFixed(decimals[k]),
+                k === 0 ? area.x0 - 6 : area.x1 + 6, y);
+        });
+    }
+
+    // Time labels, at most 6 across the axis
+    ctx.textAlign = 'center';
+    ctx.textBaseline = 'top';
+    const every = Math.ceil(chartCount / 6);
+    for (let i = 0; i < chartCount; i += every) {
+        ctx.fillText(labelBuf[chartSlot(i)], chartX(area, i), area.y1 + 6);
+    }
+
+    // Series lines
+    ctx.lineWidth = 2;
+    ctx.lineJoin = 'round';
+    CHART_SERIES.forEach((series, k) => {
+        if (series.hidden) return;
+        const r = ranges[k];
+        ctx.strokeStyle = series.color;
+        ctx.beginPath();
+        for (let i = 0; i < chartCount; i++) {
+            const y = area.y1 - (series.buf[chartSlot(i)] - r.min) / (r.max - r.min) * (area.y1 - area.y0);
+            if (i) ctx.lineTo(chartX(area, i), y); else ctx.moveTo(chartX(area, i), y);
+        }
+        ctx.stroke();
+    });
+}
+
+// Replace the chart contents with a 'chart_sync' history frame: labels plus a binary
+// buffer of float32 samples (all battery values, then all voltages)
+function loadChartFrame(frame) {
+    if (!chartCtx || !frame) return;
+    // Copy into a fresh (4-byte aligned) buffer; the decoder may hand back an unaligned view
+    const samples = new Float32Array(new Uint8Array(frame.samples).slice().buffer);
+    const n = frame.labels.length;
+    chartHead = chartCount = 0;
+    for (let i = 0; i < n; i++) {
+        // Round off float32 noise (4.012 -> 4.0120000839) so tooltips show the recorded value
+        writeChartSample(frame.labels[i],
+            Math.round(samples[i] * 1000) / 1000,
+            Math.round(samples[n + i] * 1000) / 1000);
+    }
+    lastPlotted = null;
+    drawChart();
+}
+
+function initChart() {
+    chartCanvas = document.getElementById('batteryChart');
+    if (!chartCanvas) return;
+    chartCtx = chartCanvas.getContext('2d');
+
+    historyData.forEach(d => writeChartSample(d.time, d.battery, d.voltage));
+    resizeChart();
+
+    // Debounce container resizes instead of re-laying out the chart per event
+    let resizeTimer = null;
+    new ResizeObserver(() => {
+        clearTimeout(resizeTimer);
+        resizeTimer = setTimeout(resizeChart, 250);
+    }).observe(chartCanvas);
+
+    chartCanvas.addEventListener('click', (evt) => {
+        const hit = legendBoxes.find(b => evt.offsetX >= b.x && evt.offsetX < b.x + b.w
+            && evt.offsetY >= b.y && evt.offsetY < b.y + b.h);
+        if (!hit) return;
+        hit.series.hidden = !hit.series.hidden;
+        drawChart();
+    });
+
+    // Hover is a DOM tooltip moved with transform, so mouse movement never redraws the canvas
+    const tooltipEl = document.getElementById('chart-tooltip');
+    chartCanvas.addEventListener('mousemove', (evt) => {
+        const area = chartArea();
+        if (!chartCount || evt.offsetX < area.x0 - 10 || evt.offsetX > area.x1 + 10) {
+            tooltipEl.style.opacity = 0;
+            return;
+        }
+        const i = chartCount > 1
+            ? Math.min(chartCount - 1, Math.max(0, Math.round((evt.offsetX - area.x0) / (area.x1 - area.x0) * (chartCount - 1))))
+            : 0;
+        const j = chartSlot(i);
+        const x = chartX(area, i);
+        tooltipEl.textContent = `${labelBuf[j]}\nBattery: ${battBuf[j]}%\nVoltage: ${voltBuf[j]}V`;
+        // Flip to the left of the cursor on the right half so it stays inside the card
+        const shiftX = x > chartW / 2 ? 'calc(-100% - 10px)' : '10px';
+        tooltipEl.style.transform = `translate(${x}px, ${evt.offsetY}px) translateX(${shiftX})`;
+        tooltipEl.style.opacity = 1;
+    }, { passive: true });
+    chartCanvas.addEventListener('mouseleave', () => { tooltipEl.style.opacity = 0; }, { passive: true });
+}
+
+// Update UI with WebSocket data
+// Full class strings per state, so each element gets a single className write
+// (one style invalidation) instead of a series of classList add/remove calls
+const FILL_CLASS = Object.freeze({
+    critical: 'h-full bg-gradient-to-r from-red-600 to-red-500 transition-all duration-500',
+    low: 'h-full bg-gradient-to-r from-yellow-500 to-orange-500 transition-all duration-500',
+    ok: 'h-full bg-gradient-to-r from-green-500 to-blue-500 transition-all duration-500'
+});
+const STATE_CFG = Object.freeze({
+    'On AC Power': {
+        badge: 'status-badge mt-2 bg-green-100 text-green-800 dark:bg-green-900 dark:text-green-200',
+        pulse: 'status-pulse bg-green-500'
+    },
+    'On Battery': {
+        badge: 'status-badge mt-2 bg-yellow-100 text-yellow-800 dark:bg-yellow-900 dark:text-yellow-200',
+        pulse: 'status-pulse bg-yellow-500'
+    },
+    default: {
+        badge: 'status-badge mt-2 bg-red-100 text-red-800 dark:bg-red-900 dark:text-red-200',
+        pulse: 'status-pulse bg-red-500'
+    }
+});
+
+// Elements written on every status message, log line or pending-action poll,
+// looked up once (this script runs after the markup)
+const ui = Object.freeze({
+    batteryLevel: document.getElementById('battery-level'),
+    batteryFill: document.getElementById('battery-fill'),
+    voltage: document.getElementById('voltage'),
+    powerState: document.getElementById('power-state'),
+    powerBadge: document.getElementById('power-state-badge'),
+    powerPulse: document.querySelector('#power-state-badge .status-pulse'),
+    timeRemaining: document.getElementById('time-remaining'),
+    cpuTemp: document.getElementById('cpu-temp'),
+    network: document.getElementById('network'),
+    diskLabel: document.getElementById('disk-label'),
+    diskUsage: document.getElementById('disk-usage'),
+    diskFree: document.getElementById('disk-free'),
+    memoryInfo: document.getElementById('memory-info'),
+    lastUpdate: document.getElementById('last-update'),
+    versionStatus: document.getElementById('version-status'),
+    logDisplay: document.getElementById('log-display'),
+    liveLogs: document.getElementById('auto-refresh-toggle'),
+    cancelPanel: document.getElementById('cancel-action-panel'),
+    cancelTimer: document.getElementById('cancel-timer'),
+    cancelType: document.getElementById('cancel-action-type'),
+    flashContainer: document.querySelector('.max-w-7xl'),
+    modeEmoji: document.getElementById('mode-emoji')
+});
+
+// Power state the badge currently shows (initially as rendered by the server)
+let renderedPowerState = ui.powerState.textContent;
+
+// The page's readings were taken as it was rendered; stamp them with the browser clock
+ui.lastUpdate.textContent = new Date().toLocaleString();
+
+// Last value written to each ui element, so unchanged fields cost no DOM write
+const rendered = {};
+
+function setText(key, text) {
+    if (rendered[key] === text) return;
+    rendered[key] = text;
+    ui[key].textContent = text;
+}
+
+function updateUI(data) {
+    // Battery
+    const battery = parseFloat(data.battery_level);
+    setText('batteryLevel', battery.toFixed(1) + '%');
+    if (rendered.batteryFill !== battery) {
+        rendered.batteryFill = battery;
+        ui.batteryFill.style.width = battery + '%';
+        // Color coding
+        ui.batteryFill.className = battery <= 10 ? FILL_CLASS.critical : battery <= 30 ? FILL_CLASS.low : FILL_CLASS.ok;
+    }
+
+    // Voltage & Current
+    setText('voltage', parseFloat(data.voltage).toFixed(2) + 'V');
+
+    // Power State
+    const powerState = data.power_state;
+    setText('powerState', powerState);
+    if (powerState !== renderedPowerState) {
+        const cfg = STATE_CFG[powerState] || STATE_CFG.default;
+        ui.powerBadge.className = cfg.badge;
+        ui.powerPulse.className = cfg.pulse;
+        renderedPowerState = powerState;
+    }
+
+    // Time remaining
+    setText('timeRemaining', '⏱️ ' + data.time_remaining);
+
+    // System info
+    const info = data.system_info;
+    setText('cpuTemp', info.cpu_temp + '°C');
+    const network = `${info.network} ${info.network_status === 'connected' ? '🟢' : '🔴'}`;
+    if (rendered.network !== network) {
+        rendered.network = network;
+        ui.network.innerHTML = network;
+    }
+    setText('diskLabel', info.disk_label);
+    setText('diskUsage', info.disk_usage + '%');
+    setText('diskFree', info.disk_free);
+    setText('memoryInfo', info.memory_info);
+
+    // Last update
+    ui.lastUpdate.textContent = new Date().toLocaleString();
+
+    // Redraw chart (points were already appended by pushChartPoint)
+    if (chartCtx && chartDirty) {
+        chartDirty = false;
+        drawChart();
+    }
+}
+
+// Append a sample to the chart data without drawing; called for every status message
+// so no points are lost when several messages land in one frame (or the tab is hidden).
+// Every sample goes into the ring buffer; the redraw is skipped while the reading stays within
+// CHART_MIN_DELTA (both battery % and volts) of the last drawn one and the minute label is
+// unchanged, so a steady reading still moves the time axis once a minute
+const CHART_MIN_DELTA = 0.05;
+let lastPlotted = null;
+let chartDirty = false;
+
+function pushChartPoint(data) {
+    if (!chartCtx) return;
+    const battery = parseFloat(data.battery_level);
+    const voltage = parseFloat(data.voltage);
+    const label = chartTimeFormat.format(Date.now());
+    writeChartSample(label, battery, voltage);
+    if (lastPlotted && label === lastPlotted.label
+            && Math.abs(battery - lastPlotted.battery) < CHART_MIN_DELTA
+            && Math.abs(voltage - lastPlotted.voltage) < CHART_MIN_DELTA) {
+        return;
+    }
+    lastPlotted = { battery, voltage, label };
+    chartDirty = true;
+}
+
+// Dark mode toggle
+// The server renders the page in the saved mode (dark_mode cookie), so nothing is read at startup
+let darkMode = document.documentElement.classList.contains('dark');
+const darkModeIcon = document.querySelector('#darkModeIcon use');
+const iconSprite = darkModeIcon.getAttribute('href').split('#')[0];
+
+function toggleDarkMode() {
+    darkMode = !darkMode;
+    document.documentElement.classList.toggle('dark', darkMode);
+    darkModeIcon.setAttribute('href', iconSprite + (darkMode ? '#icon-sun' : '#icon-moon'));
+    document.cookie = `dark_mode=${darkMode ? 1 : 0}; max-age=31536000; path=/; SameSite=Lax`;
+}
+
+// Section collapse toggle
+function toggleSection(section) {
+    const content = document.getElementById(section + '-content');
+    const arrow = document.getElementById(section + '-arrow');
+
+    content.classList.toggle('open');
+    arrow.classList.toggle('rotate-180');
+}
+
+// Refresh logs (and, while the socket is down, the status cards) from the aggregate endpoint.
+// logTotal is the server's line counter as of the last line shown; only newer lines are fetched
+// Only one refresh is in flight at a time; calls made meanwhile collapse into one follow-up
+let logTotal = null;
+let logsInFlight = null;
+let logsRefreshQueued = false;
+const REFRESH_TIMEOUT_MS = 10000;
+
+function refreshLogs() {
+    if (logsInFlight) {
+        logsRefreshQueued = true;
+        return;
+    }
+    const ac = new AbortController();
+    logsInFlight = ac;
+    const timer = setTimeout(() => ac.abort(), REFRESH_TIMEOUT_MS);
+    const url = logTotal === null ? '/api/dashboard' : `/api/dashboard?since=${logTotal}`;
+    fetch(url, { signal: ac.signal, cache: 'no-store', headers: { 'Accept': 'application/json' } }).then(r=>r.json()).then(data=>{
+        if (!socket.connected && data.telemetry && data.system_info) {
+            const status = Object.assign({}, data.telemetry, {
+                system_info: data.system_info,
+                latest_version_info: data.version_status
+            });
+            socket.listeners('status_update').forEach((handler) => handler(status));
+        }
+        const logs = data.logs_tail;
+        if (!logs) return;
+        appendLogLines(logs.lines, logs.reset);
+        logTotal = logs.total;
+    }).catch(()=>{}).finally(() => {
+        clearTimeout(timer);
+        logsInFlight = null;
+        if (logsRefreshQueued) {
+            logsRefreshQueued = false;
+            refreshLogs();
+        }
+    });
+}
+
+// Log lines are built as DOM nodes with textContent - never parsed as HTML
+const LOG_LEVEL_RE = /\[(INFO|WARNING|ERROR|CRITICAL|DEBUG)\]/;
+
+function logLineNode(line) {
+    const div = document.createElement('div');
+    div.className = 'log-line';
+    const m = LOG_LEVEL_RE.exec(line);
+    div.dataset.level = m ? m[1] : 'INFO';
+    if (m) {
+        const tag = document.createElement('span');
+        tag.setAttribute('data-level-tag', '');
+        tag.textContent = m[1];
+        div.append(line.slice(0, m.index + 1), tag, line.slice(m.index + m[0].length - 1));
+    } else {
+        div.textContent = line;
+    }
+    return div;
+}
+
+// The panel keeps the same number of lines as the server-side buffer
+const MAX_LOG_LINES = BOOT.maxLogLines;
+
+function appendLogLines(lines, reset) {
+    const el = ui.logDisplay;
+    const atBottom = reset || el.scrollHeight - el.scrollTop - el.clientHeight < 4;
+    if (reset) el.textContent = '';
+    const frag = document.createDocumentFragment();
+    lines.forEach(line => frag.appendChild(logLineNode(line)));
+    el.appendChild(frag);
+    while (el.childElementCount > MAX_LOG_LINES) el.removeChild(el.firstChild);
+    if (atBottom) el.scrollTop = el.scrollHeight;  // Don't yank the view if the user scrolled up
+}
+
+// New log lines are pushed by the server ('log_append'); a gap in the line counter
+// (e.g. lines logged while paused) is filled from the server instead
+socket.on('log_append', (msg) => {
+    if (!ui.liveLogs.checked) return;
+    if (logTotal === null || msg.total - msg.lines.length !== logTotal) {
+        refreshLogs();
+        return;
+    }
+    appendLogLines(msg.lines, false);
+    logTotal = msg.total;
+});
+
+// Polling only runs as a fallback while the socket is down
+let fallbackPollInterval = null;
+
+socket.on('disconnect', () => {
+    if (!fallbackPollInterval) fallbackPollInterval = setInterval(refreshLogs, 30000);
+});
+
+// WebSocket event handlers
+// The server batches events into 'ui_batch' frames of [event, data] pairs; replay each
+// one through the regular handlers registered below
+socket.on('ui_batch', (batch) => {
+    batch.forEach(([event, data]) => {
+        socket.listeners(event).forEach((handler) => handler(data));
+    });
+});
+
+socket.on('connect', () => {
+    console.log('Connected to server');
+    clearInterval(fallbackPollInterval);
+    fallbackPollInterval = null;
+    if (logTotal !== null) {
+        // Reconnect: catch up (init() does the first load, and the page seeded the chart)
+        refreshLogs();
+        socket.emit('chart_sync', loadChartFrame);
+    }
+    pollPendingAction();
+});
+
+// Last full status; 'status_delta' merge patches (RFC 7386) are applied on top of it
+let uiState = null;
+
+function applyMergePatch(target, patch) {
+    for (const [key, value] of Object.entries(patch)) {
+        if (value === null) {
+            delete target[key];
+        } else if (typeof value === 'object' && !Array.isArray(value)
+                   && typeof target[key] === 'object' && target[key] !== null) {
+            applyMergePatch(target[key], value);
+        } else {
+            target[key] = value;
+        }
+    }
+    return target;
+}
+
+socket.on('status_delta', (delta) => {
+    if (!uiState) return;  // No baseline yet; the server resends in full after connect
+    applyMergePatch(uiState, delta);
+    socket.listeners('status_update').forEach((handler) => handler(uiState));
+});
+
+// DOM writes are coalesced to one per animation frame: the socket handler only records
+// the latest status, and renderStatus() applies it on the next frame
+let pendingStatus = null;
+let renderScheduled = false;
+
+socket.on('status_update', (data) => {
+    uiState = data;
+    pushChartPoint(data);
+    pendingStatus = data;
+    if (!renderScheduled) {
+        renderScheduled = true;
+        requestAnimationFrame(renderStatus);
+    }
+});
+
+function renderStatus() {
+    renderScheduled = false;
+    const data = pendingStatus;
+    pendingStatus = null;
+    if (!data) return;
+    updateUI(data);
+    applyVersionStatus(data.latest_version_info);
+}
+
+// --- Version Check Status Update with Flashing Emojis ---
+// The same version info comes with every full status; only touch the DOM when it changes
+let lastVersionKey = '';
+
+function applyVersionStatus(versionInfo) {
+    var versionStatusElement = ui.versionStatus;
+    if (!versionInfo || !versionStatusElement) return;
+    const key = `${versionInfo.update_available}|${versionInfo.latest}`;
+    if (key === lastVersionKey) return;
+    lastVersionKey = key;
+
+    if (versionInfo.update_available) {
+        // Apply flashing class to the lightbulb or star emoji
+        versionStatusElement.innerHTML = `
+            <span class="flashing">✨</span>
+            <span style="color: #9ca3af;">New:</span>
+            <a href="https://github.com/${BOOT.githubRepo}/releases/latest" 
+               target="_blank" 
+               style="color: yellow; text-decoration: none;">
+                ${versionInfo.latest}
+            </a>
+        `;
+        versionStatusElement.className = 'status-indicator text-warning';
+    } else {
+        // Green dot or robot emoji for up-to-date
+        versionStatusElement.innerHTML = `✔️`;
+        // Ensure the flashing class is removed
+        versionStatusElement.className = 'status-indicator text-success';
+    }
+}
+
+//This is for check-update button
+function initVersionCheck() {
+    const checkButton = document.getElementById('manual-version-check');
+    const checkIcon = checkButton ? checkButton.querySelector('span') : null;
+    const checkForm = document.getElementById('version-check-form');
+
+    if (checkButton && checkForm && checkIcon) {
+        checkButton.addEventListener('click', function(event) {
+            event.preventDefault(); 
+
+            // 1. Client-side message starts immediately (default 5 seconds)
+            showFlashMessage('info','Checking updates on Git hub now'); 
+
+            // 2. Visual feedback: Spinning gear and disable button
+            checkIcon.innerHTML = '⚙️'; 
+            checkIcon.classList.add('spinning');
+            checkButton.style.pointerEvents = 'none'; 
+
+            // 3. FIX: Use Fetch/AJAX to perform the check without redirecting
+            fetch(BOOT.checkVersionUrl, {
+                method: 'POST'
+            })
+            .then(response => {
+                // Check success is handled by the server (Python route returns 200)
+            })
+            .catch(error => {
+                // Handle network errors client-side
+                showFlashMessage('error','Version check failed due to a network error.');
+            })
+            .finally(() => {
+                // 4. FIX: After the check is complete, reload the page after 5 seconds.
+                // This ensures the client-side flash message timer runs out (5s), 
+                // and then the page reloads to show the server-side flash message 
+                // stored by the Python route.
+
+                setTimeout(() => {
+                    // Remove client-side flash message
+                    closeFlash();
+                    // Load the dashboard to display the server's final flash message
+                    window.location.href = BOOT.dashboardUrl; 
+                }, 5000); // Wait for the flash timer (5 seconds)
+            });
+        });
+    }
+}
+
+// Cancel action panel. The server's countdown emits 'cancel_update' every second while an
+// action is pending (and once when it's canceled or done), so /system/pending is only
+// fetched to hydrate the panel when the socket (re)connects and after our own requests
+function updatePendingPanel(data) {
+    if (data.type) {
+        ui.cancelPanel.classList.remove('hidden');
+        ui.cancelTimer.textContent = data.remaining;
+        ui.cancelType.textContent = "Pending " + data.type.charAt(0).toUpperCase() + data.type.slice(1);
+    } else {
+        ui.cancelPanel.classList.add('hidden');
+    }
+}
+
+function pollPendingAction() {
+    fetch('/system/pending')
+        .then(res => res.json())
+        .then(updatePendingPanel);
+}
+
+document.getElementById('cancel-action-btn').onclick = function() {
+    fetch('/system/cancel', {method: 'POST'})
+        .then(() => setTimeout(pollPendingAction, 500));
+};
+
+socket.on('cancel_update', updatePendingPanel);
+
+// Reboot/shutdown: the few form fields go out URL-encoded (not multipart), and keepalive
+// lets the request complete even if the tab is closed or reloaded right after submitting
+function postSystemControl(form) {
+    fetch('/system/control', {
+        method: 'POST',
+        body: new URLSearchParams(new FormData(form)),
+        keepalive: true
+    }).then(res => res.json())
+      .then(data => {
+          pollPendingAction();
+      });
+}
+
+// Intercept reboot form submit
+document.getElementById('reboot-form').onsubmit = function(e) {
+    e.preventDefault();
+    if (!confirm('⚠️ Are you sure you want to REBOOT the system?')) return false;
+    postSystemControl(this);
+    return false;
+};
+
+// Intercept shutdown form submit
+document.getElementById('shutdown-form').onsubmit = function(e) {
+    e.preventDefault();
+    if (!confirm('🚨 Are you sure you want to SHUTDOWN the system?')) return false;
+    postSystemControl(this);
+    return false;
+};
+// Intercept config form submit to handle asynchronously
+document.getElementById('config-form').onsubmit = function(e) {
+    e.preventDefault();
+    fetch('/configure', {
+        method: 'POST',
+        body: new URLSearchParams(new FormData(this))  // URL-encoded, parsed by request.form as before
+    })
+    .then(res => res.json())
+    .then(data => {
+        if (data.status === 'success') {
+            console.log('Configuration saved:', data.message);
+            // Do not collapse the section; keep it open
+            refreshLogs(); // Update logs to show debug messages if enabled
+        } else {
+            console.error('Configuration save failed:', data.message);
+            showFlashMessage('error', data.message);
+        }
+    })
+    .catch(err => {
+        console.error('Failed to save configuration:', err);
+        showFlashMessage('error', 'Failed to save configuration: ' + err);
+    });
+    return false;
+};
+
+// Listen for flash_message events from the server
+socket.on('flash_message', function(data) {
+    showFlashMessage(data.category, data.message);
+});
+
+// Dynamically show flash message (with auto-close and ramp color)
+const flashTemplate = document.getElementById('flash-tmpl');
+// The banner currently on screen, if any (at most one at a time)
+let flashBanner = null;
+const FLASH_CLASS = Object.freeze({
+    error: 'bg-red-100 text-red-800 border-l-4 border-red-500 dark:bg-red-900 dark:text-red-200',
+    warning: 'bg-yellow-100 text-yellow-800 border-l-4 border-yellow-500 dark:bg-yellow-900 dark:text-yellow-200',
+    success: 'bg-green-100 text-green-800 border-l-4 border-green-500 dark:bg-green-900 dark:text-green-200'
+});
+
+function showFlashMessage(category, message) {
+    // Remove any existing flash
+    if (flashBanner) flashBanner.remove();
+
+    // Clone the banner from its <template>; the message goes in as text, never parsed as HTML
+    let div = flashTemplate.content.firstElementChild.cloneNode(true);
+    div.classList.add(...(FLASH_CLASS[category] || FLASH_CLASS.success).split(' '));
+    div.querySelector('.flash-msg').textContent = message;
+    div.querySelector('.flash-close').onclick = closeFlash;
+
+    // Insert below header
+    ui.flashContainer.insertBefore(div, ui.flashContainer.children[1]);
+    flashBanner = div;
+
+    // Colour ramp, countdown and fade-out are a CSS animation (.ramping); remove the banner when it ends
+    div.classList.add('ramping');
+    div.addEventListener('animationend', (e) => {
+        if (e.animationName !== 'flash-ramp') return;
+        div.remove();
+        if (flashBanner === div) flashBanner = null;
+    });
+}
+
+function closeFlash() {
+    let flashMsg = flashBanner;
+    if (flashMsg) {
+        flashBanner = null;
+        flashMsg.style.opacity = '0';
+        setTimeout(() => flashMsg.remove(), 300);
+    }
+}
+
+function updateModeEmoji() {
+    fetch('/build').then(r=>r.json()).then(d=>{
+        if (ui.modeEmoji) ui.modeEmoji.textContent = d.mode_emoji;
+    });
+}
+updateModeEmoji();
+
+
+function initMouseGlare() {
+    const container = document.getElementById('mouse-glare-test'); 
+
+    if (container) {
+        const overlay = container.querySelector('.mouse-glare-overlay');
+
+        // The gradient itself lives in CSS; moves only update its centre (--gx/--gy),
+        // at most once per animation frame
+        let gx = 0, gy = 0, glareScheduled = false;
+        container.addEventListener('mousemove', (e) => {
+            const rect = container.getBoundingClientRect();
+            // Calculate mouse position relative to the container (0, 0 is top-left)
+            gx = e.clientX - rect.left;
+            gy = e.clientY - rect.top;
+            if (glareScheduled) return;
+            glareScheduled = true;
+            requestAnimationFrame(() => {
+                glareScheduled = false;
+                overlay.style.setProperty('--gx', gx + 'px');
+                overlay.style.setProperty('--gy', gy + 'px');
+            });
+        }, { passive: true });
+
+        // When the mouse leaves the container, the CSS ':hover' transition handles the fade-out.
+    }
+}
+
+// --- Page init: everything that runs once the document is ready, registered exactly once ---
+function init() {
+    if (window.__dashboardInited) return;
+    window.__dashboardInited = true;
+
+    initChart();
+    refreshLogs();
+    initVersionCheck();
+    initMouseGlare();
+
+    // Live logs toggle: re-enabling catches up on whatever was skipped while paused
+    ui.liveLogs.addEventListener('change', () => {
+        if (ui.liveLogs.checked) refreshLogs();
+    });
+}
+document.addEventListener('DOMContentLoaded', init);
@@ -67,6 +67,11 @@
 #
 #   - One shot test notification using shortened args:
 #       python3 presto_hatc_monitor.py -ntfy -nt PIZERO_HATC_TEST -t
+#
+#   - Recommended: run the I2C bus at 400 kHz (the INA219 supports it; the Pi defaults
+#     to 100 kHz) by adding this line to /boot/firmware/config.txt (or /boot/config.txt)
+#     and rebooting - the script warns at startup while the bus is slower:
+#       dtparam=i2c_arm_baudrate=400000
 # -----------------------------------------------
 
 # Standard library imports
@@ -77,17 +82,27 @@ import time
 import socket
 import subprocess
 import threading
+import signal
 import shutil
+import bisect
 from datetime import datetime, timedelta
 from queue import Queue
 
 # Third-party imports, may not be available on all systems
+# smbus2 can send the register pointer and read the value in one combined I2C transaction
+# (i2c_msg + I2C_RDWR); the older python3-smbus is still accepted as a fallback
 try:
-    import smbus
+    import smbus2 as smbus
+    from smbus2 import i2c_msg
     bus = smbus.SMBus(1)
 except ImportError:
-    smbus = None
-    bus = None
+    i2c_msg = None
+    try:
+        import smbus
+        bus = smbus.SMBus(1)
+    except ImportError:
+        smbus = None
+        bus = None
 
 try:
     import requests
@@ -112,6 +127,14 @@ _REG_CURRENT                = 0x04
 _REG_CALIBRATION            = 0x05
 R_SHUNT                     = 0.1  # Ohms (shunt resistor value on the INA219 board)
 
+# Battery voltage -> percentage table for get_percent (ascending voltages; one more percent than voltages)
+_PERCENT_VOLTAGES = (3.30, 3.33, 3.36, 3.39, 3.42, 3.45, 3.52, 3.60, 3.68, 3.75, 3.82, 3.90, 3.98, 4.05, 4.10, 4.15, 4.18)
+_PERCENTS = (0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 10.0, 20.0, 30.0, 40.0, 50.0, 60.0, 70.0, 80.0, 90.0, 95.0, 99.0, 100.0)
+
+# I2C bus clock (device tree value, a 32-bit big-endian integer in Hz)
+I2C_CLOCK_PATH = "/sys/class/i2c-adapter/i2c-1/of_node/clock-frequency"
+I2C_TARGET_BAUDRATE = 400000
+
 # Configuration thresholds (can be changed via command-line arguments)
 POWER_THRESHOLD = 0.5
 PERCENT_THRESHOLD = 10
@@ -123,6 +146,8 @@ CURRENT_THRESHOLD_DISCHARGING = -100
 NTFY_COOLDOWN_SECONDS = 120
 BATTERY_CAPACITY_MAH = 1000
 STATE_CHANGE_DEBOUNCE_SECONDS = 5
+SAMPLE_INTERVAL_SECONDS = 5
+LOG_EVERY_N_SAMPLES = 2  # Status block logged every 10 seconds
 
 def log_message(level, message, exit_on_error=True):
     """logs messages to systemd-journald using systemd-cat.
@@ -159,7 +184,9 @@ def check_dependencies():
         log_message("ERROR", "python3-requests is not installed. Please install it with 'sudo apt install python3-requests'")
 
     if smbus is None:
-        log_message("ERROR", "python3-smbus is not installed. Please install it with 'sudo apt install python3-smbus'")
+        log_message("ERROR", "python3-smbus2 is not installed. Please install it with 'sudo apt install python3-smbus2'")
+    elif i2c_msg is None:
+        log_message("WARNING", "Using legacy python3-smbus; install python3-smbus2 for combined I2C register reads")
 
     try:
         bus.read_byte(I2C_ADDRESS)
@@ -167,12 +194,30 @@ def check_dependencies():
     except Exception as e:
         log_message("ERROR", f"Failed to communicate with I2C bus at address {hex(I2C_ADDRESS)}. Check your hardware connections and make sure I2C is enabled with 'sudo raspi-config'. Error: {e}")
 
+    check_i2c_bus_speed()
+
     try:
         subprocess.run(["vcgencmd", "version"], check=True, capture_output=True)
         log_message("INFO", "libraspberrypi-bin is installed")
     except FileNotFoundError:
         log_message("ERROR", "libraspberrypi-bin is not installed. Please install it with 'sudo apt install libraspberrypi-bin'")
 
+def check_i2c_bus_speed():
+    """warns if the I2C bus clock is below 400 kHz (each register read then takes longer)."""
+    try:
+        with open(I2C_CLOCK_PATH, "rb") as f:
+            clock_hz = int.from_bytes(f.read(4), "big")
+    except (OSError, ValueError):
+        log_message("INFO", "I2C bus speed unknown (no device tree clock-frequency entry)")
+        return
+
+    if clock_hz < I2C_TARGET_BAUDRATE:
+        log_message("WARNING", f"I2C bus runs at {clock_hz // 1000} kHz. For faster INA219 reads add "
+                               f"'dtparam=i2c_arm_baudrate={I2C_TARGET_BAUDRATE}' to /boot/firmware/config.txt "
+                               "(or /boot/config.txt) and reboot.")
+    else:
+        log_message("INFO", f"I2C bus speed: {clock_hz // 1000} kHz")
+
 # ----------------------------------------------
 # NEW INSTALLATION AND UNINSTALLATION FUNCTIONS
 # ----------------------------------------------
@@ -267,6 +312,34 @@ def uninstall_service():
     
     print("Service uninstalled successfully.")
 
+class _Debouncer:
+    """
+    Trailing-edge debouncer: on_fire(state, since, *args) runs once a pending state has been
+    reported by every arm() call for at least `wait` seconds; `since` is the time of the first
+    of those calls, i.e. when the change actually began. Arming a different state
+    (or None) restarts the window, so a flickering reading never fires. Each fire also
+    restarts the window, which keeps consecutive transitions at least `wait` apart.
+    """
+    # Slack on the wait window: with `wait` equal to the sample interval, a sample landing a
+    # few ms early must still count, or the transition would only fire one sample later
+    TOLERANCE_SECONDS = 0.5
+
+    def __init__(self, wait, on_fire):
+        self.wait = wait
+        self.on_fire = on_fire
+        self._pending = None
+        self._pending_since = None
+
+    def arm(self, state, now, *args):
+        """Reports the state wanted at monotonic time `now` (None: no change pending)."""
+        if state != self._pending:
+            self._pending = state
+            self._pending_since = now
+            return
+        if state is not None and now - self._pending_since >= self.wait - self.TOLERANCE_SECONDS:
+            self._pending = None
+            self.on_fire(state, self._pending_since, *args)
+
 class Monitor:
     """
     Class to manage all monitoring functions.
@@ -282,15 +355,23 @@ class Monitor:
         self.battery_capacity_mah = battery_capacity_mah
         self.ntfy_cooldown_seconds = ntfy_cooldown_seconds
 
+        # All *_time attributes are time.monotonic() values: interval math only, immune to
+        # NTP/RTC clock steps (wall-clock times come from datetime.now() where shown)
         self.is_unplugged = False
-        self.last_power_state_change_time = time.time()
         self.low_power_notified = False
         self.low_percent_notified = False
         self.critical_low_timer_started = False
         self.critical_shutdown_timer_start_time = None
-        self.last_ntfy_notification_time = 0
+        self.last_ntfy_notification_time = float("-inf")  # No cooldown before the first notification
         self.unplugged_start_time = None
 
+        # Plugged/unplugged transitions only fire once the new reading has held for the debounce window
+        self.power_state_handlers = {
+            "reconnected": self.on_power_reconnected,
+            "unplugged": self.on_power_unplugged,
+        }
+        self.power_state_debouncer = _Debouncer(STATE_CHANGE_DEBOUNCE_SECONDS, self._on_power_state_change)
+
         self.ntfy_notification_queue = Queue()
         self.power_readings = []
         self.current_readings = []
@@ -299,10 +380,22 @@ class Monitor:
 
     def read(self, address):
         """Helper function to read from I2C bus ."""
-        data = bus.read_i2c_block_data(I2C_ADDRESS, address, 2)
+        if i2c_msg is not None:
+            # Pointer write and 2-byte read as one transaction (repeated START)
+            write = i2c_msg.write(I2C_ADDRESS, [address])
+            read = i2c_msg.read(I2C_ADDRESS, 2)
+            bus.i2c_rdwr(write, read)
+            data = list(read)
+        else:
+            data = bus.read_i2c_block_data(I2C_ADDRESS, address, 2)
         value = (data[0] * 256) + data[1]
         return value
 
+    @staticmethod
+    def _signed(value):
+        """Converts a 16-bit register value to a signed integer (two's complement)."""
+        return value - 65536 if value > 32767 else value
+
     def write(self, address, data):
         """Helper function to write to I2C bus ."""
         temp = [0, 0]
@@ -321,49 +414,35 @@ class Monitor:
 
     def getBusVoltage_V(self):
         """Returns the bus voltage in Volts ."""
-        self.write(_REG_CALIBRATION, self._cal_value)
-        self.read(_REG_BUSVOLTAGE)
         return (self.read(_REG_BUSVOLTAGE) >> 3) * 0.004
 
     def getCurrent_mA(self):
         """Returns the current in milliamps ."""
-        value = self.read(_REG_CURRENT)
-        if value > 32767:
-            value -= 65535
-        return value * self._current_lsb
+        return self._signed(self.read(_REG_CURRENT)) * self._current_lsb
 
     def getPower_W(self):
         """Returns the power in Watts ."""
-        self.write(_REG_CALIBRATION, self._cal_value)
-        value = self.read(_REG_POWER)
-        if value > 32767:
-            value -= 65535
-        return value * self._power_lsb
+        return self._signed(self.read(_REG_POWER)) * self._power_lsb
+
+    def sample_all(self):
+        """
+        Returns (bus voltage V, current mA, power W) for one sample cycle.
+        One 2-byte read per register and no calibration rewrite: the INA219 does not
+        auto-increment its register pointer, so a single multi-register block read
+        would just repeat the first register.
+        """
+        bus_voltage = (self.read(_REG_BUSVOLTAGE) >> 3) * 0.004
+        current_mA = self._signed(self.read(_REG_CURRENT)) * self._current_lsb
+        power = self._signed(self.read(_REG_POWER)) * self._power_lsb
+        return bus_voltage, current_mA, power
 
     def get_percent(self, voltage):
         """
         Calculates battery percentage based on voltage.
         Note: This is an estimation and may not be perfectly accurate.
         """
-        if voltage > 4.18: return 100.0
-        elif voltage > 4.15: return 99.0
-        elif voltage > 4.10: return 95.0
-        elif voltage > 4.05: return 90.0
-        elif voltage > 3.98: return 80.0
-        elif voltage > 3.90: return 70.0
-        elif voltage > 3.82: return 60.0
-        elif voltage > 3.75: return 50.0
-        elif voltage > 3.68: return 40.0
-        elif voltage > 3.60: return 30.0
-        elif voltage > 3.52: return 20.0
-        elif voltage > 3.45: return 10.0
-        else:
-            if voltage > 3.42: return 5.0
-            elif voltage > 3.39: return 4.0
-            elif voltage > 3.36: return 3.0
-            elif voltage > 3.33: return 2.0
-            elif voltage > 3.30: return 1.0
-            else: return 0.0
+        # A voltage strictly above _PERCENT_VOLTAGES[i - 1] (and not above [i]) maps to _PERCENTS[i]
+        return _PERCENTS[bisect.bisect_left(_PERCENT_VOLTAGES, voltage)]
     
     def get_hostname(self):
         """Returns the device hostname."""
@@ -424,7 +503,7 @@ class Monitor:
         """Returns formatted string of time on battery, or None if plugged in."""
         if self.unplugged_start_time is None:
             return None
-        duration_seconds = time.time() - self.unplugged_start_time
+        duration_seconds = time.monotonic() - self.unplugged_start_time
         duration_timedelta = timedelta(seconds=duration_seconds)
         days = duration_timedelta.days
         hours, remainder = divmod(duration_timedelta.seconds, 3600)
@@ -453,7 +532,7 @@ class Monitor:
             log_message("INFO", f"ntfy notification ({event_type}) skipped: ntfy disabled")
             return
 
-        current_time = time.time()
+        current_time = time.monotonic()
         is_cooldown_event = event_type in ["low_power", "low_percent"]
         if is_cooldown_event and (current_time - self.last_ntfy_notification_time) < self.ntfy_cooldown_seconds:
             log_message("INFO", f"ntfy notification ({event_type}) skipped: on cooldown", exit_on_error=False)
@@ -529,17 +608,40 @@ class Monitor:
             log_message("WARNING", f"Failed to send notification: Unexpected error - {e}", exit_on_error=False)
 
 
+    def _on_power_state_change(self, state, since, power, percent, current_mA):
+        """Dispatches a debounced power state change to its handler."""
+        self.power_state_handlers[state](power, percent, current_mA, since)
+
+    def on_power_reconnected(self, power, percent, current_mA, since):
+        """Handles external power coming back."""
+        log_message("INFO", "Power reconnected!")
+        self.send_ntfy_notification("reconnected", power, percent, current_mA)
+        self.is_unplugged = False
+        self.unplugged_start_time = None
+        self.low_power_notified = False
+        self.low_percent_notified = False
+        self.critical_low_timer_started = False
+
+    def on_power_unplugged(self, power, percent, current_mA, since):
+        """Handles the switch to battery power."""
+        log_message("WARNING", "Power unplugged!")
+        self.send_ntfy_notification("unplugged", power, percent, current_mA)
+        self.is_unplugged = True
+        self.unplugged_start_time = since  # First discharging sample, not the debounced fire
+        self.low_power_notified = False
+        self.low_percent_notified = False
+
     def handle_critical_low(self, percent):
         """
         Handles the critical low battery event, initiating a shutdown.
         """
         if not self.critical_low_timer_started:
             self.critical_low_timer_started = True
-            self.critical_shutdown_timer_start_time = time.time()
+            self.critical_shutdown_timer_start_time = time.monotonic()
             self.send_ntfy_notification("critical_low", 0, percent, 0)
             log_message("CRITICAL", f"Battery at critical level: {percent:.1f}%. Initiating shutdown in {self.critical_shutdown_delay} seconds.")
             
-        time_elapsed = time.time() - self.critical_shutdown_timer_start_time
+        time_elapsed = time.monotonic() - self.critical_shutdown_timer_start_time
         
         if time_elapsed >= self.critical_shutdown_delay:
             self.send_ntfy_notification("shutdown", 0, percent, 0)
@@ -575,17 +677,37 @@ def main():
         log_message("WARNING", f"Script started (v{VERSION}): Device is currently running on battery.")
         # Manually set the state variables since we missed the 'unplugged' event
         monitor.is_unplugged = True
-        monitor.unplugged_start_time = time.time()
+        monitor.unplugged_start_time = time.monotonic()
 
     # --- END OF INITIAL STATUS CHECK ---
-    
+
+    # systemctl stop ends the loop like Ctrl+C does: by raising KeyboardInterrupt in the main
+    # thread, which also breaks out of the sleep between samples
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+
+    try:
+        run_monitor_loop(monitor)
+    except KeyboardInterrupt:
+        pass
+
+    log_message("INFO", "Monitor stopped.")
+
+def _raise_keyboard_interrupt(signum, frame):
+    """Signal handler: stop the monitor loop the same way Ctrl+C does."""
+    raise KeyboardInterrupt
+
+def run_monitor_loop(monitor):
+    """
+    Samples the UPS every SAMPLE_INTERVAL_SECONDS; runs until interrupted (KeyboardInterrupt
+    from Ctrl+C or the SIGTERM handler) or a critical-low shutdown exits the process.
+    """
     log_counter = 0
+    next_sample_time = time.monotonic()
 
     while True:
         try:
-            power_status = monitor.getPower_W()
-            bus_voltage = monitor.getBusVoltage_V()
-            current_mA = monitor.getCurrent_mA()
+            bus_voltage, current_mA, power_status = monitor.sample_all()
             percent = monitor.get_percent(bus_voltage)
 
             # --- CORRECTED STATE-CHANGE LOGIC WITH HYSTERESIS ---
@@ -593,26 +715,17 @@ def main():
             # A positive current means it's charging, negative means discharging.
             is_charging = current_mA > CURRENT_THRESHOLD_CHARGING
             is_discharging = current_mA < CURRENT_THRESHOLD_DISCHARGING
-            current_time = time.time()
+            current_time = time.monotonic()
             
-            # Debounce logic for state changes
-            if is_charging and monitor.is_unplugged and (current_time - monitor.last_power_state_change_time) > STATE_CHANGE_DEBOUNCE_SECONDS:
-                log_message("INFO", "Power reconnected!")
-                monitor.send_ntfy_notification("reconnected", power_status, percent, current_mA)
-                monitor.is_unplugged = False
-                monitor.last_power_state_change_time = current_time
-                monitor.unplugged_start_time = None
-                monitor.low_power_notified = False
-                monitor.low_percent_notified = False
-                monitor.critical_low_timer_started = False
-            elif is_discharging and not monitor.is_unplugged and (current_time - monitor.last_power_state_change_time) > STATE_CHANGE_DEBOUNCE_SECONDS:
-                log_message("WARNING", "Power unplugged!")
-                monitor.send_ntfy_notification("unplugged", power_status, percent, current_mA)
-                monitor.is_unplugged = True
-                monitor.last_power_state_change_time = current_time
-                monitor.unplugged_start_time = time.time()
-                monitor.low_power_notified = False
-                monitor.low_percent_notified = False
+            # Debounced state changes: the transition the reading asks for (if any) must hold
+            # for STATE_CHANGE_DEBOUNCE_SECONDS before its handler runs
+            if is_charging and monitor.is_unplugged:
+                pending_state = "reconnected"
+            elif is_discharging and not monitor.is_unplugged:
+                pending_state = "unplugged"
+            else:
+                pending_state = None
+            monitor.power_state_debouncer.arm(pending_state, current_time, power_status, percent, current_mA)
 
             # Low battery alert
             if monitor.is_unplugged and percent < monitor.percent_threshold and not monitor.low_percent_notified:
@@ -627,7 +740,7 @@ def main():
                 monitor.critical_shutdown_timer_start_time = None
                 
             # Log every 10 seconds
-            if log_counter % 2 == 0:
+            if log_counter % LOG_EVERY_N_SAMPLES == 0:
                 time_on_battery_str = monitor.get_time_on_battery()
                 time_remaining_str = monitor.get_estimated_time_remaining(percent, current_mA)
 
@@ -654,7 +767,10 @@ def main():
         except Exception as e:
             log_message("ERROR", f"An error occurred: {e}", exit_on_error=True)
 
-        time.sleep(5)
+        # Fixed-rate schedule: the time spent sampling and logging doesn't add drift
+        # (after an overrun the next sample simply runs at once rather than in a catch-up burst)
+        next_sample_time = max(next_sample_time + SAMPLE_INTERVAL_SECONDS, time.monotonic())
+        time.sleep(max(0.0, next_sample_time - time.monotonic()))
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description=f'Presto HAT C UPS Monitor v{VERSION}',